@@ -0,0 +1,50 @@
+import argparse
+import sys
+
+from benchmarks import bench_binder  # noqa: F401
+from benchmarks import bench_memory  # noqa: F401
+from benchmarks import bench_patch  # noqa: F401
+from benchmarks import bench_requests
+from benchmarks import runner
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="fastapi-depends-ext benchmarks")
+    parser.add_argument("-o", "--output", help="write JSON report to file instead of stdout")
+    parser.add_argument("-k", "--filter", default="", help="run only benchmarks which names contain substring")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimal seconds per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per benchmark")
+    parser.add_argument("--objects", type=int, default=1000, help="objects per memory benchmark")
+    parser.add_argument("--quick", action="store_true", help="short run to check that benchmarks work")
+    args = parser.parse_args()
+
+    min_time, repeat = (0.01, 1) if args.quick else (args.min_time, args.repeat)
+    objects = 10 if args.quick else args.objects
+
+    results, skipped = [], {}
+    for bench in runner.registry:
+        if args.filter not in bench.name:
+            continue
+        elif bench.name == "requests" and bench_requests.SKIP_REASON:
+            skipped[bench.name] = bench_requests.SKIP_REASON
+            continue
+
+        print(f"{bench.name} {bench.params}", file=sys.stderr)
+        results.append(runner.run(bench, min_time, repeat))
+
+    memory_results = []
+    for bench in runner.memory_registry:
+        if args.filter in bench.name:
+            print(f"{bench.name} {bench.params}", file=sys.stderr)
+            memory_results.append(runner.run_memory(bench, objects))
+
+    report = runner.report(results, skipped, memory_results)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
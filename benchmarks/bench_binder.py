@@ -0,0 +1,69 @@
+from typing import Dict
+from typing import Type
+
+from fastapi import Query
+
+from benchmarks.runner import benchmark
+from fastapi_depends_ext import DependsAttr
+from fastapi_depends_ext import DependsAttrBinder
+
+
+WIDTHS = (1, 10, 50)
+DEPTHS = (1, 5, 15)
+
+
+def _method(target: str, from_super: bool = False):
+    def method(self, value: int = DependsAttr(target, from_super=from_super)):
+        return value
+
+    return method
+
+
+def make_binder(width: int, depth: int, lazy: bool = False, weak: bool = False) -> Type[DependsAttrBinder]:
+    def get_page(self, page: int = Query(1)):
+        return page
+
+    namespace: Dict[str, object] = {"get_page": get_page}
+    namespace.update({f"method_{index}": _method("get_page") for index in range(width)})
+    cls = type("Binder_0", (DependsAttrBinder,), namespace, lazy=lazy, weak=weak)
+
+    for level in range(1, depth):
+        namespace = {f"method_{index}": _method(f"method_{index}", from_super=True) for index in range(width)}
+        cls = type(f"Binder_{level}", (cls,), namespace)
+
+    return cls
+
+
+for _width in WIDTHS:
+    for _depth in DEPTHS:
+
+        @benchmark("binder.init", width=_width, depth=_depth)
+        def binder_init(width: int, depth: int):
+            return make_binder(width, depth)  # measured call is instance creation
+
+        @benchmark("binder.init.lazy", width=_width, depth=_depth)
+        def binder_init_lazy(width: int, depth: int):
+            return make_binder(width, depth, lazy=True)
+
+
+@benchmark("binder.init.first_instance", width=10, depth=5, classes=200)
+def binder_init_first_instance(width: int, depth: int, classes: int):
+    pool = [make_binder(width, depth) for _ in range(classes)]
+
+    def first_instance():
+        if not pool:
+            pool.extend(make_binder(width, depth) for _ in range(classes))
+        pool.pop()()
+
+    return first_instance
+
+
+@benchmark("binder.bind", width=10, depth=5)
+def binder_bind(width: int, depth: int):
+    cls = make_binder(width, depth, lazy=True)
+
+    def bind():
+        instance = cls()
+        return instance.method_0
+
+    return bind
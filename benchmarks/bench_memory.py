@@ -0,0 +1,19 @@
+from benchmarks.bench_binder import make_binder
+from benchmarks.runner import memory
+from fastapi_depends_ext import DependsAttr
+
+
+@memory("memory.binder.instance", width=10, depth=1)
+@memory("memory.binder.instance", width=10, depth=5)
+def binder_instance(width: int, depth: int):
+    return make_binder(width, depth)  # bytes per bound instance
+
+
+@memory("memory.binder.instance.weak", width=10, depth=5)
+def binder_instance_weak(width: int, depth: int):
+    return make_binder(width, depth, weak=True)
+
+
+@memory("memory.depends_attr")
+def depends_attr():
+    return lambda: DependsAttr("method", from_super=True)
@@ -0,0 +1,54 @@
+from fastapi import Depends
+from fastapi import Query
+
+from benchmarks.runner import benchmark
+from fastapi_depends_ext import DependsExt
+from fastapi_depends_ext.utils import patch_defaults
+
+
+def endpoint(a: int, b: int = Query(1), *args, c: int = Query(2), d: int = Depends(), **kwargs):
+    return a, b, c, d
+
+
+class Endpoints:
+    def method(self, a: int, b: int = Query(1), *, c: int = Query(2)):
+        return a, b, c
+
+
+@benchmark("patch_defaults.function", kwargs=0)
+def patch_function_clone(kwargs: int):
+    return lambda: patch_defaults(endpoint)
+
+
+@benchmark("patch_defaults.function", kwargs=2)
+def patch_function(kwargs: int):
+    b, c = Query(3), Query(4)
+    return lambda: patch_defaults(endpoint, b=b, c=c)
+
+
+@benchmark("patch_defaults.method", kwargs=2)
+def patch_method(kwargs: int):
+    method = Endpoints().method
+    a, c = Query(3), Query(4)
+    return lambda: patch_defaults(method, a=a, c=c)
+
+
+@benchmark("depends_ext.bind", rebinds=1)
+def depends_ext_bind(rebinds: int):
+    depends = DependsExt(endpoint)
+    b = Query(3)
+    return lambda: depends.bind(b=b)
+
+
+@benchmark("depends_ext.bind", rebinds=10)
+def depends_ext_rebind(rebinds: int):
+    depends = DependsExt(endpoint)
+    values = [Query(index) for index in range(rebinds)]
+
+    def rebind():
+        _depends = depends
+        for value in values:
+            _depends = _depends.bind(b=value)
+        return _depends
+
+    return rebind
@@ -0,0 +1,75 @@
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi import Query
+
+from benchmarks.runner import benchmark
+from fastapi_depends_ext import DependsAttr
+from fastapi_depends_ext import DependsAttrBinder
+
+
+try:
+    from fastapi.testclient import TestClient
+except (ImportError, RuntimeError):  # starlette test client requires optional http client
+    TestClient = None
+
+SKIP_REASON = None if TestClient else "fastapi.testclient is unavailable, install `httpx`"
+
+
+async def get_page(page: int = Query(1)):
+    return page
+
+
+async def get_items(page: int = Depends(get_page)):
+    return list(range(page * 10, (page + 1) * 10))
+
+
+class Items(DependsAttrBinder):
+    async def get_page(self, page: int = Query(1)):
+        return page
+
+    async def items(self, page: int = DependsAttr("get_page")):
+        return list(range(page * 10, (page + 1) * 10))
+
+
+class ItemsSync(DependsAttrBinder):
+    def get_page(self, page: int = Query(1)):
+        return page
+
+    def items(self, page: int = DependsAttr("get_page")):
+        return list(range(page * 10, (page + 1) * 10))
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/depends")
+    async def depends(items=Depends(get_items)):
+        return items
+
+    @app.get("/depends-attr")
+    async def depends_attr(items=Depends(Items().items)):
+        return items
+
+    @app.get("/depends-attr-sync")
+    async def depends_attr_sync(items=Depends(ItemsSync().items)):
+        return items
+
+    return app
+
+
+def _request(route: str):
+    client = TestClient(make_app())
+    url = f"{route}?page=2"
+
+    def request():
+        response = client.get(url)
+        assert response.status_code == 200, response.text
+
+    return request
+
+
+for _route in ("/depends", "/depends-attr", "/depends-attr-sync"):
+
+    @benchmark("requests", route=_route)
+    def requests(route: str):
+        return _request(route)
@@ -0,0 +1,150 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from importlib import metadata
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+
+class Benchmark(NamedTuple):
+    name: str
+    params: Dict[str, Any]
+    setup: Callable[[], Callable[[], Any]]  # returns function to measure
+
+
+class Result(NamedTuple):
+    name: str
+    params: Dict[str, Any]
+    iterations: int
+    repeat: int
+    best: float  # seconds per call
+    median: float  # seconds per call
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "iterations": self.iterations,
+            "repeat": self.repeat,
+            "best_us": round(self.best * 1e6, 3),
+            "median_us": round(self.median * 1e6, 3),
+            "ops_per_sec": round(1 / self.best, 1) if self.best else None,
+        }
+
+
+class MemoryResult(NamedTuple):
+    name: str
+    params: Dict[str, Any]
+    objects: int
+    size: float  # bytes allocated per object
+    blocks: float  # memory blocks allocated per object
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "objects": self.objects,
+            "bytes_per_object": round(self.size, 1),
+            "blocks_per_object": round(self.blocks, 1),
+        }
+
+
+registry: List[Benchmark] = list()
+memory_registry: List[Benchmark] = list()
+
+
+def benchmark(name: str, **params) -> Callable:
+    def decorator(setup: Callable[..., Callable[[], Any]]):
+        registry.append(Benchmark(name, params, lambda: setup(**params)))
+        return setup
+
+    return decorator
+
+
+def memory(name: str, **params) -> Callable:
+    # setup returns function creating one object, memory allocated by objects alive at the end is measured
+    def decorator(setup: Callable[..., Callable[[], Any]]):
+        memory_registry.append(Benchmark(name, params, lambda: setup(**params)))
+        return setup
+
+    return decorator
+
+
+def _measure(func: Callable[[], Any], iterations: int) -> float:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def run(bench: Benchmark, min_time: float, repeat: int) -> Result:
+    func = bench.setup()
+    func()  # warm up
+
+    iterations = 1
+    while True:
+        elapsed = _measure(func, iterations)
+        if elapsed >= min_time or iterations >= 1_000_000:
+            break
+        iterations *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [_measure(func, iterations) / iterations for _ in range(repeat)]
+    return Result(bench.name, bench.params, iterations, repeat, min(timings), statistics.median(timings))
+
+
+def run_memory(bench: Benchmark, objects: int) -> MemoryResult:
+    func = bench.setup()
+    func()  # warm up caches shared by objects
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        alive = [func() for _ in range(objects)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats) - sys.getsizeof(alive)
+    blocks = sum(stat.count_diff for stat in stats) - 1
+    return MemoryResult(bench.name, bench.params, objects, size / objects, blocks / objects)
+
+
+def _version(package: str) -> Optional[str]:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def report(results: List[Result], skipped: Dict[str, str], memory_results: List[MemoryResult] = ()) -> str:
+    data = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "fastapi-depends-ext": _version("fastapi-depends-ext"),
+            "fastapi": _version("fastapi"),
+            "pydantic": _version("pydantic"),
+        },
+        "results": [result.as_dict() for result in results],
+        "memory": [result.as_dict() for result in memory_results],
+        "skipped": skipped,
+    }
+    return json.dumps(data, indent=2)
@@ -1,3 +1,10 @@
+from .batch import BatchLoader
+from .batch import batched
+from .cache import ResultCache
+from .compiler import compile_dependency
 from .depends import DependsExt
 from .depends import DependsAttr
 from .depends import DependsAttrBinder
+from .executors import executors
+from .inline import cheap
+from .scope import app_scope
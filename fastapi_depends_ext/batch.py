@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Final
+from typing import Hashable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Union
+
+from fastapi_depends_ext.depends import SUPPORTED_DEPENDS
+from fastapi_depends_ext.utils import await_shared
+from fastapi_depends_ext.utils import weak_method
+
+
+BATCH_LOADERS_ATTR: Final = "__depends_attr_batch_loaders__"
+
+BatchLoad = Callable[[List[Hashable]], Awaitable[Union[Sequence[Any], Mapping[Hashable, Any]]]]
+
+
+class BatchInfo(NamedTuple):
+    batches: int
+    keys: int  # keys loaded by all batches
+    pending: int  # keys waiting for next batch
+
+
+# collects keys requested by concurrent requests and loads them by one call of `load_many`
+class BatchLoader:
+    def __init__(self, load_many: BatchLoad, *, window: float = 0.0, max_batch_size: Optional[int] = None):
+        self.load_many = load_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.keys = 0
+        self._pending: Dict[Hashable, asyncio.Future] = dict()
+        self._handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Future] = set()  # loop keeps weak references to tasks only
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.load_many}, window={self.window}, max_batch_size={self.max_batch_size})"
+
+    async def load(self, key: Hashable) -> Any:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if self.max_batch_size and len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                # without window batch is loaded on next loop iteration, after all ready requests requested keys
+                if self.window > 0:
+                    self._handle = loop.call_later(self.window, self._dispatch)
+                else:
+                    self._handle = loop.call_soon(self._dispatch)
+
+        return await await_shared(future)
+
+    def info(self) -> BatchInfo:
+        return BatchInfo(self.batches, self.keys, len(self._pending))
+
+    def _dispatch(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        pending, self._pending = self._pending, dict()
+        if pending:
+            self.batches += 1
+            self.keys += len(pending)
+            task = asyncio.ensure_future(self._load(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, pending: Dict[Hashable, asyncio.Future]):
+        keys = list(pending)
+        try:
+            results = await self.load_many(keys)
+            if not isinstance(results, Mapping):
+                if len(results) != len(keys):
+                    raise ValueError(f"`{self.load_many}` returned {len(results)} results for {len(keys)} keys")
+                results = dict(zip(keys, results))
+            for key, future in pending.items():
+                if future.done():
+                    continue
+                elif key in results:
+                    future.set_result(results[key])
+                else:
+                    future.set_exception(KeyError(f"`{self.load_many}` has not returned result for key {key!r}"))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # cancelled load (on shutdown, etc.) must not leave requests waiting forever
+            for future in pending.values():
+                if not future.done():
+                    future.cancel()
+
+
+def batched(key: SUPPORTED_DEPENDS, *, annotation: Any = Any, window: float = 0.0, max_batch_size: int = None):
+    # makes dependency loading one value by `key` from method loading many values by list of keys:
+    #
+    #   @batched(DependsAttr("user_id"))
+    #   async def user(self, user_ids: List[int]) -> List[User]: ...
+    #
+    # loader is created per instance, so batches are never mixed between instances
+    def decorator(load_many: Callable) -> Callable:
+        async def load(self, key: annotation = key):
+            loaders: Dict[Callable, BatchLoader] = self.__dict__.setdefault(BATCH_LOADERS_ATTR, dict())
+            loader = loaders.get(load_many)
+            if loader is None:
+                # loader is stored in instance, so it references instance weakly
+                method = weak_method(load_many.__get__(self, type(self)))
+                loader = loaders[load_many] = BatchLoader(method, window=window, max_batch_size=max_batch_size)
+            return await loader.load(key)
+
+        load.__module__ = load_many.__module__
+        load.__name__ = load_many.__name__
+        load.__qualname__ = load_many.__qualname__
+        load.__doc__ = load_many.__doc__
+        load.load_many = load_many
+        return load
+
+    return decorator
@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+
+from fastapi_depends_ext.hooks import set_cache_hit
+from fastapi_depends_ext.utils import CacheInfo
+from fastapi_depends_ext.utils import make_call_key
+from fastapi_depends_ext.utils import wrap_call
+
+
+_MISSING = object()
+
+
+# LRU cache of dependency results shared between requests, entry expires `ttl` seconds after it was stored
+class ResultCache:
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = 60.0, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        # no `await` is done under lock, so it is held only by threads of sync dependencies for a moment
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(maxsize={self.maxsize}, ttl={self.ttl})"
+
+    def get(self, key: Optional[Hashable]) -> Any:
+        # returns `_MISSING` for not cached key
+        if key is None:
+            self.misses += 1
+            return _MISSING
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > self.timer()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            elif entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return _MISSING
+
+    def set(self, key: Optional[Hashable], value: Any):
+        if key is None:
+            return
+
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def wrap(self, dependency: Callable) -> Callable:
+        if is_gen_callable(dependency) or is_async_gen_callable(dependency):
+            raise TypeError(f"Result of dependency with `yield` can't be cached: `{dependency}`")
+
+        if is_coroutine_callable(dependency):
+
+            async def cached(**kwargs):
+                key = make_call_key(dependency, kwargs)
+                value = self.get(key)
+                set_cache_hit(value is not _MISSING)
+                if value is _MISSING:
+                    value = await dependency(**kwargs)
+                    self.set(key, value)
+                return value
+
+        else:
+
+            def cached(**kwargs):
+                key = make_call_key(dependency, kwargs)
+                value = self.get(key)
+                set_cache_hit(value is not _MISSING)
+                if value is _MISSING:
+                    value = dependency(**kwargs)
+                    self.set(key, value)
+                return value
+
+        return wrap_call(cached, dependency)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
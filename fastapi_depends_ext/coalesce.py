@@ -0,0 +1,66 @@
+import asyncio
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import NamedTuple
+
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_depends_ext.utils import await_shared
+from fastapi_depends_ext.utils import make_call_key
+from fastapi_depends_ext.utils import start_shared
+from fastapi_depends_ext.utils import wrap_call
+
+
+class FlightInfo(NamedTuple):
+    calls: int  # calls started dependency
+    shared: int  # calls joined already started call with the same arguments
+    in_flight: int
+
+
+# concurrent calls of dependency with the same arguments share one call, nothing is stored after it is done
+class SingleFlight:
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._flights: Dict[Hashable, asyncio.Future] = dict()
+
+    def wrap(self, dependency: Callable) -> Callable:
+        if is_gen_callable(dependency) or is_async_gen_callable(dependency):
+            raise TypeError(f"Calls of dependency with `yield` can't be coalesced: `{dependency}`")
+
+        call = dependency if is_coroutine_callable(dependency) else self._run_in_threadpool(dependency)
+
+        async def coalesced(**kwargs):
+            key = make_call_key(dependency, kwargs)
+            if key is None:
+                self.calls += 1
+                return await call(**kwargs)
+
+            if key in self._flights:
+                self.shared += 1
+            else:
+                self.calls += 1
+            return await await_shared(start_shared(self._flights, key, lambda: call(**kwargs)))
+
+        return wrap_call(coalesced, dependency)
+
+    def info(self) -> FlightInfo:
+        return FlightInfo(self.calls, self.shared, len(self._flights))
+
+    def clear(self):
+        self._flights.clear()
+        self.calls = self.shared = 0
+
+    @staticmethod
+    def _run_in_threadpool(dependency: Callable) -> Callable:
+        async def call(**kwargs):
+            return await run_in_threadpool(dependency, **kwargs)
+
+        return call
+
+
+single_flight = SingleFlight()
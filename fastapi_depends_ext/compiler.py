@@ -0,0 +1,165 @@
+from inspect import Parameter
+from inspect import Signature
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from fastapi import params
+from fastapi.dependencies.utils import get_dependant
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+from fastapi.exceptions import RequestValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+from fastapi_depends_ext.utils import get_signature
+from fastapi_depends_ext.utils import solve_request
+from fastapi_depends_ext.utils import wrap_call
+
+
+class Step(NamedTuple):
+    slot: int
+    call: Callable
+    is_coroutine: bool
+    arguments: Tuple[Tuple[str, int], ...]  # argument name and slot of its value
+
+
+def _get_dependency(parameter: Parameter) -> Callable:
+    return parameter.default.dependency or parameter.annotation
+
+
+def _is_internal(call: Callable) -> bool:
+    # internal node depends only on other dependencies, so it can be called without fastapi
+    if is_gen_callable(call) or is_async_gen_callable(call):
+        return False
+
+    for parameter in get_signature(call).parameters.values():
+        depends = parameter.default
+        if not isinstance(depends, params.Depends) or isinstance(depends, params.Security):
+            return False
+    return True
+
+
+async def _solve_override(request: Request, override: Callable) -> Any:
+    # override can have any arguments, so it is resolved by fastapi like usual dependency
+    async def endpoint(value: Any = params.Depends(override)):
+        pass
+
+    app = request.scope.get("app")
+    path = getattr(request.scope.get("route"), "path_format", "")
+    dependant = get_dependant(path=path, call=endpoint)
+    values, errors = await solve_request(request, dependant, dependency_overrides_provider=app)
+    if errors:
+        raise RequestValidationError(errors)
+    return values["value"]
+
+
+# collapses internal nodes of dependencies graph of `call` into one callable,
+# leaves requiring request data (parameters, `Request`, `Security`, dependencies with `yield`) are resolved by fastapi
+class DependencyCompiler:
+    def __init__(self, call: Callable):
+        # root is called by compiled callable, so teardown of dependency with `yield` could never run
+        if is_gen_callable(call) or is_async_gen_callable(call):
+            raise TypeError(f"Dependency with `yield` can't be compiled: `{call}`")
+
+        self.call = call
+        self.parameters: List[Parameter] = list()
+        self.leaves: List[Tuple[str, int]] = list()  # parameter of compiled callable and slot of its value
+        self.steps: List[Step] = list()
+        self.slots = 0
+        self._cached: Dict[Callable, int] = dict()
+        self._names = set(get_signature(call).parameters)
+        self.request = self._name("_request")
+
+        arguments = list()
+        for name, parameter in get_signature(call).parameters.items():
+            if isinstance(parameter.default, params.Depends) and not isinstance(parameter.default, params.Security):
+                arguments.append((name, self._add(_get_dependency(parameter), parameter.default.use_cache)))
+            else:
+                # request parameters of root are passed through as is
+                self.parameters.append(parameter.replace(kind=Parameter.KEYWORD_ONLY))
+                arguments.append((name, self._add_leaf(name)))
+        self.steps.append(Step(self._slot(), call, is_coroutine_callable(call), tuple(arguments)))
+
+    def compile(self) -> Callable:
+        leaves = tuple(self.leaves)
+        steps = tuple(self.steps)
+        slots = self.slots
+
+        request_name = self.request
+
+        async def compiled(**kwargs):
+            values = [None] * slots
+            for name, slot in leaves:
+                values[slot] = kwargs[name]
+
+            # collapsed nodes are invisible for fastapi, so `app.dependency_overrides` are applied here
+            request: Request = kwargs[request_name]
+            overrides = getattr(request.scope.get("app"), "dependency_overrides", None)
+
+            for slot, call, is_coroutine, arguments in steps:
+                call_kwargs = {argument: values[source] for argument, source in arguments}
+                if overrides and call in overrides:
+                    values[slot] = await _solve_override(request, overrides[call])
+                elif is_coroutine:
+                    values[slot] = await call(**call_kwargs)
+                else:
+                    values[slot] = await run_in_threadpool(call, **call_kwargs)
+            return values[-1]
+
+        compiled.__compiled__ = self
+        parameters = [*self.parameters, Parameter(request_name, Parameter.KEYWORD_ONLY, annotation=Request)]
+        return wrap_call(compiled, self.call, Signature(parameters))
+
+    def _add(self, call: Callable, use_cache: bool) -> int:
+        # the same dependency is called once like it does fastapi for `use_cache=True`
+        if use_cache and call in self._cached:
+            return self._cached[call]
+
+        if _is_internal(call):
+            arguments = tuple(
+                (name, self._add(_get_dependency(parameter), parameter.default.use_cache))
+                for name, parameter in get_signature(call).parameters.items()
+            )
+            slot = self._slot()
+            self.steps.append(Step(slot, call, is_coroutine_callable(call), arguments))
+        else:
+            name = self._leaf_name()
+            self.parameters.append(
+                Parameter(name, Parameter.KEYWORD_ONLY, default=params.Depends(call, use_cache=use_cache))
+            )
+            slot = self._add_leaf(name)
+
+        if use_cache:
+            self._cached[call] = slot
+        return slot
+
+    def _add_leaf(self, name: str) -> int:
+        slot = self._slot()
+        self.leaves.append((name, slot))
+        return slot
+
+    def _leaf_name(self) -> str:
+        index = len(self.leaves)
+        while f"_dependency_{index}" in self._names:
+            index += 1
+        return self._name(f"_dependency_{index}")
+
+    def _name(self, name: str) -> str:
+        # name of argument of compiled callable, must not conflict with request parameters of root
+        while name in self._names:
+            name = f"_{name}"
+        self._names.add(name)
+        return name
+
+    def _slot(self) -> int:
+        self.slots += 1
+        return self.slots - 1
+
+
+def compile_dependency(call: Callable) -> Callable:
+    return DependencyCompiler(call).compile()
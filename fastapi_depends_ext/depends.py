@@ -1,126 +1,633 @@
-import functools
 import inspect
+import threading
+from copy import copy
+from types import MethodType
 from typing import Any
 from typing import Callable
+from typing import ClassVar
+from typing import Dict
 from typing import Final
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Union
+from weakref import WeakKeyDictionary
 
 from fastapi import params
-from fastapi.dependencies.utils import get_typed_signature
+from fastapi.dependencies.utils import is_coroutine_callable
 from pydantic.fields import FieldInfo
 
+from fastapi_depends_ext.cache import ResultCache
+from fastapi_depends_ext.coalesce import single_flight
+from fastapi_depends_ext.executors import DependencyExecutor
+from fastapi_depends_ext.executors import executors
+from fastapi_depends_ext.gather import defer
+from fastapi_depends_ext.gather import gather
+from fastapi_depends_ext.hooks import CallInfo
+from fastapi_depends_ext.hooks import Instrument
+from fastapi_depends_ext.hooks import call_hooks
+from fastapi_depends_ext.inline import inline
+from fastapi_depends_ext.inline import is_cheap
+from fastapi_depends_ext.instrumentation import Measure
+from fastapi_depends_ext.instrumentation import listeners
+from fastapi_depends_ext.scope import SCOPE_APP
+from fastapi_depends_ext.scope import SCOPE_REQUEST
+from fastapi_depends_ext.scope import AppScoped
+from fastapi_depends_ext.scope import app_scope
+from fastapi_depends_ext.scope import check_scope
 from fastapi_depends_ext.utils import get_base_class
+from fastapi_depends_ext.utils import get_signature
 from fastapi_depends_ext.utils import patch_defaults
+from fastapi_depends_ext.utils import weak_method
 
 
 SUPPORTED_DEPENDS = Union[Callable[..., Any], FieldInfo, params.Depends]
 SPECIAL_METHODS_ERROR: Final = ("__call__",)
 SPECIAL_METHODS_IGNORE: Final = ("__init__", "__new__")
+BOUND_DEPENDENCIES_ATTR: Final = "__depends_attr_bound__"
+WRAPPED_DEPENDENCIES_ATTR: Final = "__depends_attr_wrapped__"
 
 
-class DependsAttrBinder:
-    def __init__(self, *args, **kwargs):
-        super(DependsAttrBinder, self).__init__(*args, **kwargs)
+def _get_owner(owner: type, attr) -> type:
+    # descriptor of inherited method is set to subclass, but method is still defined by base class
+    return attr.__owner__ or owner if isinstance(attr, BindDescriptor) else owner
 
-        methods = inspect.getmembers(self, predicate=inspect.ismethod)
-        functions = inspect.getmembers(self, predicate=inspect.isfunction)
 
-        for method_name, method in methods + functions:
-            if method_name in SPECIAL_METHODS_IGNORE:
-                continue
+def _get_function(attr) -> Optional[Callable]:
+    if isinstance(attr, BindDescriptor):
+        attr = attr.attr
+    if type(attr) in (classmethod, staticmethod):
+        attr = attr.__func__
+    return attr if inspect.isfunction(attr) else None
+
+
+def _get_depends_attrs(method: Callable) -> Dict[str, "DependsAttr"]:
+    signature = get_signature(method)
+    return {
+        name: param.default for name, param in signature.parameters.items() if isinstance(param.default, DependsAttr)
+    }
+
+
+def _has_depends_attr(function: Callable) -> bool:
+    # check defaults only to not evaluate annotations on class creation
+    defaults = (function.__defaults__ or ()) + tuple((function.__kwdefaults__ or {}).values())
+    return any(isinstance(default, DependsAttr) for default in defaults)
 
-            signature = get_typed_signature(method)
-            values_is_depends_attr = [
-                param.default for param in signature.parameters.values() if isinstance(param.default, DependsAttr)
-            ]
 
-            if not values_is_depends_attr:
+class BindDescriptor:
+    # binds method on first access from instance, bound method is stored to instance attributes,
+    # `weak` method isn't stored to instance attributes, it is bound to instance on every access,
+    # `owner` is base class defining method when descriptor is set to subclass for inherited method
+    def __init__(self, attr: Any, lazy: bool = True, weak: bool = False, owner: Optional[type] = None):
+        self.attr = attr
+        self.lazy = lazy
+        self.weak = weak
+        self.__owner__ = owner
+        self.__func__ = _get_function(attr)
+
+    def __get__(self, instance, owner: type = None):
+        if instance is None:
+            return self.attr.__get__(None, owner)
+        method = self.attr.__get__(instance, type(instance))
+        return instance._get_attribute(get_bind_plan(type(instance)).get(method), instance.bind(method))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.__func__.__qualname__})"
+
+
+class BindTarget(NamedTuple):
+    owner: Optional[type]
+    attr: Any  # raw attribute from class `__dict__`, None when attribute is defined only in instance
+    method: Optional["BindMethod"]  # target has `DependsAttr` itself and has to be bound too
+
+
+class BindMethod:
+    def __init__(
+        self,
+        owner: type,
+        name: str,
+        attr: Any,
+        depends: Dict[str, "DependsAttr"],
+        visible: bool,
+        lazy: bool = False,
+        weak: bool = False,
+    ):
+        self.owner = owner
+        self.name = name
+        self.attr = attr.attr if isinstance(attr, BindDescriptor) else attr
+        self.depends = depends
+        self.visible = visible
+        self.lazy = lazy
+        self.weak = weak
+        self.targets: Dict[str, BindTarget] = dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.owner.__name__}.{self.name})"
+
+
+class BindPlan:
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.mro = inspect.getmro(cls)
+        self.methods: List[BindMethod] = list()
+        self._functions: Dict[Callable, BindMethod] = dict()
+        self._unresolved: List[BindMethod] = list()  # worklist of methods with not resolved targets
+        self._lock = threading.Lock()
+
+        # walk raw `__dict__` to never trigger descriptors (property, etc.) while searching methods
+        names = set()
+        for owner in self.mro:
+            for name, attr in owner.__dict__.items():
+                if name in names:
+                    continue
+
+                names.add(name)
+                if name in SPECIAL_METHODS_IGNORE:
+                    continue
+
+                method = self._add(owner, name, attr)
+                if method and method.name in SPECIAL_METHODS_ERROR:
+                    class_method = f"{cls.__name__}.{method.name}"
+                    raise AttributeError(f"`{class_method}` can't have `DependsAttr` as default value for arguments")
+                self._resolve_unresolved()
+
+        self.methods.sort(key=lambda _method: _method.name)
+        self._check_cycles()
+
+    def get(self, method: Callable) -> Optional[BindMethod]:
+        function = getattr(method, "__func__", method)
+        function = getattr(function, "__origin__", function)
+        return self._functions.get(function)
+
+    def external(self, instance: "DependsAttrBinder", method: Callable) -> BindMethod:
+        name = getattr(method, "__name__", type(method).__name__)
+        owner = get_base_class(instance, name, method) or self.cls
+        bind_method = BindMethod(owner, name, method, _get_depends_attrs(method), visible=False)
+        # plan is shared by all instances of class, external method can add methods to plan from any thread
+        with self._lock:
+            self._unresolved.append(bind_method)
+            self._resolve_unresolved()
+        return bind_method
+
+    def _add(self, owner: type, name: str, attr: Any) -> Optional[BindMethod]:
+        function = _get_function(attr)
+        if function is None:
+            return None
+        elif function in self._functions:
+            return self._functions[function]
+
+        depends = _get_depends_attrs(function)
+        if not depends:
+            return None
+
+        owner = _get_owner(owner, attr)
+        first = next(cls for cls in self.mro if name in cls.__dict__)
+        visible = _get_owner(first, first.__dict__[name]) is owner
+        # laziness and weak mode are options of class, so inherited methods follow them too
+        lazy = getattr(self.cls, "__depends_lazy__", False)
+        weak = getattr(self.cls, "__depends_weak__", False)
+        method = self._functions[function] = BindMethod(owner, name, attr, depends, visible, lazy, weak)
+        if visible:
+            self.methods.append(method)
+
+        self._unresolved.append(method)
+        return method
+
+    def _resolve_unresolved(self):
+        # targets are added to worklist instead of recursion, so long chains of methods don't reach recursion limit
+        while self._unresolved:
+            self._resolve_targets(self._unresolved.pop())
+
+    def _resolve_targets(self, method: BindMethod):
+        for parameter, depends in method.depends.items():
+            start = self.mro.index(method.owner) + 1 if depends.from_super else 0
+            target = BindTarget(None, None, None)
+            for cls in self.mro[start:]:
+                if depends.method_name in cls.__dict__:
+                    attr = cls.__dict__[depends.method_name]
+                    bind_method = self._add(cls, depends.method_name, attr)
+                    owner = _get_owner(cls, attr)
+                    target = BindTarget(owner, bind_method.attr if bind_method else attr, bind_method)
+                    break
+            method.targets[parameter] = target
+
+    def _check_cycles(self):
+        # iterative depth-first search, every method and its targets are visited once
+        done: Set[BindMethod] = set()
+        for root in self._functions.values():
+            if root in done:
                 continue
 
-            if method_name in SPECIAL_METHODS_ERROR:
-                class_method = f"{type(self).__name__}.{method.__name__}"
-                raise AttributeError(f"`{class_method}` can't have `DependsAttr` as default value for arguments")
+            path: List[Tuple[BindMethod, Iterator[Tuple[str, BindTarget]]]] = [(root, iter(root.targets.items()))]
+            on_path = {root}
+            while path:
+                method, targets = path[-1]
+                for parameter, target in targets:
+                    if target.method is None or target.method in done:
+                        continue
+                    elif target.method in on_path:
+                        raise self._cycle_error([method for method, _ in path], parameter, target.method)
+                    path.append((target.method, iter(target.method.targets.items())))
+                    on_path.add(target.method)
+                    break
+                else:
+                    path.pop()
+                    on_path.discard(method)
+                    done.add(method)
+
+    @staticmethod
+    def _cycle_error(path: List[BindMethod], parameter: str, target: BindMethod) -> RecursionError:
+        method = path[-1]
+        cycle = " -> ".join(f"`{item.owner.__name__}.{item.name}`" for item in path[path.index(target) :] + [target])
+        depends = method.depends[parameter]
+        return RecursionError(
+            f"`{method.owner.__name__}`.`{method.name}` has {depends} recursively depends self: {cycle}"
+        )
+
+
+_bind_plans: "WeakKeyDictionary[type, BindPlan]" = WeakKeyDictionary()
+_bind_plans_lock = threading.Lock()
+
+
+def get_bind_plan(cls: type) -> BindPlan:
+    # lock is taken only until plan is created, so instances of class created concurrently share one plan
+    plan = _bind_plans.get(cls)
+    if plan is None:
+        with _bind_plans_lock:
+            plan = _bind_plans.get(cls)
+            if plan is None:
+                plan = _bind_plans[cls] = BindPlan(cls)
+    return plan
+
+
+def _get_method_function(method: Callable) -> Callable:
+    return getattr(method, "__func__", method)
+
+
+def _apply_wrapper(wrapper: Callable[[Callable], Callable], dependency: Callable) -> Callable:
+    return wrapper(dependency)
+
+
+def _get_attribute(attr, instance, owner: type):
+    descriptor_get = getattr(type(attr), "__get__", None)
+    return descriptor_get(attr, instance, owner) if descriptor_get else attr
+
+
+class DependsAttrBinder:
+    __depends_lazy__: ClassVar[bool] = False
+    __depends_weak__: ClassVar[bool] = False
+
+    def __init_subclass__(cls, lazy: Optional[bool] = None, weak: Optional[bool] = None, **kwargs):
+        super(DependsAttrBinder, cls).__init_subclass__(**kwargs)
+
+        if lazy is not None:
+            cls.__depends_lazy__ = lazy
+        if weak is not None:
+            cls.__depends_weak__ = weak
+
+        # descriptors of inherited methods are replaced in subclass when options of subclass are different
+        options = (cls.__depends_lazy__, cls.__depends_weak__)
+        names = set()
+        for owner in inspect.getmro(cls):
+            for name, attr in list(owner.__dict__.items()):
+                if name in names:
+                    continue
+
+                names.add(name)
+                function = _get_function(attr)
+                if name in SPECIAL_METHODS_IGNORE + SPECIAL_METHODS_ERROR or not function:
+                    continue
+                elif type(attr) is BindDescriptor:
+                    if owner is not cls and (attr.lazy, attr.weak) != options:
+                        descriptor = BindDescriptor(attr.attr, *options, owner=_get_owner(owner, attr))
+                        setattr(cls, name, descriptor)
+                elif any(options) and _has_depends_attr(function):
+                    setattr(cls, name, BindDescriptor(attr, *options, owner=owner if owner is not cls else None))
+
+    def __init__(self, *args, **kwargs):
+        super(DependsAttrBinder, self).__init__(*args, **kwargs)
 
-            self.bind(method)
+        cls = type(self)
+        for method in get_bind_plan(cls).methods:
+            if not method.lazy:
+                self.bind(method.attr.__get__(self, cls))
 
     def bind(self, method: Callable) -> Callable:
-        def depends_attr_bind(depends: DependsAttr, _base_class: type, instance) -> DependsAttr:
+        if listeners:
+            name = getattr(method, "__name__", type(method).__name__)
+            with Measure("binder.bind", type(self), name) as measure:
+                return self._bind(method, measure)
+        return self._bind(method)
+
+    def _bind(self, method: Callable, measure: Measure = None) -> Callable:
+        cls = type(self)
+        plan = get_bind_plan(cls)
+        bind_method = plan.get(method)
+        if not bind_method:
+            # todo substitute in external method
+            bind_method = plan.external(self, method)
+            return self._patch(bind_method, method) if bind_method.depends else method
+
+        bound = self.__dict__.setdefault(BOUND_DEPENDENCIES_ATTR, dict())
+        key = (bind_method.owner, bind_method.name)
+        if measure:
+            measure.cache_hit = key in bound
+
+        if key not in bound:
+            self._bind_methods(bind_method, bound)
+
+        return bound[key]
+
+    def _bind_methods(self, bind_method: BindMethod, bound: Dict[tuple, Callable]):
+        # methods are bound by explicit stack after their targets, plan of class has no cycles
+        cls = type(self)
+        stack = [bind_method]
+        while stack:
+            method = stack[-1]
+            key = (method.owner, method.name)
+            if key in bound:
+                stack.pop()
+                continue
 
-            # todo: DependsAttr.__copy__
-            depends_copy = DependsAttr(
-                method_name=depends.method_name,
-                from_super=depends.from_super,
-                use_cache=depends.use_cache,
-            )
+            targets = [target.method for target in method.targets.values() if target.method]
+            unbound = [sub for sub in targets if (sub.owner, sub.name) not in bound]
+            if unbound:
+                stack.extend(unbound)
+                continue
 
-            if hasattr(_base_class, depends.method_name):
-                method_definition = getattr(_base_class, depends.method_name)
+            stack.pop()
+            # instance can be bound from several threads, the first bound method is kept by all of them
+            if listeners and method is not bind_method:
+                with Measure("binder.bind", cls, method.name, cache_hit=False):
+                    bound.setdefault(key, self._weaken(self._patch(method, method.attr.__get__(self, cls))))
             else:
-                method_definition = getattr(instance, depends.method_name)
+                bound.setdefault(key, self._weaken(self._patch(method, method.attr.__get__(self, cls))))
+            if method.visible and not method.weak:
+                setattr(self, method.name, self._get_attribute(method, bound[key]))
 
-            if isinstance(method_definition, property):
-                depends_copy.dependency = method_definition.fget(instance)
-            else:
-                dependency = depends_attr_get_method(depends, _base_class, instance)
-                depends_copy.dependency = self.bind(dependency)
-            return depends_copy
-
-        def depends_attr_get_method(depends: DependsAttr, _base_class: type, instance) -> Callable:
-            # todo: DependsAttr.get_method
-            obj = super(_base_class, instance) if depends.from_super else instance
-            return getattr(obj, depends.method_name)
-
-        method_name = getattr(method, "__name__", type(method).__name__)
-        base_class = get_base_class(self, method_name, method)
-        signature = get_typed_signature(method)
-        parameters = (param for param in signature.parameters.values() if isinstance(param.default, DependsAttr))
+    def _patch(self, bind_method: BindMethod, method: Callable) -> Callable:
         instance_method_params = {
-            parameter.name: depends_attr_bind(parameter.default, base_class, self) for parameter in parameters
+            parameter: self._bind_depends_attr(bind_method, parameter) for parameter in bind_method.depends
         }
+        gathered = {
+            parameter: depends
+            for parameter, depends in instance_method_params.items()
+            if depends.gather and is_coroutine_callable(depends.dependency)
+        }
+        if len(gathered) > 1:
+            instance_method_params.update(self._gather(gathered))
+        return patch_defaults(method, **instance_method_params)
+
+    def _gather(self, dependencies: Dict[str, "DependsAttr"]) -> Dict[str, "DependsAttr"]:
+        picks = gather(
+            {
+                parameter: params.Depends(self._wrap(defer, depends.dependency), use_cache=depends.use_cache)
+                for parameter, depends in dependencies.items()
+            }
+        )
+        for parameter, depends in dependencies.items():
+            depends.dependency = picks[parameter]
+        return dependencies
+
+    def _bind_depends_attr(self, bind_method: BindMethod, parameter: str) -> "DependsAttr":
+        depends = bind_method.depends[parameter]
+        target = bind_method.targets[parameter]
+
+        depends_copy = copy(depends)
+
+        # the same dependency has to be the same object to be resolved once per request by FastAPI
+        bound = self.__dict__.setdefault(BOUND_DEPENDENCIES_ATTR, dict())
+        key = (target.owner if target.method or depends.from_super else None, depends.method_name)
+        if key in bound:
+            depends_copy.dependency = bound[key]
+        elif target.method:
+            depends_copy.dependency = self.bind(target.attr.__get__(self, type(self)))
+        elif not depends.from_super:
+            depends_copy.dependency = bound.setdefault(key, self._weaken(getattr(self, depends.method_name)))
+        elif target.attr is not None:
+            attribute = _get_attribute(target.attr, self, type(self))
+            depends_copy.dependency = bound.setdefault(key, self._weaken(attribute))
+        else:
+            depends_copy.dependency = self._weaken(getattr(super(bind_method.owner, self), depends.method_name))
 
-        if instance_method_params:
-            # todo substitute in external method
-            if inspect.ismethod(method):
-                substitute = getattr(self, method.__name__).__func__ is method.__func__
-            else:
-                substitute = getattr(self, method.__name__) is method
+        depends_copy.dependency = depends.wrap(depends_copy.dependency, self._wrap, target.owner or type(self))
 
-            method = patch_defaults(method, **instance_method_params)
-            if substitute:
-                setattr(self, method.__name__, method)
+        return depends_copy
 
-        return method
+    def _get_attribute(self, bind_method: BindMethod, bound: Callable) -> Callable:
+        # visible method is instrumented as dependency without options, so it is the same object for fastapi
+        instrument = Instrument(CallInfo(bind_method.owner, bind_method.name, False, False)) if call_hooks else None
+        if hasattr(bound, "__weak_self__") or (instrument and getattr(bound, "__self__", None) is self):
+            # function is instrumented and bound to instance again, so attribute is still method of instance,
+            # weakly bound method keeps instance alive while it is used
+            func = self._wrap(instrument, bound.__func__) if instrument else bound.__func__
+            return MethodType(func, self)
+        return self._wrap(instrument, bound) if instrument else bound
+
+    def _weaken(self, dependency: Callable) -> Callable:
+        # stored method bound to instance makes reference cycle, so instance is freed only by garbage collector
+        if self.__depends_weak__ and inspect.ismethod(dependency) and dependency.__self__ is self:
+            return weak_method(dependency)
+        return dependency
+
+    def _wrap(self, wrapper: Callable[[Callable], Callable], dependency: Callable) -> Callable:
+        # the same wrapper is shared by all methods of instance, so fastapi resolves it once per request
+        wrapped = self.__dict__.setdefault(WRAPPED_DEPENDENCIES_ATTR, dict())
+        key = (wrapper, dependency)
+        if key not in wrapped:
+            wrapped.setdefault(key, wrapper(dependency))
+        return wrapped[key]
 
 
 class DependsExt(params.Depends):
+    # copies are created for every instance, so options are in slots instead of `__dict__`
+    __slots__ = ("__origin__", "overrides", "scope", "inline", "executor")
     __origin__: Callable
 
-    def __init__(self, dependency: Optional[Callable[..., Any]] = None, *, use_cache: bool = True):
+    def __init__(
+        self,
+        dependency: Optional[Callable[..., Any]] = None,
+        *,
+        use_cache: bool = True,
+        scope: str = SCOPE_REQUEST,
+        inline: Optional[bool] = None,
+        executor: Union[str, DependencyExecutor] = None,
+    ):
+        check_scope(scope)
+        if inline and executor is not None:
+            raise ValueError("`inline` and `executor` can't be used together")
+
         self.__origin__ = dependency
+        self.overrides: Dict[str, SUPPORTED_DEPENDS] = dict()
+        self.scope = scope
+        self.inline = inline
+        self.executor = executor
+        if dependency is not None:
+            dependency = self.wrap(dependency)
         super(DependsExt, self).__init__(dependency, use_cache=use_cache)
 
+    def __copy__(self) -> "DependsExt":
+        # options are copied without validation and wrapping of dependency done by `__init__`
+        copy = type(self).__new__(type(self))
+        copy.dependency = self.dependency
+        copy.use_cache = self.use_cache
+        copy.__origin__ = self.__origin__
+        copy.overrides = self.overrides
+        copy.scope = self.scope
+        copy.inline = self.inline
+        copy.executor = self.executor
+        return copy
+
     def bind(self, **kwargs: SUPPORTED_DEPENDS) -> "DependsExt":
-        patched = patch_defaults(self.dependency, **kwargs)
-        return DependsExt(patched, use_cache=self.use_cache)
+        # patch original dependency by all overrides to not stack patched functions on rebind
+        overrides = {**self.overrides, **kwargs}
+        patched = patch_defaults(self.__origin__, **overrides)
+        if self.scope == SCOPE_APP:
+            app_scope.discard(self.dependency)
+
+        depends = DependsExt(
+            patched, use_cache=self.use_cache, scope=self.scope, inline=self.inline, executor=self.executor
+        )
+        depends.__origin__ = self.__origin__
+        depends.overrides = overrides
+        return depends
+
+    def wrap(
+        self, dependency: Callable, wrap: Callable[[Callable, Callable], Callable] = None, owner: type = None
+    ) -> Callable:
+        # `wrap` applies wrapper to dependency, binder uses it to share wrappers between methods of instance
+        wrap = wrap or _apply_wrapper
+        info = self._get_call_info(dependency, owner) if call_hooks else None
+        # `inline=None` runs on event loop only sync dependencies marked by `cheap`
+        if self.executor is not None:
+            dependency = wrap(executors.get(self.executor).wrap, dependency)
+        elif self.inline or (self.inline is None and is_cheap(dependency)):
+            dependency = wrap(inline, dependency)
+        dependency = self._wrap_call(dependency, wrap)
+        if self.scope == SCOPE_APP:
+            dependency = wrap(AppScoped(app_scope, self._get_scope_key(owner)), dependency)
+        if info:
+            dependency = wrap(Instrument(info), dependency)
+        return dependency
+
+    def _get_call_info(self, dependency: Callable, owner: Optional[type]) -> CallInfo:
+        return CallInfo(owner, getattr(dependency, "__name__", type(dependency).__name__), False, False)
+
+    def _get_scope_key(self, owner: Optional[type]) -> Optional[Hashable]:
+        return None
+
+    def _wrap_call(self, dependency: Callable, wrap: Callable[[Callable, Callable], Callable]) -> Callable:
+        return dependency
 
 
 class DependsAttr(DependsExt):
-    def __init__(self, method_name: str, *, from_super: bool = False, use_cache=True):
-        super(DependsAttr, self).__init__(use_cache=use_cache)
+    __slots__ = ("from_super", "method_name", "gather", "cache", "coalesce")
+
+    def __init__(
+        self,
+        method_name: str,
+        *,
+        from_super: bool = False,
+        use_cache=True,
+        gather: bool = False,
+        cache: ResultCache = None,
+        coalesce: bool = False,
+        scope: str = SCOPE_REQUEST,
+        inline: Optional[bool] = None,
+        executor: Union[str, DependencyExecutor] = None,
+    ):
+        super(DependsAttr, self).__init__(use_cache=use_cache, scope=scope, inline=inline, executor=executor)
         self.from_super = from_super
         self.method_name = method_name
+        self.gather = gather
+        self.cache = cache
+        self.coalesce = coalesce
+
+    def __copy__(self) -> "DependsAttr":
+        copy = super(DependsAttr, self).__copy__()
+        copy.from_super = self.from_super
+        copy.method_name = self.method_name
+        copy.gather = self.gather
+        copy.cache = self.cache
+        copy.coalesce = self.coalesce
+        return copy
 
     def __repr__(self):
         method = self.dependency.__name__ if self.dependency else f"<{self.method_name}>"
         cache = "" if self.use_cache else f", use_cache={self.use_cache}"
         from_super = ", from_super=True" if self.from_super else ""
-        return f"{type(self).__name__}({method}{from_super}{cache})"
-
-    def bind(self, instance, super_from: type = None):
+        gather = ", gather=True" if self.gather else ""
+        result_cache = f", cache={self.cache}" if self.cache is not None else ""
+        coalesce = ", coalesce=True" if self.coalesce else ""
+        scope = f", scope={self.scope!r}" if self.scope != SCOPE_REQUEST else ""
+        inline = f", inline={self.inline}" if self.inline is not None else ""
+        executor = f", executor={self.executor!r}" if self.executor is not None else ""
+        options = f"{from_super}{cache}{gather}{result_cache}{coalesce}{scope}{inline}{executor}"
+        return f"{type(self).__name__}({method}{options})"
+
+    def bind(self, instance, super_from: type = None) -> "DependsAttr":
+        if listeners:
+            with Measure("depends_attr.bind", type(instance), self.method_name, cache_hit=self.is_bound):
+                return self._bind(instance, super_from)
+        return self._bind(instance, super_from)
+
+    def _bind(self, instance, super_from: type = None) -> "DependsAttr":
+        # returns bound copy, defaults of class are shared by instances and threads, so they are never changed;
+        # depends are bound by explicit stack after depends of their methods, so long chains don't reach recursion limit
         if self.is_bound:
-            return
+            return self
+
+        # frame has parameters of method to bind, bound depends for them and name of parameter in previous frame
+        frames = [(*self._bind_frame(instance, super_from), dict(), None)]
+        # index of frame by function of method being bound
+        active: Dict[Callable, int] = {_get_method_function(frames[0][1]): 0}
+        # the same depends is bound once, so it is the same object to be resolved once per request by FastAPI
+        done: Dict["DependsAttr", "DependsAttr"] = dict()
+        while frames:
+            depends, method, cls, parameters, patched, name = frames[-1]
+            parameter = next(parameters, None)
+            if parameter is None:
+                frames.pop()
+                del active[_get_method_function(method)]
+                depends_copy = done[depends] = copy(depends)
+                method = patch_defaults(method, **patched) if patched else method
+                depends_copy.dependency = depends.wrap(method, owner=cls)
+                if frames:
+                    frames[-1][4][name] = depends_copy
+                continue
+
+            sub_depends = parameter.default
+            if not isinstance(sub_depends, DependsAttr) or sub_depends.is_bound:
+                continue
+
+            elif sub_depends in done:
+                patched[parameter.name] = done[sub_depends]
+                continue
+
+            elif sub_depends.method_name == depends.method_name and not sub_depends.from_super:
+                message = f"`{cls.__name__}`.`{depends.method_name}` has {depends} recursively depends self"
+                raise RecursionError(message)
+
+            frame = (*sub_depends._bind_frame(instance, cls), dict(), parameter.name)
+            function = _get_method_function(frame[1])
+            if function in active:
+                path = [f"`{item[2].__name__}.{item[0].method_name}`" for item in frames[active[function] :]]
+                cycle = " -> ".join(path + path[:1])
+                message = (
+                    f"`{cls.__name__}`.`{depends.method_name}` has {sub_depends} recursively depends self: {cycle}"
+                )
+                raise RecursionError(message)
+
+            active[function] = len(frames)
+            frames.append(frame)
 
+        return done[self]
+
+    def _bind_frame(self, instance, super_from: type = None) -> Tuple["DependsAttr", Callable, type, Iterator]:
         if self.from_super:
             super_from = super_from or type(instance)
             method = getattr(super(super_from, instance), self.method_name, None)
@@ -134,21 +641,22 @@ class DependsAttr(DependsExt):
             raise AttributeError(f"{cls_name} has not method `{self.method_name}`")
 
         cls = get_base_class(instance, self.method_name, method)
-        signature = get_typed_signature(method)
-
-        for parameter in signature.parameters.values():
-            depends: DependsAttr = parameter.default
-            if not isinstance(depends, DependsAttr) or depends.is_bound:
-                continue
-
-            elif depends.method_name != self.method_name or depends.from_super:
-                depends.bind(instance, cls)
-
-            else:
-                message = f"`{cls.__name__}`.`{self.method_name}` has {self} recursively depends self"
-                raise RecursionError(message)
-
-        self.dependency = method
+        return self, method, cls, iter(get_signature(method).parameters.values())
+
+    def _wrap_call(self, dependency: Callable, wrap: Callable[[Callable, Callable], Callable]) -> Callable:
+        # coalesced call is inside of cache to share call of all concurrent cache misses
+        if self.coalesce:
+            dependency = wrap(single_flight.wrap, dependency)
+        if self.cache is not None:
+            dependency = wrap(self.cache.wrap, dependency)
+        return dependency
+
+    def _get_call_info(self, dependency: Callable, owner: Optional[type]) -> CallInfo:
+        return CallInfo(owner, self.method_name, self.from_super, self.cache is not None)
+
+    def _get_scope_key(self, owner: Optional[type]) -> Optional[Hashable]:
+        # dependency is bound to instance, value is shared by all instances of class
+        return (owner, self.method_name) if owner is not None else None
 
     @property
     def is_bound(self):
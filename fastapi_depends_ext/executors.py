@@ -0,0 +1,154 @@
+import asyncio
+import functools
+import inspect
+import pickle
+import threading
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+
+from fastapi_depends_ext.utils import wrap_call
+
+
+class ExecutorInfo(NamedTuple):
+    name: str
+    max_workers: int
+    calls: int
+    errors: int
+    in_flight: int
+    queued: int  # calls waiting for free worker
+    latency_total: float  # seconds from submit to result of all done calls
+    latency_max: float
+
+
+# pool running sync dependencies instead of default threadpool of fastapi, pool is created on first call
+class DependencyExecutor:
+    def __init__(self, name: str, max_workers: int, factory: Callable[[int], Executor], processes: bool = False):
+        self.name = name
+        self.max_workers = max_workers
+        self.factory = factory
+        self.processes = processes  # dependency and its arguments are pickled to be sent to worker process
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r}, max_workers={self.max_workers})"
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self.factory(self.max_workers)
+        return self._executor
+
+    async def run(self, func: Callable, **kwargs):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self.executor, functools.partial(func, **kwargs))
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            latency = time.perf_counter() - started
+            self.in_flight -= 1
+            self.calls += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def wrap(self, dependency: Callable) -> Callable:
+        if is_coroutine_callable(dependency) or is_gen_callable(dependency) or is_async_gen_callable(dependency):
+            raise TypeError(
+                f"Only sync dependency without `yield` can be run in executor `{self.name}`: `{dependency}`"
+            )
+
+        call = self._get_picklable(dependency) if self.processes else dependency
+
+        async def dispatched(**kwargs):
+            return await self.run(call, **kwargs)
+
+        return wrap_call(dispatched, dependency)
+
+    def _get_picklable(self, dependency: Callable) -> Callable:
+        # patched copy of function isn't picklable by reference, but fastapi calls it with all arguments,
+        # so original function is called instead
+        call = getattr(dependency, "__origin__", dependency) if inspect.isfunction(dependency) else dependency
+        try:
+            pickle.dumps(call)
+        except Exception as exc:
+            raise TypeError(
+                f"Dependency run in process pool `{self.name}` must be picklable module level function: `{dependency}`"
+            ) from exc
+        return call
+
+    def info(self) -> ExecutorInfo:
+        queued = max(0, self.in_flight - self.max_workers)
+        return ExecutorInfo(
+            self.name,
+            self.max_workers,
+            self.calls,
+            self.errors,
+            self.in_flight,
+            queued,
+            self.latency_total,
+            self.latency_max,
+        )
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class ExecutorRegistry:
+    def __init__(self):
+        self._executors: Dict[str, DependencyExecutor] = dict()
+
+    def thread_pool(self, name: str, max_workers: int) -> DependencyExecutor:
+        factory = functools.partial(ThreadPoolExecutor, thread_name_prefix=f"fastapi-depends-{name}")
+        return self._add(DependencyExecutor(name, max_workers, factory))
+
+    def process_pool(self, name: str, max_workers: int) -> DependencyExecutor:
+        # dependency and its arguments are pickled, so dependency has to be module level function
+        return self._add(DependencyExecutor(name, max_workers, ProcessPoolExecutor, processes=True))
+
+    def get(self, executor: Union[str, DependencyExecutor]) -> DependencyExecutor:
+        if isinstance(executor, DependencyExecutor):
+            return executor
+        elif executor not in self._executors:
+            raise KeyError(f"Executor `{executor}` is not registered")
+        return self._executors[executor]
+
+    def info(self) -> Dict[str, ExecutorInfo]:
+        return {name: executor.info() for name, executor in self._executors.items()}
+
+    def shutdown(self, wait: bool = True):
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+
+    def _add(self, executor: DependencyExecutor) -> DependencyExecutor:
+        if executor.name in self._executors:
+            raise ValueError(f"Executor `{executor.name}` is already registered")
+        self._executors[executor.name] = executor
+        return executor
+
+
+executors = ExecutorRegistry()
@@ -0,0 +1,52 @@
+import asyncio
+from inspect import Parameter
+from inspect import Signature
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from fastapi import params
+
+from fastapi_depends_ext.utils import wrap_call
+
+
+def defer(dependency: Callable) -> Callable:
+    # fastapi resolves deferred dependency to task already started on event loop instead of awaiting result
+    async def deferred(**kwargs) -> asyncio.Future:
+        task = asyncio.ensure_future(dependency(**kwargs))
+        # task is never awaited when other dependency of request fails before gathering
+        task.add_done_callback(_retrieve_exception)
+        return task
+
+    return wrap_call(deferred, dependency)
+
+
+def _retrieve_exception(task: asyncio.Future):
+    if not task.cancelled():
+        task.exception()
+
+
+def gather(dependencies: Dict[str, params.Depends]) -> Dict[str, Callable]:
+    # all tasks of deferred dependencies are created before any of them is awaited, so siblings run concurrently
+    async def gathered(**tasks: asyncio.Future) -> Dict[str, Any]:
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            # `asyncio.gather` doesn't cancel other tasks on failure
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(tasks, results))
+
+    parameters = [Parameter(name, Parameter.KEYWORD_ONLY, default=depends) for name, depends in dependencies.items()]
+    gathered.__signature__ = Signature(parameters)
+    return {name: _pick(gathered, name) for name in dependencies}
+
+
+def _pick(gathered: Callable, name: str) -> Callable:
+    # `gathered` is cached by fastapi per request, so it is awaited once for all picks
+    async def pick(results: Dict[str, Any] = params.Depends(gathered)) -> Any:
+        return results[name]
+
+    pick.__qualname__ = pick.__name__ = f"pick_{name}"
+    return pick
@@ -0,0 +1,148 @@
+from abc import ABC
+from abc import abstractmethod
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+
+from fastapi_depends_ext.utils import get_signature
+from fastapi_depends_ext.utils import wrap_call
+
+
+class CallInfo(NamedTuple):
+    cls: Optional[type]  # class defining method, None for dependency of `DependsExt`
+    method: str
+    from_super: bool
+    cached: bool  # dependency has `ResultCache`
+
+    @property
+    def class_name(self) -> str:
+        return self.cls.__qualname__ if self.cls is not None else ""
+
+
+CallHook = Callable[[Callable, CallInfo], Callable]
+EnterHook = Callable[[], Any]
+ExitHook = Callable[[Any, Optional[BaseException], Optional[bool]], None]
+
+# dependencies are wrapped by hooks on bind, so hooks have to be added before instances are created
+call_hooks: List[CallHook] = list()
+
+_cache_hit: ContextVar[Optional[bool]] = ContextVar("fastapi_depends_ext_cache_hit", default=None)
+
+
+def add_call_hook(hook: CallHook) -> CallHook:
+    call_hooks.append(hook)
+    return hook
+
+
+def remove_call_hook(hook: CallHook):
+    call_hooks.remove(hook)
+
+
+class Instrument(NamedTuple):
+    # wrapper applying hooks, it is hashable, so binder instruments the same dependency once per instance
+    info: CallInfo
+
+    def __call__(self, dependency: Callable) -> Callable:
+        for hook in tuple(call_hooks):
+            dependency = hook(dependency, self.info)
+        return dependency
+
+
+def set_cache_hit(hit: bool):
+    if call_hooks:
+        _cache_hit.set(hit)
+
+
+def observe(dependency: Callable, info: CallInfo, enter: EnterHook, exit: ExitHook) -> Callable:
+    # `enter` is called before dependency, its result is passed to `exit` with error and cache status after call,
+    # dependencies with `yield` are not observed, positional arguments are passed for functions bound as methods
+    if is_gen_callable(dependency) or is_async_gen_callable(dependency):
+        return dependency
+
+    if is_coroutine_callable(dependency):
+
+        async def observed(*args, **kwargs):
+            state, token, error = enter(), _cache_hit.set(None), None
+            try:
+                return await dependency(*args, **kwargs)
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                cache_hit = _cache_hit.get()
+                _cache_hit.reset(token)
+                exit(state, error, cache_hit)
+
+    else:
+
+        def observed(*args, **kwargs):
+            state, token, error = enter(), _cache_hit.set(None), None
+            try:
+                return dependency(*args, **kwargs)
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                cache_hit = _cache_hit.get()
+                _cache_hit.reset(token)
+                exit(state, error, cache_hit)
+
+    observed = wrap_call(observed, dependency)
+    observed.__call_info__ = info
+    return observed
+
+
+def get_dependencies(dependency: Callable) -> Tuple[CallInfo, ...]:
+    # observed sub dependencies resolved by fastapi before dependency is called
+    infos = list()
+    for parameter in get_signature(dependency).parameters.values():
+        info = getattr(getattr(parameter.default, "dependency", None), "__call_info__", None)
+        if info is not None:
+            infos.append(info)
+    return tuple(infos)
+
+
+class CallObserver(ABC):
+    # call hook observing calls of dependencies by `enter` and `exit` hooks,
+    # dependencies are wrapped by hooks on bind, so observer has to be enabled before instances are created
+    def enable(self):
+        if self.wrap not in call_hooks:
+            add_call_hook(self.wrap)
+
+    def disable(self):
+        if self.wrap in call_hooks:
+            remove_call_hook(self.wrap)
+
+    def wrap(self, dependency: Callable, info: CallInfo) -> Callable:
+        return observe(dependency, info, *self.hooks(dependency, info))
+
+    @abstractmethod
+    def hooks(self, dependency: Callable, info: CallInfo) -> Tuple[EnterHook, ExitHook]:
+        pass
+
+
+class RequestMiddleware(ABC):
+    # ASGI middleware running every http request inside of context returned by `request`
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        with self.request(scope):
+            await self.app(scope, receive, send)
+
+    @abstractmethod
+    def request(self, scope: Dict[str, Any]) -> AbstractContextManager:
+        pass
@@ -0,0 +1,32 @@
+from typing import Callable
+from typing import Final
+
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+
+from fastapi_depends_ext.utils import wrap_call
+
+
+CHEAP_ATTR: Final = "__depends_cheap__"
+
+
+def cheap(func: Callable) -> Callable:
+    # marks sync dependency to be run on event loop, it must not block
+    setattr(func, CHEAP_ATTR, True)
+    return func
+
+
+def is_cheap(call: Callable) -> bool:
+    return getattr(call, CHEAP_ATTR, False) is True
+
+
+def inline(dependency: Callable) -> Callable:
+    # fastapi runs sync dependency in threadpool, but coroutine function is awaited on event loop
+    if is_coroutine_callable(dependency) or is_gen_callable(dependency) or is_async_gen_callable(dependency):
+        return dependency
+
+    async def inlined(**kwargs):
+        return dependency(**kwargs)
+
+    return wrap_call(inlined, dependency)
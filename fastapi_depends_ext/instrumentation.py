@@ -0,0 +1,90 @@
+import time
+from contextvars import ContextVar
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+
+class BindEvent(NamedTuple):
+    kind: str  # "binder.bind", "depends_attr.bind" or "patch_defaults"
+    cls: Optional[type]
+    method: str
+    depth: int  # nesting of bind calls, 1 for call started outside of other bind
+    duration: float  # seconds
+    cache_hit: Optional[bool]  # None when call has no cache
+
+
+BindListener = Callable[[BindEvent], None]
+
+# checked by instrumented functions before any measure, so without listeners instrumentation costs nothing
+listeners: List[BindListener] = list()
+
+_depth: ContextVar[int] = ContextVar("fastapi_depends_ext_bind_depth", default=0)
+
+
+def add_listener(listener: BindListener) -> BindListener:
+    listeners.append(listener)
+    return listener
+
+
+def remove_listener(listener: BindListener):
+    listeners.remove(listener)
+
+
+class Measure:
+    __slots__ = ("kind", "cls", "method", "cache_hit", "_start", "_token")
+
+    def __init__(self, kind: str, cls: Optional[type], method: str, cache_hit: Optional[bool] = None):
+        self.kind = kind
+        self.cls = cls
+        self.method = method
+        self.cache_hit = cache_hit
+
+    def __enter__(self) -> "Measure":
+        self._token = _depth.set(_depth.get() + 1)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self._start
+        depth = _depth.get()
+        _depth.reset(self._token)
+
+        event = BindEvent(self.kind, self.cls, self.method, depth, duration, self.cache_hit)
+        for listener in tuple(listeners):
+            listener(event)
+
+
+class BindStats(NamedTuple):
+    calls: int
+    duration: float
+    hits: int
+    misses: int
+
+
+class BindCounters:
+    # listener to aggregate events by (kind, class, method)
+    def __init__(self):
+        self._stats: Dict[Tuple[str, Optional[type], str], BindStats] = dict()
+
+    def __call__(self, event: BindEvent):
+        key = (event.kind, event.cls, event.method)
+        calls, duration, hits, misses = self._stats.get(key, (0, 0.0, 0, 0))
+        self._stats[key] = BindStats(
+            calls + 1,
+            duration + event.duration,
+            hits + (event.cache_hit is True),
+            misses + (event.cache_hit is False),
+        )
+
+    def get(self, kind: str, cls: Optional[type], method: str) -> BindStats:
+        return self._stats.get((kind, cls, method), BindStats(0, 0.0, 0, 0))
+
+    def snapshot(self) -> Dict[Tuple[str, Optional[type], str], BindStats]:
+        return dict(self._stats)
+
+    def reset(self):
+        self._stats.clear()
@@ -0,0 +1,159 @@
+import bisect
+import itertools
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from fastapi_depends_ext.hooks import CallInfo
+from fastapi_depends_ext.hooks import CallObserver
+from fastapi_depends_ext.hooks import EnterHook
+from fastapi_depends_ext.hooks import ExitHook
+
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsInfo(NamedTuple):
+    calls: int  # finished calls
+    errors: int
+    cache_hits: int
+    cache_misses: int
+    in_flight: int
+    buckets: Tuple[int, ...]  # cumulative counts of calls by duration, the last one is `+Inf`
+    duration: float  # seconds of all finished calls
+
+
+_COUNTERS = (
+    ("calls_total", "counter", "Finished calls of dependency."),
+    ("errors_total", "counter", "Calls of dependency finished by exception."),
+    ("cache_hits_total", "counter", "Calls of dependency returned result from cache."),
+    ("cache_misses_total", "counter", "Calls of dependency not found in cache."),
+    ("in_flight", "gauge", "Calls of dependency in progress."),
+)
+
+
+class _Series:
+    def __init__(self, buckets: int):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.in_flight = 0
+        self.buckets = [0] * buckets  # not cumulative, the last one is `+Inf`
+        self.duration = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value)) if value != float("inf") else "+Inf"
+
+
+# metrics of dependencies labelled by class and method, rendered in prometheus text format:
+# `app.mount("/metrics", metrics)`
+class DependencyMetrics(CallObserver):
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "fastapi_depends"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._series: Dict[Tuple[str, str], _Series] = dict()
+        self._lock = threading.Lock()
+
+    def hooks(self, dependency: Callable, info: CallInfo) -> Tuple[EnterHook, ExitHook]:
+        key = (info.class_name, info.method)
+
+        def enter():
+            with self._lock:
+                self._get_series(key).in_flight += 1
+            return time.perf_counter()
+
+        def exit(started: float, error: Optional[BaseException], cache_hit: Optional[bool]):
+            duration = time.perf_counter() - started
+            with self._lock:
+                series = self._get_series(key)
+                series.in_flight -= 1
+                series.calls += 1
+                series.errors += error is not None
+                series.cache_hits += cache_hit is True
+                series.cache_misses += cache_hit is False
+                series.buckets[bisect.bisect_left(self.buckets, duration)] += 1
+                series.duration += duration
+
+        return enter, exit
+
+    def info(self) -> Dict[Tuple[str, str], MetricsInfo]:
+        with self._lock:
+            return {
+                key: MetricsInfo(
+                    series.calls,
+                    series.errors,
+                    series.cache_hits,
+                    series.cache_misses,
+                    series.in_flight,
+                    tuple(itertools.accumulate(series.buckets)),
+                    series.duration,
+                )
+                for key, series in self._series.items()
+            }
+
+    def render(self) -> str:
+        info = sorted(self.info().items())
+        lines: List[str] = list()
+        for name, kind, description in _COUNTERS:
+            self._add_header(lines, name, kind, description)
+            field = name.replace("_total", "")
+            for key, values in info:
+                lines.append(f"{self.prefix}_{name}{{{self._labels(key)}}} {getattr(values, field)}")
+
+        self._add_header(lines, "duration_seconds", "histogram", "Duration of dependency call.")
+        for key, values in info:
+            labels = self._labels(key)
+            for bound, count in zip(self.buckets + (float("inf"),), values.buckets):
+                lines.append(f'{self.prefix}_duration_seconds_bucket{{{labels},le="{_format_float(bound)}"}} {count}')
+            lines.append(f"{self.prefix}_duration_seconds_sum{{{labels}}} {_format_float(values.duration)}")
+            lines.append(f"{self.prefix}_duration_seconds_count{{{labels}}} {values.buckets[-1]}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        # in-flight calls are kept to not make gauge negative
+        with self._lock:
+            for key, series in list(self._series.items()):
+                if series.in_flight:
+                    self._series[key] = _Series(len(self.buckets) + 1)
+                    self._series[key].in_flight = series.in_flight
+                else:
+                    del self._series[key]
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        # ASGI application rendering metrics
+        body = self.render().encode()
+        headers = [(b"content-type", CONTENT_TYPE.encode()), (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def _get_series(self, key: Tuple[str, str]) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(len(self.buckets) + 1)
+        return series
+
+    def _add_header(self, lines: List[str], name: str, kind: str, description: str):
+        lines.append(f"# HELP {self.prefix}_{name} {description}")
+        lines.append(f"# TYPE {self.prefix}_{name} {kind}")
+
+    @staticmethod
+    def _labels(key: Tuple[str, str]) -> str:
+        return f'class="{_escape(key[0])}",method="{_escape(key[1])}"'
+
+
+metrics = DependencyMetrics()
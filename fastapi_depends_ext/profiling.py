@@ -0,0 +1,169 @@
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from fastapi_depends_ext.hooks import CallInfo
+from fastapi_depends_ext.hooks import CallObserver
+from fastapi_depends_ext.hooks import EnterHook
+from fastapi_depends_ext.hooks import ExitHook
+from fastapi_depends_ext.hooks import RequestMiddleware
+from fastapi_depends_ext.hooks import get_dependencies
+
+
+ProfileKey = Tuple[str, str]  # class and method
+
+
+class ProfileStats(NamedTuple):
+    calls: int
+    samples: int  # requests, or calls made outside of `ProfilerMiddleware`
+    wall_p50: float  # seconds from start of sub dependencies to end of dependency
+    wall_p90: float
+    wall_p99: float
+    wall_max: float
+    self_p50: float  # seconds of dependency call without calls of other profiled dependencies inside it
+    self_p90: float
+    self_p99: float
+    self_max: float
+
+
+class RequestProfile:
+    # calls of dependencies in one request
+    def __init__(self):
+        self.calls: Dict[ProfileKey, List[float]] = dict()  # calls, wall time and self time
+        self.starts: Dict[CallInfo, float] = dict()  # start of sub dependencies of last call of dependency
+
+
+_request: ContextVar[Optional[RequestProfile]] = ContextVar("fastapi_depends_ext_profile", default=None)
+_nested: ContextVar[Optional[List[float]]] = ContextVar("fastapi_depends_ext_profile_nested", default=None)
+
+
+class _Samples:
+    def __init__(self, size: int):
+        self.calls = 0
+        self.wall: Deque[float] = deque(maxlen=size)
+        self.self: Deque[float] = deque(maxlen=size)
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    # nearest-rank percentile of sorted values
+    return values[max(0, math.ceil(q * len(values)) - 1)] if values else 0.0
+
+
+# wall time, self time and calls of dependencies per (class, method), aggregated per request by `ProfilerMiddleware`,
+# percentiles are computed from last `samples` requests
+class Profiler(CallObserver):
+    def __init__(self, samples: int = 1000):
+        self.samples = samples
+        self._stats: Dict[ProfileKey, _Samples] = dict()
+        self._lock = threading.Lock()
+
+    def hooks(self, dependency: Callable, info: CallInfo) -> Tuple[EnterHook, ExitHook]:
+        key = (info.class_name, info.method)
+        dependencies: List[Tuple[CallInfo, ...]] = list()
+
+        def enter():
+            return time.perf_counter(), _nested.get(), _nested.set([0.0])
+
+        def exit(state, error: Optional[BaseException], cache_hit: Optional[bool]):
+            started, parent, token = state
+            ended = time.perf_counter()
+            duration = ended - started
+            nested = _nested.get()[0]
+            _nested.reset(token)
+            if parent is not None:
+                parent[0] += duration
+
+            request = _request.get()
+            if request is None:
+                self._add({key: [1, duration, duration - nested]})
+                return
+
+            if not dependencies:
+                dependencies.append(get_dependencies(dependency))
+            # sub dependencies are resolved by fastapi before dependency is called
+            start = min((request.starts.get(sub, started) for sub in dependencies[0]), default=started)
+            with self._lock:
+                request.starts[info] = start
+                calls = request.calls.setdefault(key, [0, 0.0, 0.0])
+                calls[0] += 1
+                calls[1] += ended - start
+                calls[2] += duration - nested
+
+        return enter, exit
+
+    def add(self, request: RequestProfile):
+        self._add(request.calls)
+
+    def stats(self) -> Dict[ProfileKey, ProfileStats]:
+        with self._lock:
+            items = [
+                (key, samples.calls, sorted(samples.wall), sorted(samples.self)) for key, samples in self._stats.items()
+            ]
+
+        stats = dict()
+        for key, calls, wall, self_ in items:
+            percentiles = [_percentile(values, q) for values in (wall, self_) for q in (0.5, 0.9, 0.99, 1.0)]
+            stats[key] = ProfileStats(calls, len(wall), *percentiles)
+        return stats
+
+    def dump_json(self) -> str:
+        stats = [{"class": cls, "method": method, **data._asdict()} for (cls, method), data in self.stats().items()]
+        return json.dumps(stats, indent=2)
+
+    def dump_text(self) -> str:
+        # milliseconds, sorted by p90 of wall time
+        columns = ("wall_p50", "wall_p90", "wall_p99", "wall_max", "self_p50", "self_p90", "self_p99", "self_max")
+        lines = [f"{'dependency':<40} {'calls':>8} {'samples':>8} " + " ".join(f"{name:>9}" for name in columns)]
+        for (cls, method), stats in sorted(self.stats().items(), key=lambda item: -item[1].wall_p90):
+            name = f"{cls}.{method}" if cls else method
+            times = " ".join(f"{getattr(stats, column) * 1000:>9.3f}" for column in columns)
+            lines.append(f"{name:<40} {stats.calls:>8} {stats.samples:>8} {times}")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def _add(self, calls: Dict[ProfileKey, List[Any]]):
+        with self._lock:
+            for key, (count, wall, self_) in calls.items():
+                samples = self._stats.get(key)
+                if samples is None:
+                    samples = self._stats[key] = _Samples(self.samples)
+                samples.calls += count
+                samples.wall.append(wall)
+                samples.self.append(self_)
+
+
+profiler = Profiler()
+
+
+class ProfilerMiddleware(RequestMiddleware):
+    # ASGI middleware collecting calls of dependencies per request: `app.add_middleware(ProfilerMiddleware)`
+    def __init__(self, app: Callable, profiler: Profiler = profiler):
+        super(ProfilerMiddleware, self).__init__(app)
+        self.profiler = profiler
+
+    @contextmanager
+    def request(self, scope: Dict[str, Any]) -> Iterator[RequestProfile]:
+        request = RequestProfile()
+        token = _request.set(request)
+        try:
+            yield request
+        finally:
+            _request.reset(token)
+            self.profiler.add(request)
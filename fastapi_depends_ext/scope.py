@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import AsyncExitStack
+from inspect import Signature
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Final
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+from weakref import WeakValueDictionary
+
+from fastapi import FastAPI
+from fastapi import params
+from fastapi.dependencies.utils import get_dependant
+from starlette.requests import Request
+
+from fastapi_depends_ext.utils import await_shared
+from fastapi_depends_ext.utils import solve_request
+from fastapi_depends_ext.utils import start_shared
+from fastapi_depends_ext.utils import wrap_call
+
+
+SCOPE_REQUEST: Final = "request"
+SCOPE_APP: Final = "app"
+SCOPES: Final = (SCOPE_REQUEST, SCOPE_APP)
+
+
+def check_scope(scope: str):
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown scope `{scope}`, expected one of: {', '.join(SCOPES)}")
+
+
+# dependencies resolved once per application, teardown of dependencies with `yield` is done on shutdown
+class AppScope:
+    def __init__(self):
+        self._dependencies: Dict[Callable, None] = dict()  # ordered set of registered dependencies
+        # dependencies bound to instance are registered by stable key and referenced weakly,
+        # so instances are not kept alive and value is resolved once for all instances
+        self._bound: "WeakValueDictionary[Hashable, Callable]" = WeakValueDictionary()
+        self._values: Dict[Hashable, asyncio.Future] = dict()
+        self._stack = AsyncExitStack()
+
+    def wrap(self, dependency: Callable, key: Optional[Hashable] = None) -> Callable:
+        async def singleton():
+            return await self.resolve(dependency, key)
+
+        if key is None:
+            self._dependencies[dependency] = None
+        else:
+            self._bound[key] = singleton
+
+        singleton.__app_scoped__ = dependency if key is None else key
+        # without arguments, so fastapi doesn't resolve anything for dependency in request
+        return wrap_call(singleton, dependency, Signature())
+
+    def discard(self, wrapped: Callable):
+        # superseded dependency is not resolved on startup, but it is still resolved on request if it is used
+        key = getattr(wrapped, "__app_scoped__", wrapped)
+        self._dependencies.pop(key, None)
+        self._bound.pop(key, None)
+
+    async def resolve(self, dependency: Callable, key: Optional[Hashable] = None) -> Any:
+        # failed dependency is resolved again on next request
+        key = dependency if key is None else key
+        future = start_shared(self._values, key, lambda: self._solve(dependency), keep_result=True)
+        return await await_shared(future)
+
+    async def startup(self):
+        singletons = list(self._bound.values())
+        resolved = [self.resolve(dependency) for dependency in list(self._dependencies)]
+        await asyncio.gather(*resolved, *(singleton() for singleton in singletons))
+
+    async def shutdown(self):
+        self._values.clear()
+        stack, self._stack = self._stack, AsyncExitStack()
+        await stack.aclose()
+
+    def setup(self, app: FastAPI):
+        app.add_event_handler("startup", self.startup)
+        app.add_event_handler("shutdown", self.shutdown)
+
+    async def _solve(self, dependency: Callable) -> Any:
+        # resolved by fastapi for request without parameters, so sub dependencies can't use request data
+        async def endpoint(value: Any = params.Depends(dependency)):
+            pass
+
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""}
+        dependant = get_dependant(path="/", call=endpoint)
+        values, errors = await solve_request(Request(scope), dependant, stack=self._stack)
+        if errors:
+            name = getattr(dependency, "__qualname__", dependency)
+            raise RuntimeError(f"App scoped dependency `{name}` can't depend on request: {errors}")
+        return values["value"]
+
+
+class AppScoped(NamedTuple):
+    # hashable wrapper, so binder shares one singleton for the same key and dependency
+    scope: AppScope
+    key: Optional[Hashable]
+
+    def __call__(self, dependency: Callable) -> Callable:
+        return self.scope.wrap(dependency, self.key)
+
+
+app_scope = AppScope()
@@ -0,0 +1,164 @@
+import json
+import secrets
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from fastapi_depends_ext.hooks import CallInfo
+from fastapi_depends_ext.hooks import CallObserver
+from fastapi_depends_ext.hooks import EnterHook
+from fastapi_depends_ext.hooks import ExitHook
+from fastapi_depends_ext.hooks import RequestMiddleware
+from fastapi_depends_ext.hooks import get_dependencies
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes", "start", "end", "error")
+
+    def __init__(self, trace_id: str, name: str, parent_id: str = None, attributes: Dict[str, Any] = None):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes or dict()
+        self.start = time.time()  # seconds since epoch, extended to start of the first sub dependency
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None  # name of exception class
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r}, span_id={self.span_id!r}, parent_id={self.parent_id!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, spans: Sequence[Span]):
+        pass
+
+
+class InMemoryExporter(SpanExporter):
+    def __init__(self, maxlen: int = 10000):
+        self.spans: Deque[Span] = deque(maxlen=maxlen)
+
+    def export(self, spans: Sequence[Span]):
+        self.spans.extend(spans)
+
+    def clear(self):
+        self.spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    # appends spans to file, one JSON object per line
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]):
+        lines = "".join(json.dumps(span.as_dict()) + "\n" for span in spans)
+        with self._lock, open(self.path, "a") as file:
+            file.write(lines)
+
+
+class Trace:
+    # spans of one request, they are exported when request is done
+    def __init__(self, name: str):
+        self.root = Span(secrets.token_hex(16), name)
+        self.spans: List[Span] = list()
+        self.last: Dict[CallInfo, Span] = dict()  # span of last call of dependency
+
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("fastapi_depends_ext_trace", default=None)
+_current: ContextVar[Optional[Span]] = ContextVar("fastapi_depends_ext_span", default=None)
+
+
+# opens span for every call of dependency, fastapi resolves sub dependencies before dependency is called,
+# so span of sub dependency gets parent when dependency depending on it is done
+class Tracer(CallObserver):
+    def __init__(self, exporter: SpanExporter = None):
+        self.exporter = exporter or InMemoryExporter()
+        self._lock = threading.Lock()
+
+    def hooks(self, dependency: Callable, info: CallInfo) -> Tuple[EnterHook, ExitHook]:
+        name = f"{info.class_name}.{info.method}" if info.class_name else info.method
+        dependencies: List[Tuple[CallInfo, ...]] = list()
+
+        def enter():
+            trace, parent = _trace.get(), _current.get()
+            trace_id = trace.root.trace_id if trace else secrets.token_hex(16)
+            attributes = {"class": info.class_name, "method": info.method, "from_super": info.from_super}
+            span = Span(trace_id, name, parent.span_id if parent else None, attributes)
+            return span, _current.set(span)
+
+        def exit(state, error: Optional[BaseException], cache_hit: Optional[bool]):
+            span, token = state
+            _current.reset(token)
+            span.end = time.time()
+            span.error = type(error).__name__ if error is not None else None
+            span.attributes["cache"] = "none" if cache_hit is None else "hit" if cache_hit else "miss"
+
+            trace = _trace.get()
+            if trace is None:
+                self.exporter.export([span])
+                return
+
+            if not dependencies:
+                dependencies.append(get_dependencies(dependency))
+            with self._lock:
+                for sub in dependencies[0]:
+                    child = trace.last.get(sub)
+                    if child is not None and child.parent_id is None:
+                        child.parent_id = span.span_id
+                        span.start = min(span.start, child.start)
+                trace.last[info] = span
+                trace.spans.append(span)
+
+        return enter, exit
+
+    def finish(self, trace: Trace, error: BaseException = None):
+        root = trace.root
+        root.end = time.time()
+        root.error = type(error).__name__ if error is not None else None
+        with self._lock:
+            for span in trace.spans:
+                if span.parent_id is None:
+                    span.parent_id = root.span_id
+            spans = [root] + trace.spans
+        self.exporter.export(spans)
+
+
+tracer = Tracer()
+
+
+class TracingMiddleware(RequestMiddleware):
+    # ASGI middleware collecting spans of request: `app.add_middleware(TracingMiddleware)`
+    def __init__(self, app: Callable, tracer: Tracer = tracer):
+        super(TracingMiddleware, self).__init__(app)
+        self.tracer = tracer
+
+    @contextmanager
+    def request(self, scope: Dict[str, Any]) -> Iterator[Trace]:
+        trace = Trace(f"{scope['method']} {scope['path']}")
+        token, error = _trace.set(trace), None
+        try:
+            yield trace
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            _trace.reset(token)
+            self.tracer.finish(trace, error)
@@ -1,18 +1,246 @@
+import asyncio
 import functools
 import inspect
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import AsyncExitStack
 from inspect import Signature
 from types import FunctionType
 from types import MethodType
+from typing import Any
+from typing import Awaitable
 from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
+from weakref import WeakKeyDictionary
 
+from fastapi.dependencies.models import Dependant
 from fastapi.dependencies.utils import get_typed_signature
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.dependencies.utils import is_gen_callable
+from fastapi.dependencies.utils import solve_dependencies
+from starlette.requests import Request
+
+from fastapi_depends_ext.instrumentation import Measure
+from fastapi_depends_ext.instrumentation import listeners
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# LRU cache of `get_typed_signature`: functions are referenced weakly,
+# entry is valid while function has the same code and defaults
+class SignatureCache:
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[weakref.ref, bool], Tuple[Any, Signature]]" = OrderedDict()
+        self._removed: List[weakref.ref] = list()
+
+    def get(self, call: Callable) -> Signature:
+        bound = inspect.ismethod(call)
+        target = call.__func__ if bound else call
+        version = (target.__code__, target.__defaults__, target.__kwdefaults__) if inspect.isfunction(target) else None
+
+        try:
+            key = (weakref.ref(target), bound)
+        except TypeError:
+            self.misses += 1
+            return get_typed_signature(call)
+
+        with self._lock:
+            self._purge()
+            entry = self._entries.get(key)
+            if entry is not None and self._is_same_version(entry[0], version):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        signature = get_typed_signature(call)
+        with self._lock:
+            key = (weakref.ref(target, self._remove), bound)
+            self._entries[key] = (version, signature)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return signature
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._removed.clear()
+            self.hits = self.misses = 0
+
+    def _remove(self, ref: weakref.ref):
+        # called by gc at any moment, so entries are removed on next access
+        self._removed.append(ref)
+
+    def _purge(self):
+        while self._removed:
+            ref = self._removed.pop()
+            self._entries.pop((ref, False), None)
+            self._entries.pop((ref, True), None)
+
+    @staticmethod
+    def _is_same_version(version, other) -> bool:
+        if version is None or other is None:
+            return version is other
+        return all(a is b for a, b in zip(version, other))
+
+
+signature_cache = SignatureCache()
+
+
+def get_signature(call: Callable) -> Signature:
+    return signature_cache.get(call)
+
+
+def signature_cache_info() -> CacheInfo:
+    return signature_cache.info()
+
+
+def signature_cache_clear():
+    signature_cache.clear()
+
+
+def wrap_call(wrapper: Callable, call: Callable, signature: Signature = None) -> Callable:
+    # fastapi resolves arguments of wrapper by `__signature__`, so wrapper is called with arguments of `call`
+    wrapper.__signature__ = get_signature(call) if signature is None else signature
+    wrapper.__name__ = getattr(call, "__name__", type(call).__name__)
+    wrapper.__qualname__ = getattr(call, "__qualname__", wrapper.__name__)
+    wrapper.__doc__ = getattr(call, "__doc__", None)
+    return wrapper
+
+
+def weak_method(method: MethodType) -> Callable:
+    # function calling method with instance referenced weakly, instance storing it doesn't reference itself
+    func, ref = method.__func__, weakref.ref(method.__self__)
+
+    if is_coroutine_callable(method):
+
+        async def weak(*args, **kwargs):
+            return await func(_get_instance(ref, func), *args, **kwargs)
+
+    elif is_gen_callable(method):
+
+        def weak(*args, **kwargs):
+            return (yield from func(_get_instance(ref, func), *args, **kwargs))
+
+    elif is_async_gen_callable(method):
+
+        async def weak(*args, **kwargs):
+            # the same as `yield from`, so fastapi can throw exception of request into generator
+            generator = func(_get_instance(ref, func), *args, **kwargs)
+            try:
+                value = await generator.__anext__()
+                while True:
+                    try:
+                        sent = yield value
+                    except GeneratorExit:
+                        await generator.aclose()
+                        raise
+                    except BaseException as exc:
+                        value = await generator.athrow(exc)
+                    else:
+                        value = await generator.asend(sent)
+            except StopAsyncIteration:
+                return
+
+    else:
+
+        def weak(*args, **kwargs):
+            return func(_get_instance(ref, func), *args, **kwargs)
+
+    weak = wrap_call(weak, method)
+    weak.__module__ = getattr(func, "__module__", None)
+    weak.__func__ = func
+    weak.__weak_self__ = ref
+    return weak
+
+
+def _get_instance(ref: weakref.ref, func: Callable) -> Any:
+    instance = ref()
+    if instance is None:
+        qualname = getattr(func, "__qualname__", func)
+        raise ReferenceError(f"Instance of method `{qualname}` is already garbage collected")
+    return instance
+
+
+def make_call_key(call: Callable, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    # None for unhashable arguments, such call can't be identified
+    key = (call, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def start_shared(
+    futures: Dict[Hashable, asyncio.Future], key: Hashable, factory: Callable[[], Awaitable], keep_result: bool = False
+) -> asyncio.Future:
+    # awaitable is started once per key and is shared by callers until it is done,
+    # with `keep_result` successful result is kept in `futures`, failed is started again by next caller
+    future = futures.get(key)
+    if future is None:
+        future = futures[key] = asyncio.ensure_future(factory())
+        future.add_done_callback(functools.partial(_forget_shared, futures, key, keep_result))
+    return future
+
+
+def _forget_shared(futures: Dict[Hashable, asyncio.Future], key: Hashable, keep_result: bool, future: asyncio.Future):
+    if keep_result and not future.cancelled() and future.exception() is None:
+        return
+    if futures.get(key) is future:
+        del futures[key]
+
+
+async def await_shared(future: asyncio.Future) -> Any:
+    # cancellation of one caller must not cancel future shared with other callers
+    return await asyncio.shield(future)
+
+
+async def solve_request(
+    request: Request, dependant: Dependant, dependency_overrides_provider: Any = None, stack: AsyncExitStack = None
+) -> Tuple[Dict[str, Any], List]:
+    # the only call of private `solve_dependencies`: fastapi <0.106 returns tuple and takes exit stack for teardown
+    # of dependencies with `yield` from `fastapi_astack` of request scope, newer versions changed both (pyproject.toml)
+    if stack is not None:
+        request.scope["fastapi_astack"] = stack
+    values, errors, *_ = await solve_dependencies(
+        request=request,
+        dependant=dependant,
+        dependency_overrides_provider=dependency_overrides_provider,
+        dependency_cache=dict(),
+    )
+    return values, errors
+
+
+def _is_method_descriptor(func) -> bool:
+    return hasattr(type(func), "__get__") and hasattr(func, "__func__")
 
 
 def _get_func(instance, func) -> callable:
     if type(func) is property:
         return _get_func(instance, func.fget(instance))
-    elif type(func) in (classmethod, staticmethod) or inspect.ismethod(func):
+    elif type(func) in (classmethod, staticmethod) or inspect.ismethod(func) or _is_method_descriptor(func):
         f = func.__func__
         if hasattr(f, "__origin__"):
             return _get_func(instance, f.__origin__)
@@ -24,11 +252,89 @@ def _get_func(instance, func) -> callable:
         raise TypeError(f"Incorrect type of `{func}`")
 
 
+class MroIndex:
+    # results of `get_base_class` and `get_super_for_method` per class,
+    # every entry is checked with current class attributes before use, so modified classes are resolved again
+    def __init__(self):
+        self._base_classes: "WeakKeyDictionary[type, Dict[Tuple[str, Callable], type]]" = WeakKeyDictionary()
+        self._super_classes: "WeakKeyDictionary[type, Dict[Tuple[str, type], Tuple[type, tuple, tuple]]]" = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get_base_class(self, instance: object, method_name: str, method_target: [type, Callable]) -> Optional[type]:
+        try:
+            func = _get_func(instance, method_target)
+        except TypeError:
+            func = None
+
+        if not inspect.isfunction(func):
+            return _find_base_class(instance, method_name, method_target)
+
+        classes = self._get_classes(self._base_classes, type(instance))
+        key = (method_name, func)
+        base_class = classes.get(key)
+        if base_class is not None:
+            method_cls = base_class.__dict__.get(method_name)
+            if method_cls is not None and type(method_cls) is not property and _get_func(instance, method_cls) is func:
+                return base_class
+            classes.pop(key, None)
+
+        base_class = _find_base_class(instance, method_name, method_target)
+        if base_class is not None and type(base_class.__dict__[method_name]) is not property:
+            classes[key] = base_class
+        return base_class
+
+    def get_super_for_method(self, base_class: type, method_name: str, super_from: type = None) -> type:
+        super_from = super_from or base_class
+        classes = self._get_classes(self._super_classes, base_class)
+        key = (method_name, super_from)
+        mro = inspect.getmro(base_class)
+        entry = classes.get(key)
+        if entry is not None:
+            # result depends on attribute `method_name` of every class in mro, any of them can be changed
+            super_class, entry_mro, attrs = entry
+            if entry_mro == mro and all(cls.__dict__.get(method_name) is attr for cls, attr in zip(mro, attrs)):
+                return super_class
+
+        super_class = _find_super_for_method(base_class, method_name, super_from)
+        classes[key] = (super_class, mro, tuple(cls.__dict__.get(method_name) for cls in mro))
+        return super_class
+
+    def clear(self):
+        with self._lock:
+            self._base_classes.clear()
+            self._super_classes.clear()
+
+    def _get_classes(self, index: WeakKeyDictionary, cls: type) -> dict:
+        # entries of class are set without lock, any thread stores the same result for the same key
+        classes = index.get(cls)
+        if classes is None:
+            with self._lock:
+                classes = index.get(cls)
+                if classes is None:
+                    classes = index[cls] = dict()
+        return classes
+
+
+mro_index = MroIndex()
+
+
 def get_base_class(instance: object, method_name: str, method_target: [type, Callable]) -> Optional[type]:
+    return mro_index.get_base_class(instance, method_name, method_target)
+
+
+def get_super_for_method(base_class: type, method_name: str, super_from: type = None) -> type:
+    return mro_index.get_super_for_method(base_class, method_name, super_from)
+
+
+def _find_base_class(instance: object, method_name: str, method_target: [type, Callable]) -> Optional[type]:
     for cls in inspect.getmro(type(instance)):
         method_cls = cls.__dict__.get(method_name)
         if method_cls is None:  # check to None cause can be not callable like property object (not property value)
             continue
+        elif getattr(method_cls, "__owner__", None) not in (None, cls):  # descriptor of method inherited from base
+            continue
 
         _func_class = _get_func(instance, method_cls)
         _func_target = _get_func(instance, method_target)
@@ -36,8 +342,7 @@ def get_base_class(instance: object, method_name: str, method_target: [type, Cal
             return cls
 
 
-def get_super_for_method(base_class: type, method_name: str, super_from: type = None) -> type:
-    super_from = super_from or base_class
+def _find_super_for_method(base_class: type, method_name: str, super_from: type) -> type:
     mro = list(inspect.getmro(base_class))
 
     super_class_for_method = None
@@ -61,32 +366,74 @@ def get_super_for_method(base_class: type, method_name: str, super_from: type =
     raise AttributeError(f"super({super_from.__name__}, {base_class.__name__}) has not method `{method_name}`")
 
 
-# todo: split to clone and patch_defaults
+class FunctionLayout:
+    # arguments of function code, computed once per function and shared with its patched copies
+    def __init__(self, func: FunctionType):
+        code = func.__code__
+        self.code = code
+        self.args = code.co_varnames[: code.co_argcount]
+        self.args_index = {arg: index for index, arg in enumerate(self.args)}
+        self.kwonlyargs = code.co_varnames[code.co_argcount : code.co_argcount + code.co_kwonlyargcount]
+
+        variables = bool(code.co_flags & inspect.CO_VARARGS) + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        self.parameters = frozenset(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount + variables])
+        self.parameters_bound = self.parameters - set(self.args[:1])
+
+
+_layouts: "WeakKeyDictionary[FunctionType, FunctionLayout]" = WeakKeyDictionary()
+_layouts_lock = threading.Lock()
+
+
+def get_function_layout(func: FunctionType) -> FunctionLayout:
+    origin = getattr(func, "__origin__", func)
+    layout = _layouts.get(origin)
+    if layout is None or layout.code is not func.__code__:
+        layout = FunctionLayout(func)
+        if origin.__code__ is func.__code__:
+            with _layouts_lock:
+                current = _layouts.get(origin)
+                if current is None or current.code is not func.__code__:
+                    _layouts[origin] = layout
+                else:
+                    layout = current
+    return layout
+
+
 def patch_defaults(origin: Callable, **kwargs) -> Callable:
-    signature: Signature = get_typed_signature(origin)
-    for keyword, dependency in kwargs.items():
-        if keyword not in signature.parameters:
+    if listeners:
+        func = origin.__func__ if inspect.ismethod(origin) else origin
+        cls = type(origin.__self__) if func is not origin else None
+        cache_hit = getattr(func, "__origin__", func) in _layouts
+        with Measure("patch_defaults", cls, getattr(origin, "__name__", ""), cache_hit=cache_hit):
+            return _patch_defaults(origin, **kwargs)
+    return _patch_defaults(origin, **kwargs)
+
+
+# todo: split to clone and patch_defaults
+def _patch_defaults(origin: Callable, **kwargs) -> Callable:
+    func = origin.__func__ if inspect.ismethod(origin) else origin
+    layout = get_function_layout(func)
+    parameters = layout.parameters if func is origin else layout.parameters_bound
+    for keyword in kwargs:
+        if keyword not in parameters:
             raise KeyError(
                 f"Trying to provide for method `{origin.__name__}` not existing keyword argument `{keyword}`"
             )
 
-    func = origin
-    if inspect.ismethod(origin):
-        func = func.__func__
-
-    defaults = func.__defaults__ and list(func.__defaults__)
-    func_args = func.__code__.co_varnames[: func.__code__.co_argcount]
-    args_change_defaults_keys = [key for key in func_args if key in kwargs]
-    if func_args and args_change_defaults_keys:
-        args_have_defaults = func_args[-(len(func.__defaults__)) :] if func.__defaults__ else []
-        args_can_change_defaults = set(kwargs) | set(args_have_defaults)
-        args_change_defaults_from = min(func_args.index(key) for key in args_change_defaults_keys if key in func_args)
-        args_change_defaults = func_args[args_change_defaults_from:]
+    defaults = list(func.__defaults__) if func.__defaults__ else list()
+    args_change_defaults_keys = [key for key in kwargs if key in layout.args_index]
+    if args_change_defaults_keys:
+        args_have_defaults = layout.args[len(layout.args) - len(defaults) :] if defaults else ()
+        args_can_change_defaults = set(kwargs).union(args_have_defaults)
+        args_change_defaults_from = min(layout.args_index[key] for key in args_change_defaults_keys)
+        args_change_defaults = layout.args[args_change_defaults_from:]
         if not all(key in args_can_change_defaults for key in args_change_defaults):
             raise AttributeError("Trying to set default for argument before arguments with default values")
 
-        defaults_not_changed = defaults[: -len(args_change_defaults)] if defaults else list()
-        defaults_changes = [kwargs.get(key) or defaults[args_have_defaults.index(key)] for key in args_change_defaults]
+        defaults_not_changed = defaults[: -len(args_change_defaults)]
+        defaults_changes = [
+            kwargs[key] if key in kwargs else defaults[args_have_defaults.index(key)] for key in args_change_defaults
+        ]
         defaults = defaults_not_changed + defaults_changes
 
     patched = FunctionType(
@@ -97,20 +444,20 @@ def patch_defaults(origin: Callable, **kwargs) -> Callable:
         closure=func.__closure__,
     )
 
-    patched = functools.update_wrapper(patched, func)
-    delattr(patched, "__wrapped__")  # prevent fastapi to use as target dependency __wrapped__ method
-    setattr(patched, "__origin__", func)
-
-    kwdefaults = func.__kwdefaults__.copy() if func.__kwdefaults__ else dict()
-    kwdefaults.update({k: kwargs[k] for k in set(kwargs) if k in kwdefaults})
-    if func.__code__.co_kwonlyargcount:
-        _from = func.__code__.co_argcount + func.__code__.co_posonlyargcount
-        _to = -func.__code__.co_kwonlyargcount
-        kwonlyargs = func.__code__.co_varnames[_from:_to]
-        kwdefaults.update({key: kwargs[key] for key in kwonlyargs if key in kwargs})
+    # the same as `functools.update_wrapper` but without `__wrapped__` to prevent fastapi to use it as dependency
+    patched.__module__ = func.__module__
+    patched.__qualname__ = func.__qualname__
+    patched.__doc__ = func.__doc__
+    patched.__annotations__ = func.__annotations__
+    patched.__dict__.update(func.__dict__)
+    patched.__dict__.pop("__wrapped__", None)
+    patched.__origin__ = getattr(func, "__origin__", func)  # always original function to keep chain flat
+
+    kwdefaults = dict(func.__kwdefaults__) if func.__kwdefaults__ else dict()
+    kwdefaults.update({key: kwargs[key] for key in layout.kwonlyargs if key in kwargs})
     patched.__kwdefaults__ = kwdefaults or None
 
-    if inspect.ismethod(origin):
+    if func is not origin:
         patched = MethodType(patched, origin.__self__)
 
     return patched
@@ -0,0 +1,116 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from fastapi_depends_ext.batch import BatchInfo
+from fastapi_depends_ext.batch import BatchLoader
+from tests.utils_for_tests import run
+
+
+def make_loader(**kwargs):
+    batches = []
+
+    async def load_many(keys: List[int]) -> List[int]:
+        batches.append(keys)
+        return [key * 10 for key in keys]
+
+    return BatchLoader(load_many, **kwargs), batches
+
+
+def test_load__concurrent_keys_loaded_by_one_batch():
+    loader, batches = make_loader()
+
+    results = run(asyncio.gather(loader.load(1), loader.load(2), loader.load(1)))
+
+    assert results == [10, 20, 10]
+    assert batches == [[1, 2]]
+    assert loader.info() == BatchInfo(batches=1, keys=2, pending=0)
+
+
+def test_load__sequential_keys_loaded_by_separate_batches():
+    loader, batches = make_loader()
+
+    assert run(loader.load(1)) == 10
+    assert run(loader.load(2)) == 20
+    assert batches == [[1], [2]]
+
+
+def test_load__window__later_keys_in_the_same_batch():
+    loader, batches = make_loader(window=0.01)
+
+    async def load_later(key: int):
+        await asyncio.sleep(0.001)
+        return await loader.load(key)
+
+    assert run(asyncio.gather(loader.load(1), load_later(2))) == [10, 20]
+    assert batches == [[1, 2]]
+
+
+def test_load__max_batch_size():
+    loader, batches = make_loader(max_batch_size=2)
+
+    assert run(asyncio.gather(*(loader.load(key) for key in range(5)))) == [0, 10, 20, 30, 40]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_load__mapping_results():
+    async def load_many(keys: List[int]):
+        return {key: str(key) for key in keys if key != 3}
+
+    loader = BatchLoader(load_many)
+    results = run(asyncio.gather(loader.load(1), loader.load(3), return_exceptions=True))
+
+    assert results[0] == "1"
+    assert isinstance(results[1], KeyError)
+
+
+def test_load__wrong_results_count__error():
+    async def load_many(keys: List[int]):
+        return []
+
+    with pytest.raises(ValueError, match="returned 0 results for 1 keys"):
+        run(BatchLoader(load_many).load(1))
+
+
+def test_load__exception_set_for_all_keys():
+    async def load_many(keys: List[int]):
+        raise RuntimeError
+
+    loader = BatchLoader(load_many)
+    results = run(asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True))
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+
+def test_load__task_referenced_while_loading():
+    async def load_many(keys: List[int]):
+        await asyncio.sleep(0.01)
+        return keys
+
+    loader = BatchLoader(load_many)
+
+    async def main():
+        result = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0.001)
+        assert len(loader._tasks) == 1
+        return await result
+
+    assert run(main()) == 1
+    assert not loader._tasks
+
+
+def test_load__load_cancelled__waiting_requests_cancelled():
+    async def load_many(keys: List[int]):
+        await asyncio.sleep(1)
+
+    loader = BatchLoader(load_many)
+
+    async def main():
+        results = asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        await asyncio.sleep(0.001)
+        for task in loader._tasks:
+            task.cancel()
+        return await asyncio.wait_for(results, 1)
+
+    assert [type(result) for result in run(main())] == [asyncio.CancelledError, asyncio.CancelledError]
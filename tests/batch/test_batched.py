@@ -0,0 +1,87 @@
+import asyncio
+from typing import List
+
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.batch import BATCH_LOADERS_ATTR
+from fastapi_depends_ext.batch import batched
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import resolve
+from tests.utils_for_tests import run
+from tests.utils_for_tests import solve
+
+
+class Users(DependsAttrBinder):
+    def __init__(self):
+        self.batches = []
+        super(Users, self).__init__()
+
+    async def user_id(self, user_id: int = Query()) -> int:
+        return user_id
+
+    @batched(DependsAttr("user_id"))
+    async def load_user(self, user_ids: List[int]) -> List[str]:
+        """Load users"""
+        self.batches.append(user_ids)
+        return [f"user {user_id}" for user_id in user_ids]
+
+    async def user(self, user: str = DependsAttr("load_user")):
+        return user
+
+
+def test_batched__metadata():
+    assert Users.load_user.__name__ == "load_user"
+    assert Users.load_user.__doc__ == "Load users"
+    assert Users.load_user.load_many.__name__ == "load_user"
+
+
+def test_batched__key_depends_bound():
+    instance = Users()
+    depends = get_signature(instance.load_user).parameters["key"].default
+
+    assert depends.dependency == instance.user_id
+
+
+def test_batched__request_resolved():
+    instance = Users()
+
+    assert solve(instance.user, b"user_id=1") == {"user": "user 1"}
+
+
+def test_batched__concurrent_requests_loaded_by_one_batch():
+    instance = Users()
+    requests = asyncio.gather(*(resolve(instance.user, f"user_id={user_id}".encode()) for user_id in (1, 2, 1)))
+
+    assert run(requests) == [
+        {"user": "user 1"},
+        {"user": "user 2"},
+        {"user": "user 1"},
+    ]
+    assert instance.batches == [[1, 2]]
+
+
+def test_batched__loader_per_instance():
+    instances = Users(), Users()
+    for instance in instances:
+        solve(instance.user, b"user_id=1")
+
+    loaders = [instance.__dict__[BATCH_LOADERS_ATTR] for instance in instances]
+    assert loaders[0] is not loaders[1]
+    assert [instance.batches for instance in instances] == [[[1]], [[1]]]
+
+
+def test_batched__request_parameter_key():
+    class TestClass(DependsAttrBinder):
+        @batched(Query(alias="user_id"), annotation=int)
+        async def load_user(self, user_ids: List[int]) -> List[int]:
+            return [user_id * 10 for user_id in user_ids]
+
+    instance = TestClass()
+
+    async def endpoint(user: int = Depends(instance.load_user)):
+        pass
+
+    assert solve(endpoint, b"user_id=2") == {"user": 20}
@@ -0,0 +1,68 @@
+from fastapi_depends_ext.cache import _MISSING
+from fastapi_depends_ext.cache import ResultCache
+from fastapi_depends_ext.utils import CacheInfo
+
+
+class Timer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get__missing():
+    cache = ResultCache()
+
+    assert cache.get("key") is _MISSING
+    assert cache.info() == CacheInfo(hits=0, misses=1, maxsize=128, currsize=0)
+
+
+def test_get__stored():
+    cache = ResultCache()
+    cache.set("key", None)
+
+    assert cache.get("key") is None
+    assert cache.info() == CacheInfo(hits=1, misses=0, maxsize=128, currsize=1)
+
+
+def test_get__expired():
+    timer = Timer()
+    cache = ResultCache(ttl=10, timer=timer)
+    cache.set("key", 1)
+
+    timer.now = 9.9
+    assert cache.get("key") == 1
+
+    timer.now = 10
+    assert cache.get("key") is _MISSING
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=128, currsize=0)
+
+
+def test_get__ttl_none__never_expired():
+    timer = Timer()
+    cache = ResultCache(ttl=None, timer=timer)
+    cache.set("key", 1)
+    timer.now = 10**9
+
+    assert cache.get("key") == 1
+
+
+def test_get__lru_evicted():
+    cache = ResultCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is _MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_get__key_none__not_cached():
+    cache = ResultCache()
+    cache.set(None, 1)
+
+    assert cache.get(None) is _MISSING
+    assert cache.info().currsize == 0
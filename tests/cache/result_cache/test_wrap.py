@@ -0,0 +1,88 @@
+import asyncio
+from typing import List
+
+import pytest
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.cache import ResultCache
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import run
+from tests.utils_for_tests import solve
+
+
+def test_wrap__signature_of_dependency():
+    def dependency(page: int = Query(1)) -> int:
+        return page
+
+    assert get_signature(ResultCache().wrap(dependency)) == get_signature(dependency)
+
+
+def test_wrap__sync__cached_by_arguments():
+    calls = []
+
+    def dependency(page: int = Query(1)) -> int:
+        calls.append(page)
+        return page
+
+    cache = ResultCache()
+    cached = cache.wrap(dependency)
+
+    async def endpoint(page: int = Depends(cached)):
+        pass
+
+    assert solve(endpoint, b"page=1") == {"page": 1}
+    assert solve(endpoint, b"page=1") == {"page": 1}
+    assert solve(endpoint, b"page=2") == {"page": 2}
+    assert calls == [1, 2]
+    assert cache.info().hits == 1
+
+
+def test_wrap__async__cached_by_arguments():
+    calls = []
+
+    async def dependency(page: int = Query(1)) -> int:
+        calls.append(page)
+        return page
+
+    cached = ResultCache().wrap(dependency)
+
+    assert asyncio.iscoroutinefunction(cached)
+    assert run(cached(page=1)) == 1
+    assert run(cached(page=1)) == 1
+    assert calls == [1]
+
+
+def test_wrap__unhashable_arguments__not_cached():
+    calls = []
+
+    def dependency(pages: List[int] = Query([1])):
+        calls.append(pages)
+        return pages
+
+    cached = ResultCache().wrap(dependency)
+    cached(pages=[1])
+    cached(pages=[1])
+
+    assert len(calls) == 2
+
+
+def test_wrap__exception__not_cached():
+    cache = ResultCache()
+
+    def dependency():
+        raise ValueError
+
+    cached = cache.wrap(dependency)
+    with pytest.raises(ValueError):
+        cached()
+
+    assert cache.info().currsize == 0
+
+
+def test_wrap__generator__error():
+    def dependency():
+        yield 1
+
+    with pytest.raises(TypeError, match="can't be cached"):
+        ResultCache().wrap(dependency)
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from fastapi import Query
+
+from fastapi_depends_ext.coalesce import FlightInfo
+from fastapi_depends_ext.coalesce import SingleFlight
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import run
+
+
+def test_wrap__signature_of_dependency():
+    async def dependency(page: int = Query(1)) -> int:
+        return page
+
+    assert get_signature(SingleFlight().wrap(dependency)) == get_signature(dependency)
+
+
+def test_wrap__concurrent_calls_coalesced():
+    calls = []
+
+    async def dependency(page: int):
+        calls.append(page)
+        await asyncio.sleep(0.01)
+        return page
+
+    flight = SingleFlight()
+    coalesced = flight.wrap(dependency)
+
+    results = run(asyncio.gather(coalesced(page=1), coalesced(page=1), coalesced(page=2)))
+
+    assert results == [1, 1, 2]
+    assert calls == [1, 2]
+    assert flight.info() == FlightInfo(calls=2, shared=1, in_flight=0)
+
+
+def test_wrap__sequential_calls_not_coalesced():
+    calls = []
+
+    async def dependency():
+        calls.append(1)
+
+    coalesced = SingleFlight().wrap(dependency)
+    run(coalesced())
+    run(coalesced())
+
+    assert len(calls) == 2
+
+
+def test_wrap__sync_dependency_run_in_threadpool():
+    calls = []
+
+    def dependency(page: int):
+        calls.append(page)
+        return page
+
+    coalesced = SingleFlight().wrap(dependency)
+
+    assert asyncio.iscoroutinefunction(coalesced)
+    assert run(asyncio.gather(coalesced(page=1), coalesced(page=1))) == [1, 1]
+    assert calls == [1]
+
+
+def test_wrap__exception_shared():
+    async def dependency():
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    flight = SingleFlight()
+    coalesced = flight.wrap(dependency)
+    results = run(asyncio.gather(coalesced(), coalesced(), return_exceptions=True))
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flight.info() == FlightInfo(calls=1, shared=1, in_flight=0)
+
+
+def test_wrap__cancelled_waiter__shared_call_not_cancelled():
+    async def dependency():
+        await asyncio.sleep(0.01)
+        return 1
+
+    coalesced = SingleFlight().wrap(dependency)
+
+    async def main():
+        first = asyncio.ensure_future(coalesced())
+        second = asyncio.ensure_future(coalesced())
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert run(main()) == 1
+
+
+def test_wrap__unhashable_arguments__not_coalesced():
+    calls = []
+
+    async def dependency(pages: list):
+        calls.append(pages)
+        await asyncio.sleep(0.01)
+
+    coalesced = SingleFlight().wrap(dependency)
+    run(asyncio.gather(coalesced(pages=[1]), coalesced(pages=[1])))
+
+    assert len(calls) == 2
+
+
+def test_wrap__generator__error():
+    async def dependency():
+        yield 1
+
+    with pytest.raises(TypeError, match="can't be coalesced"):
+        SingleFlight().wrap(dependency)
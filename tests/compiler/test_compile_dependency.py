@@ -0,0 +1,170 @@
+from typing import List
+
+import pytest
+
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi import Query
+from fastapi import Request
+from fastapi import Security
+from fastapi.dependencies.utils import get_dependant
+
+from fastapi_depends_ext.compiler import compile_dependency
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import solve
+
+
+class Items(DependsAttrBinder):
+    def __init__(self):
+        self.calls = []
+        super(Items, self).__init__()
+
+    async def get_page(self, page: int = Query(1)) -> int:
+        self.calls.append("get_page")
+        return page
+
+    async def get_size(self, size: int = Query(10)) -> int:
+        self.calls.append("get_size")
+        return size
+
+    def get_slice(self, page: int = DependsAttr("get_page"), size: int = DependsAttr("get_size")) -> slice:
+        self.calls.append("get_slice")
+        return slice(page * size, (page + 1) * size)
+
+    async def get_offset(self, items_slice: slice = DependsAttr("get_slice")) -> int:
+        self.calls.append("get_offset")
+        return items_slice.start
+
+    async def items(
+        self,
+        items_slice: slice = DependsAttr("get_slice"),
+        offset: int = DependsAttr("get_offset"),
+        reverse: bool = Query(False),
+    ) -> List[int]:
+        self.calls.append("items")
+        items = list(range(100))[items_slice]
+        return [offset, *(items[::-1] if reverse else items)]
+
+
+def count_dependants(call) -> int:
+    dependant = get_dependant(path="/", call=call)
+    return sum(1 + count_dependants(sub.call) for sub in dependant.dependencies)
+
+
+def test_compile_dependency__only_leaves_visible():
+    instance = Items()
+    compiled = compile_dependency(instance.items)
+    parameters = get_signature(compiled).parameters
+
+    assert list(parameters) == ["_dependency_0", "_dependency_1", "reverse", "_request"]
+    assert parameters["_dependency_0"].default.dependency == instance.get_page
+    assert parameters["_dependency_1"].default.dependency == instance.get_size
+    assert count_dependants(compiled) == 2
+    # items -> get_slice -> (get_page, get_size), items -> get_offset -> get_slice -> (get_page, get_size)
+    assert count_dependants(instance.items) == 7
+
+
+def test_compile_dependency__result_the_same():
+    instance = Items()
+
+    async def endpoint(items=Depends(instance.items)):
+        pass
+
+    async def endpoint_compiled(items=Depends(compile_dependency(instance.items))):
+        pass
+
+    expected = solve(endpoint, b"page=2&size=3&reverse=true")
+    calls = list(instance.calls)
+    instance.calls.clear()
+
+    assert solve(endpoint_compiled, b"page=2&size=3&reverse=true") == expected == {"items": [6, 8, 7, 6]}
+    assert sorted(instance.calls) == sorted(calls)
+
+
+def test_compile_dependency__use_cache_false__called_again():
+    calls = []
+
+    def dependency() -> int:
+        calls.append(1)
+        return len(calls)
+
+    def root(a: int = Depends(dependency, use_cache=False), b: int = Depends(dependency, use_cache=False)):
+        return a, b
+
+    async def endpoint(value=Depends(compile_dependency(root))):
+        pass
+
+    assert solve(endpoint) == {"value": (1, 2)}
+
+
+def test_compile_dependency__leaves_kept():
+    def request_dependency(request: Request):
+        return request.method
+
+    def generator():
+        yield "generator"
+
+    def security():
+        return "security"
+
+    def root(
+        method: str = Depends(request_dependency),
+        generated: str = Depends(generator),
+        secured: str = Security(security),
+    ):
+        return method, generated, secured
+
+    parameters = get_signature(compile_dependency(root)).parameters
+
+    assert parameters["_dependency_0"].default.dependency is request_dependency
+    assert parameters["_dependency_1"].default.dependency is generator
+    assert isinstance(parameters["secured"].default, Security().__class__)
+
+
+def test_compile_dependency__leaf_name_not_conflicted():
+    def dependency(page: int = Query(1)):
+        return page
+
+    def root(_dependency_0: int = Query(), value: int = Depends(dependency)):
+        return _dependency_0, value
+
+    assert list(get_signature(compile_dependency(root)).parameters) == ["_dependency_0", "_dependency_1", "_request"]
+
+
+def test_compile_dependency__request_name_not_conflicted():
+    def root(_request: int = Query()):
+        return _request
+
+    assert list(get_signature(compile_dependency(root)).parameters) == ["_request", "__request"]
+
+
+def test_compile_dependency__dependency_overrides_applied():
+    instance = Items()
+    app = FastAPI()
+
+    def get_slice(size: int = Query(2)):
+        return slice(0, size)
+
+    async def endpoint(items=Depends(compile_dependency(instance.items))):
+        pass
+
+    app.dependency_overrides[instance.get_slice] = get_slice
+    assert solve(endpoint, b"size=3", app=app) == {"items": [0, 0, 1, 2]}
+    assert "get_slice" not in instance.calls
+
+    app.dependency_overrides[instance.items] = lambda: "overridden"
+    assert solve(endpoint, app=app) == {"items": "overridden"}
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_compile_dependency__generator_root__error(is_async):
+    def root():
+        yield 1
+
+    async def async_root():
+        yield 1
+
+    with pytest.raises(TypeError, match="Dependency with `yield` can't be compiled"):
+        compile_dependency(async_root if is_async else root)
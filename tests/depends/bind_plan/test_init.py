@@ -0,0 +1,189 @@
+import re
+from typing import Any
+
+import pytest
+
+from fastapi_depends_ext.depends import BindPlan
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.depends import get_bind_plan
+from tests.utils_for_tests import SimpleDependency
+
+
+def test_init__no_depends_attr__no_methods():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method(self, arg: int = 1):
+            pass
+
+    plan = BindPlan(TestClass)
+
+    assert plan.methods == []
+
+
+def test_init__methods_with_depends_attr__sorted_visible_methods():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        @staticmethod
+        def method_2(arg: int = DependsAttr("dependency")):
+            pass
+
+        @classmethod
+        def method_1(cls, arg: int = DependsAttr("dependency")):
+            pass
+
+        def method_0(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    plan = BindPlan(TestClass)
+
+    assert [(method.owner, method.name, method.visible) for method in plan.methods] == [
+        (TestClass, "method_0", True),
+        (TestClass, "method_1", True),
+        (TestClass, "method_2", True),
+    ]
+    assert plan.methods[0].attr is TestClass.__dict__["method_0"]
+    assert plan.methods[1].attr is TestClass.__dict__["method_1"]
+    assert plan.methods[2].attr is TestClass.__dict__["method_2"]
+
+
+def test_init__targets__resolved_from_class():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method_1(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+        def method_2(self, arg: Any = DependsAttr("method_1"), instance_arg: Any = DependsAttr("instance_attr")):
+            pass
+
+    plan = BindPlan(TestClass)
+    method_1, method_2 = plan.methods
+
+    assert method_1.targets["arg"].owner is SimpleDependency
+    assert method_1.targets["arg"].attr is SimpleDependency.__dict__["dependency"]
+    assert method_1.targets["arg"].method is None
+    assert method_2.targets["arg"].attr is TestClass.__dict__["method_1"]
+    assert method_2.targets["arg"].method is method_1
+    assert method_2.targets["instance_arg"] == (None, None, None)
+
+
+def test_init__target_from_super__hidden_method_planned():
+    class BaseClass(SimpleDependency):
+        def dependency(self, arg: Any = DependsAttr("dependency", from_super=True)):
+            pass
+
+    class TestClass(BaseClass, DependsAttrBinder):
+        def dependency(self, arg: Any = DependsAttr("dependency", from_super=True)):
+            pass
+
+    plan = BindPlan(TestClass)
+    (method,) = plan.methods
+    target = method.targets["arg"].method
+
+    assert method.owner is TestClass
+    assert target.owner is BaseClass
+    assert not target.visible
+    assert target.targets["arg"].attr is SimpleDependency.__dict__["dependency"]
+    assert plan.get(BaseClass.dependency) is target
+
+
+def test_init__class_descriptors__not_evaluated():
+    class Descriptor:
+        def __get__(self, instance, owner):
+            raise AssertionError("descriptor must not be evaluated")
+
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        descriptor = Descriptor()
+
+        @property
+        def property(self):
+            raise AssertionError("property must not be evaluated")
+
+        def method(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    plan = BindPlan(TestClass)
+
+    assert [method.name for method in plan.methods] == ["method"]
+
+
+def test_init__method_shadowed_by_attribute__not_planned():
+    class BaseClass(SimpleDependency):
+        def method(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    class TestClass(BaseClass, DependsAttrBinder):
+        method = None
+
+    plan = BindPlan(TestClass)
+
+    assert plan.methods == []
+
+
+def test_init__call_with_depends_attr__error():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def __call__(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    message = "`TestClass.__call__` can't have `DependsAttr` as default value for arguments"
+    with pytest.raises(AttributeError, match=re.escape(message)):
+        BindPlan(TestClass)
+
+
+def test_get_bind_plan__computed_once_per_class():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    class TestSubClass(TestClass):
+        pass
+
+    assert get_bind_plan(TestClass) is get_bind_plan(TestClass)
+    assert get_bind_plan(TestSubClass) is not get_bind_plan(TestClass)
+    assert get_bind_plan(TestSubClass).cls is TestSubClass
+
+
+def _method(target: str):
+    def method(self, arg: Any = DependsAttr(target)):
+        pass
+
+    return method
+
+
+def test_init__indirect_cycle__error_with_path():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method_0(self, arg: Any = DependsAttr("method_1")):
+            pass
+
+        def method_1(self, arg: Any = DependsAttr("method_2")):
+            pass
+
+        def method_2(self, arg: Any = DependsAttr("method_0")):
+            pass
+
+    message = "`TestClass.method_0` -> `TestClass.method_1` -> `TestClass.method_2` -> `TestClass.method_0`"
+    with pytest.raises(RecursionError, match="recursively depends self: " + re.escape(message)):
+        BindPlan(TestClass)
+
+    with pytest.raises(RecursionError):
+        TestClass()
+
+
+def test_init__self_dependency__error():
+    class TestClass(DependsAttrBinder):
+        def method(self, arg: Any = DependsAttr("method")):
+            pass
+
+    message = "`TestClass`.`method` has DependsAttr(<method>) recursively depends self: `TestClass.method` -> "
+    with pytest.raises(RecursionError, match=re.escape(message)):
+        BindPlan(TestClass)
+
+
+def test_init__deep_chain__no_recursion():
+    namespace = {f"method_{index}": _method(f"method_{index + 1}") for index in range(3000)}
+    TestClass = type("TestClass", (SimpleDependency, DependsAttrBinder), namespace)
+    TestClass.method_3000 = _method("dependency")
+
+    plan = BindPlan(TestClass)
+    instance = TestClass()
+
+    assert len(plan.methods) == 3001
+    assert instance.method_0.__defaults__[0].dependency is instance.method_1
+    assert instance.method_3000.__defaults__[0].dependency.__func__ is SimpleDependency.dependency
@@ -1,11 +1,23 @@
+import asyncio
 import re
 from typing import Any
 from typing import Callable
 
 import pytest
 
+from fastapi_depends_ext.cache import ResultCache
 from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.utils import get_signature
 from tests.utils_for_tests import SimpleDependency
+from tests.utils_for_tests import run
+
+
+def _origin(method: Callable) -> Callable:
+    return getattr(method.__func__, "__origin__", method.__func__)
+
+
+def _sub_depends(method: Callable) -> DependsAttr:
+    return get_signature(method).parameters["depends_method"].default
 
 
 def test_bind__attribute_not_exist__error():
@@ -26,8 +38,8 @@ def test_bind__dependence_depends_already_bounded__do_nothing(mocker):
             pass
 
     instance = TestClass()
-    depends.bind(instance)
 
+    assert depends.bind(instance) is depends
     assert depends.dependency is object
 
 
@@ -39,9 +51,9 @@ def test_bind__dependence_depends_instance_method__dependency_has_been_set():
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is TestClass.dependency
+    assert bound.dependency.__func__ is TestClass.dependency
 
 
 def test_bind__dependence_depends_static_method__dependency_has_been_set():
@@ -56,9 +68,9 @@ def test_bind__dependence_depends_static_method__dependency_has_been_set():
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency is TestClass.static_method
+    assert bound.dependency is TestClass.static_method
 
 
 def test_bind__dependence_depends_class_method__dependency_has_been_set():
@@ -73,9 +85,9 @@ def test_bind__dependence_depends_class_method__dependency_has_been_set():
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is TestClass.class_method.__func__
+    assert bound.dependency.__func__ is TestClass.class_method.__func__
 
 
 def test_bind__dependence_depends_property__dependency_has_been_set():
@@ -93,9 +105,9 @@ def test_bind__dependence_depends_property__dependency_has_been_set():
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency is function
+    assert bound.dependency is function
 
 
 def test_bind__dependence_depends_class_variable_type__dependency_has_been_set():
@@ -112,9 +124,9 @@ def test_bind__dependence_depends_class_variable_type__dependency_has_been_set()
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency is Dependency
+    assert bound.dependency is Dependency
 
 
 def test_bind__dependence_depends_instance_defined_property__dependency_has_been_set():
@@ -134,10 +146,10 @@ def test_bind__dependence_depends_instance_defined_property__dependency_has_been
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert isinstance(depends.dependency, CallableClass)
-    assert depends.dependency.__call__.__func__ is CallableClass.__call__
+    assert isinstance(bound.dependency, CallableClass)
+    assert bound.dependency.__call__.__func__ is CallableClass.__call__
 
 
 def test_bind__dependence_recursive__error():
@@ -164,9 +176,9 @@ def test_bind__dependence_depends_method__dependency_has_been_set():
 
     instance = TestClass()
     depends = DependsAttr("method_bounded")
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is TestClass.method_bounded
+    assert bound.dependency.__func__ is TestClass.method_bounded
 
 
 def test_bind__dependency_depends_from_super_but_super_has_no_method__dependency_has_been_set():
@@ -193,9 +205,9 @@ def test_bind__dependence_depends_from_super__dependency_has_been_set():
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is SimpleDependency.dependency
+    assert bound.dependency.__func__ is SimpleDependency.dependency
 
 
 def test_bind__dependence_depends_from_super_deep_method__dependency_has_been_set():
@@ -211,10 +223,11 @@ def test_bind__dependence_depends_from_super_deep_method__dependency_has_been_se
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is MixinClass.dependency
-    assert depends_mixin.dependency.__func__ is SimpleDependency.dependency
+    assert _origin(bound.dependency) is MixinClass.dependency
+    assert _sub_depends(bound.dependency).dependency.__func__ is SimpleDependency.dependency
+    assert not depends_mixin.is_bound
 
 
 def test_bind__dependence_depends_from_super_another_method__dependency_has_been_set():
@@ -233,10 +246,11 @@ def test_bind__dependence_depends_from_super_another_method__dependency_has_been
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is MixinClass.method
-    assert depends_mixin.dependency.__func__ is SimpleDependency.dependency
+    assert _origin(bound.dependency) is MixinClass.method
+    assert _sub_depends(bound.dependency).dependency.__func__ is SimpleDependency.dependency
+    assert not depends_mixin.is_bound
 
 
 def test_bind__dependence_depends_another_method_with_depends_super__dependency_has_been_set():
@@ -252,10 +266,11 @@ def test_bind__dependence_depends_another_method_with_depends_super__dependency_
             pass
 
     instance = TestClass()
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is MixinClass.dependency
-    assert depends_mixin.dependency.__func__ is SimpleDependency.dependency
+    assert _origin(bound.dependency) is MixinClass.dependency
+    assert _sub_depends(bound.dependency).dependency.__func__ is SimpleDependency.dependency
+    assert not depends_mixin.is_bound
 
 
 def test_bind__dependence_recursive_deep__error():
@@ -286,10 +301,11 @@ def test_bind__dependence_has_unbounded_depends_method__bind_all():
 
     instance = TestClass()
 
-    depends.bind(instance)
+    bound = depends.bind(instance)
 
-    assert depends.dependency.__func__ is TestClass.method_unbounded
-    assert depends_unbounded.dependency.__func__ is SimpleDependency.dependency
+    assert _origin(bound.dependency) is TestClass.method_unbounded
+    assert _sub_depends(bound.dependency).dependency.__func__ is SimpleDependency.dependency
+    assert not depends_unbounded.is_bound
 
 
 def test_bind__dependence_has_unbounded_chained__bind_all():
@@ -307,9 +323,12 @@ def test_bind__dependence_has_unbounded_chained__bind_all():
 
     instance = TestClass()
 
-    depends[0].bind(instance)
+    bound = depends[0].bind(instance)
 
-    result = [_depends.dependency.__func__ for _depends in depends]
+    result = [_origin(bound.dependency)]
+    for _ in depends[1:]:
+        bound = _sub_depends(bound.dependency)
+        result.append(_origin(bound.dependency))
     expected = [getattr(TestClass, _depends.method_name) for _depends in depends]
     assert result == expected
 
@@ -361,10 +380,11 @@ def test_bind__has_method_depends_super__bind_all():
 
     instance = TestClass()
 
-    depends[0].bind(instance)
+    bound = depends[0].bind(instance)
 
-    assert depends[0].dependency.__func__ is TestClass.dependency
-    assert depends[1].dependency.__func__ is SimpleDependency.dependency
+    assert _origin(bound.dependency) is TestClass.dependency
+    assert _sub_depends(bound.dependency).dependency.__func__ is SimpleDependency.dependency
+    assert not any(_depends.is_bound for _depends in depends)
 
 
 def test_bind__has_method_depends_super_chained__bind_all():
@@ -384,8 +404,100 @@ def test_bind__has_method_depends_super_chained__bind_all():
 
     instance = TestClass()
 
-    depends[0].bind(instance)
+    bound = depends[0].bind(instance)
+    bound_super = _sub_depends(bound.dependency)
+
+    assert _origin(bound.dependency) is BaseClass.method_1
+    assert _origin(bound_super.dependency) is TestClass.method_2
+    assert _sub_depends(bound_super.dependency).dependency.__func__ is SimpleDependency.dependency
+
+
+def test_bind__cache__dependency_wrapped():
+    cache = ResultCache()
+    depends = DependsAttr("dependency", cache=cache)
+    instance = SimpleDependency()
+    bound = depends.bind(instance)
+
+    assert bound.dependency != instance.dependency
+    assert bound.dependency() == bound.dependency() == 2
+    assert cache.info().hits == 1
+
+
+def test_bind__coalesce__dependency_wrapped():
+    depends = DependsAttr("dependency", coalesce=True)
+    instance = SimpleDependency()
+    bound = depends.bind(instance)
+
+    assert bound.dependency != instance.dependency
+    assert asyncio.iscoroutinefunction(bound.dependency)
+    assert run(bound.dependency()) == 2
+
+
+def test_bind__scope_app__dependency_wrapped():
+    depends = DependsAttr("dependency", scope="app")
+    instance = SimpleDependency()
+    bound = depends.bind(instance)
+
+    assert bound.dependency != instance.dependency
+    assert not get_signature(bound.dependency).parameters
+    assert run(bound.dependency()) == 2
+
+
+def test_bind__methods_chained_recursive__error_with_path():
+    depends = [DependsAttr("method_2"), DependsAttr("method_3"), DependsAttr("method_2")]
+
+    class TestClass(SimpleDependency):
+        def method_1(self, depends_method: Any = depends[0]):
+            pass
+
+        def method_2(self, depends_method: Any = depends[1]):
+            pass
+
+        def method_3(self, depends_method: Any = depends[2]):
+            pass
+
+    message = "recursively depends self: `TestClass.method_2` -> `TestClass.method_3` -> `TestClass.method_2`"
+    with pytest.raises(RecursionError, match=re.escape(message)):
+        DependsAttr("method_1").bind(TestClass())
+
+
+def test_bind__deep_chain__no_recursion():
+    def method(target: str):
+        def _method(self, arg: Any = DependsAttr(target)):
+            pass
+
+        return _method
+
+    namespace = {f"method_{index}": method(f"method_{index + 1}") for index in range(3000)}
+    TestClass = type("TestClass", (SimpleDependency,), namespace)
+    TestClass.method_3000 = method("dependency")
+    depends = DependsAttr("method_0")
+
+    bound = depends.bind(TestClass())
+
+    for index in range(3000):
+        assert _origin(bound.dependency) is getattr(TestClass, f"method_{index}")
+        bound = bound.dependency.__defaults__[0]
+    assert _origin(bound.dependency) is TestClass.method_3000
+    assert not TestClass.method_2999.__defaults__[0].is_bound
+
+
+def test_bind__shared_depends__bound_once_and_not_changed():
+    depends = DependsAttr("dependency")
+
+    class TestClass(SimpleDependency):
+        def method_1(self, depends_method: Any = depends):
+            pass
+
+        def method_2(self, depends_method: Any = DependsAttr("method_1"), other: Any = depends):
+            pass
+
+    instances = [TestClass(), TestClass()]
+    bound = [DependsAttr("method_2").bind(instance) for instance in instances]
 
-    assert depends[0].dependency.__func__ is BaseClass.method_1
-    assert depends[1].dependency.__func__ is SimpleDependency.dependency
-    assert depends_super.dependency.__func__ is TestClass.method_2
+    for instance, _bound in zip(instances, bound):
+        defaults = _bound.dependency.__defaults__
+        assert _sub_depends(defaults[0].dependency) is defaults[1]
+        assert defaults[1].dependency.__self__ is instance
+    assert not depends.is_bound
+    assert TestClass.method_2.__defaults__[1] is depends
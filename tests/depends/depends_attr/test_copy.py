@@ -0,0 +1,47 @@
+from copy import copy
+
+from fastapi_depends_ext.cache import ResultCache
+from fastapi_depends_ext.depends import DependsAttr
+
+
+def test_copy__all_options_copied():
+    cache = ResultCache()
+    depends = DependsAttr(
+        "method",
+        from_super=True,
+        use_cache=False,
+        gather=True,
+        cache=cache,
+        coalesce=True,
+        scope="app",
+        inline=True,
+    )
+    depends.dependency = len
+
+    depends_copy = copy(depends)
+
+    assert depends_copy is not depends
+    assert type(depends_copy) is DependsAttr
+    assert repr(depends_copy) == repr(depends)
+    assert depends_copy.dependency is len
+    assert depends_copy.cache is cache
+    for name in DependsAttr.__slots__ + DependsAttr.__base__.__slots__:
+        assert getattr(depends_copy, name) == getattr(depends, name), name
+
+
+def test_copy__changes_not_shared():
+    depends = DependsAttr("method")
+    depends_copy = copy(depends)
+    depends_copy.dependency = len
+
+    assert depends.dependency is None
+    assert not depends.is_bound
+    assert depends_copy.is_bound
+
+
+def test_copy__options_in_slots():
+    depends = DependsAttr("method", gather=True)
+
+    assert "gather" not in vars(depends)
+    assert "method_name" not in vars(depends)
+    assert "scope" not in vars(depends)
@@ -344,6 +344,52 @@ def test_bind__method_has_depends_method_chained_to_super_deep__method_changed_a
     assert depends_attr.default.dependency.__func__ is SimpleDependency.dependency
 
 
-# todo
-# def test_bind__multiple_method_depends_one_method__depends_is_one_object():
-#     raise ValueError()
+def test_bind__multiple_method_depends_one_method__depends_is_one_object():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method_0(self, depends_attr: Any = DependsAttr("dependency")):
+            pass
+
+        def method_1(self, depends_attr: Any = DependsAttr("method_0")):
+            pass
+
+        def method_2(self, depends_attr: Any = DependsAttr("method_0"), dependency: Any = DependsAttr("dependency")):
+            pass
+
+    instance = TestClass()
+
+    method_0 = instance.method_0
+    assert instance.method_1.__defaults__[0].dependency is method_0
+    assert instance.method_2.__defaults__[0].dependency is method_0
+    assert instance.method_2.__defaults__[1].dependency is method_0.__defaults__[0].dependency
+
+
+def test_bind__method_bound_twice__same_object(mocker):
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method(self, depends_attr: Any = DependsAttr("dependency")):
+            pass
+
+    with mocker.patch.object(DependsAttrBinder, "__init__", unittest.mock.MagicMock(return_value=None)):
+        instance = TestClass()
+    method = instance.bind(instance.method)
+
+    assert instance.bind(instance.method) is method
+    assert instance.bind(TestClass.method) is method
+    assert instance.method is method
+
+
+def test_bind__super_and_self_depends_one_method__depends_is_one_object():
+    class BaseClass(SimpleDependency):
+        def method(self, depends_attr: Any = DependsAttr("dependency")):
+            pass
+
+    class TestClass(BaseClass, DependsAttrBinder):
+        def method_super(self, depends_attr: Any = DependsAttr("method")):
+            pass
+
+        def dependency(self, depends_attr: Any = DependsAttr("dependency", from_super=True)):
+            pass
+
+    instance = TestClass()
+
+    assert instance.method.__defaults__[0].dependency is instance.dependency
+    assert instance.method_super.__defaults__[0].dependency is instance.method
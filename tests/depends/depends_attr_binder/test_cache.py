@@ -0,0 +1,62 @@
+from fastapi import Depends
+
+from fastapi_depends_ext.cache import ResultCache
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import solve
+
+
+config_cache = ResultCache(ttl=60)
+
+
+class Config(DependsAttrBinder):
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        super(Config, self).__init__()
+
+    async def config(self) -> str:
+        self.calls += 1
+        return self.name
+
+    async def items(self, config: str = DependsAttr("config", cache=config_cache)):
+        return config
+
+    async def other(self, config: str = DependsAttr("config", cache=config_cache)):
+        return config
+
+
+def setup_function():
+    config_cache.clear()
+
+
+def test_cache__results_shared_between_requests():
+    instance = Config("a")
+
+    async def endpoint(items=Depends(instance.items), other=Depends(instance.other)):
+        pass
+
+    assert solve(endpoint) == {"items": "a", "other": "a"}
+    assert solve(endpoint) == {"items": "a", "other": "a"}
+    assert instance.calls == 1
+    assert config_cache.info().hits == 1
+
+
+def test_cache__same_wrapper_for_methods():
+    instance = Config("a")
+    items = get_signature(instance.items).parameters["config"].default
+    other = get_signature(instance.other).parameters["config"].default
+
+    assert items.dependency is other.dependency
+    assert items.cache is config_cache
+
+
+def test_cache__instances_cached_separately():
+    instances = Config("a"), Config("b")
+
+    for instance in instances:
+        assert solve(instance.items) == {"config": instance.name}
+
+    assert [instance.calls for instance in instances] == [1, 1]
+    assert config_cache.info().currsize == 2
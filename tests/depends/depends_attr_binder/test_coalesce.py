@@ -0,0 +1,67 @@
+import asyncio
+
+from fastapi_depends_ext.cache import ResultCache
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import resolve
+from tests.utils_for_tests import run
+from tests.utils_for_tests import solve
+
+
+class Tenant(DependsAttrBinder):
+    cache = ResultCache()
+
+    def __init__(self):
+        self.calls = 0
+        super(Tenant, self).__init__()
+
+    async def tenant(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return "tenant"
+
+    async def coalesced(self, tenant: str = DependsAttr("tenant", coalesce=True)):
+        return tenant
+
+    async def cached(self, tenant: str = DependsAttr("tenant", coalesce=True, cache=cache)):
+        return tenant
+
+
+def resolve_concurrently(call, count: int):
+    requests = asyncio.gather(*(resolve(call) for _ in range(count)))
+    return run(requests)
+
+
+def test_coalesce__concurrent_requests_share_call():
+    instance = Tenant()
+
+    assert resolve_concurrently(instance.coalesced, 5) == [{"tenant": "tenant"}] * 5
+    assert instance.calls == 1
+
+
+def test_coalesce__sequential_requests_not_shared():
+    instance = Tenant()
+
+    assert solve(instance.coalesced) == {"tenant": "tenant"}
+    assert solve(instance.coalesced) == {"tenant": "tenant"}
+    assert instance.calls == 2
+
+
+def test_coalesce__dependency_wrapped():
+    instance = Tenant()
+    depends = get_signature(instance.coalesced).parameters["tenant"].default
+
+    assert depends.coalesce
+    assert depends.dependency != instance.tenant
+    assert get_signature(depends.dependency) == get_signature(instance.tenant)
+
+
+def test_coalesce__with_cache__concurrent_misses_share_call():
+    Tenant.cache.clear()
+    instance = Tenant()
+
+    assert resolve_concurrently(instance.cached, 5) == [{"tenant": "tenant"}] * 5
+    assert solve(instance.cached) == {"tenant": "tenant"}
+    assert instance.calls == 1
+    assert Tenant.cache.info().hits == 1
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi import Query
+from fastapi.testclient import TestClient
+
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.depends import DependsExt
+from fastapi_depends_ext.executors import executors
+from tests.utils_for_tests import solve
+
+
+blocking = executors.thread_pool("tests-blocking", 2)
+cpu = executors.process_pool("tests-cpu", 1)
+
+
+def square(value: int = Query(1)) -> int:
+    return value**2
+
+
+class Report(DependsAttrBinder):
+    def data(self) -> str:
+        return threading.current_thread().name
+
+    async def report(self, data: str = DependsAttr("data", executor="tests-blocking")):
+        return data
+
+
+def test_executor__dependency_run_in_executor():
+    calls = blocking.info().calls
+
+    assert solve(Report().report)["data"].startswith("fastapi-depends-tests-blocking")
+    assert blocking.info().calls == calls + 1
+
+
+def test_executor__depends_ext():
+    def dependency():
+        return threading.current_thread().name
+
+    async def endpoint(value: str = DependsExt(dependency, executor=blocking).bind()):
+        pass
+
+    assert solve(endpoint)["value"].startswith("fastapi-depends-tests-blocking")
+
+
+def test_executor__with_inline__error():
+    with pytest.raises(ValueError, match="can't be used together"):
+        DependsAttr("data", executor="tests-blocking", inline=True)
+
+
+def test_executor__process_pool__depends_ext_rebound():
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(value: int = DependsExt(square, executor=cpu).bind(value=Query(3, alias="number"))):
+        return value
+
+    try:
+        response = TestClient(app).get("/", params={"number": 4})
+    finally:
+        cpu.shutdown()
+
+    assert response.json() == 16
+
+
+def test_executor__process_pool__binder_method__error():
+    class Squares(DependsAttrBinder):
+        def square(self, value: int = Query(1)) -> int:
+            return value**2
+
+        async def squares(self, square: int = DependsAttr("square", executor=cpu)):
+            return square
+
+    with pytest.raises(TypeError, match="process pool `tests-cpu` must be picklable"):
+        Squares()
@@ -0,0 +1,99 @@
+import asyncio
+
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import solve
+
+
+class Gathered(DependsAttrBinder):
+    def __init__(self):
+        self.events = []
+        super(Gathered, self).__init__()
+
+    async def _run(self, name: str, value):
+        self.events.append(f"{name} start")
+        await asyncio.sleep(0.01)
+        self.events.append(f"{name} end")
+        return value
+
+    async def page(self, page: int = Query(1)) -> int:
+        return await self._run("page", page)
+
+    async def size(self, size: int = Query(10)) -> int:
+        return await self._run("size", size)
+
+    def sync(self) -> str:
+        return "sync"
+
+    async def items(
+        self,
+        page: int = DependsAttr("page", gather=True),
+        size: int = DependsAttr("size", gather=True),
+        sync: str = DependsAttr("sync", gather=True),
+    ):
+        return page, size, sync
+
+    async def items_sequential(self, page: int = DependsAttr("page"), size: int = DependsAttr("size")):
+        return page, size
+
+
+def test_gather__async_siblings_run_concurrently():
+    instance = Gathered()
+
+    async def endpoint(items=Depends(instance.items)):
+        pass
+
+    assert solve(endpoint, b"page=2&size=5") == {"items": (2, 5, "sync")}
+    assert instance.events[:2] == ["page start", "size start"]
+
+
+def test_gather__not_gathered_run_sequentially():
+    instance = Gathered()
+
+    async def endpoint(items=Depends(instance.items_sequential)):
+        pass
+
+    assert solve(endpoint, b"page=2&size=5") == {"items": (2, 5)}
+    assert instance.events == ["page start", "page end", "size start", "size end"]
+
+
+def test_gather__sync_dependency_not_gathered():
+    instance = Gathered()
+    parameters = get_signature(instance.items).parameters
+
+    assert parameters["sync"].default.dependency == instance.sync
+    assert parameters["page"].default.dependency != instance.page
+    assert parameters["page"].default.gather
+
+
+def test_gather__single_async_dependency_not_gathered():
+    class TestClass(Gathered):
+        async def items(
+            self, page: int = DependsAttr("page", gather=True), sync: str = DependsAttr("sync", gather=True)
+        ):
+            return page, sync
+
+    instance = TestClass()
+
+    assert get_signature(instance.items).parameters["page"].default.dependency == instance.page
+
+
+def test_gather__deferred_dependency_shared():
+    class TestClass(Gathered):
+        async def other(
+            self, size: int = DependsAttr("size", gather=True), page: int = DependsAttr("page", gather=True)
+        ):
+            return page, size
+
+    instance = TestClass()
+
+    async def endpoint(items=Depends(instance.items), other=Depends(instance.other)):
+        pass
+
+    assert solve(endpoint, b"page=2&size=5") == {"items": (2, 5, "sync"), "other": (2, 5)}
+    assert instance.events.count("page start") == 1
+    assert instance.events.count("size start") == 1
@@ -1,4 +1,6 @@
+import inspect
 import re
+import unittest.mock
 
 import pytest
 from fastapi import Depends
@@ -6,6 +8,7 @@ from fastapi import Depends
 from fastapi_depends_ext import DependsExt
 from fastapi_depends_ext import DependsAttr
 from fastapi_depends_ext import DependsAttrBinder
+from fastapi_depends_ext import utils as utils_module
 from tests.utils_for_tests import SimpleDependency
 
 
@@ -53,9 +56,7 @@ def test_init__methods_with_depends_attr__all_have_been_patched(mocker):
     call_args_list_actual = [(_call.args[0], _call.args[1].__func__) for _call in spy_bind.call_args_list]
     call_args_list_expected = [
         (instance, TestClass.method_with_depends_attr_0),
-        (instance, TestClass.dependency),  # recursive call from TestClass.method_with_depends_attr_0
         (instance, TestClass.method_with_depends_attr_1),
-        (instance, TestClass.dependency),  # recursive call from TestClass.method_with_depends_attr_1
     ]
 
     assert call_args_list_actual == call_args_list_expected
@@ -79,9 +80,7 @@ def test_init__class_methods_with_depends_attr__all_have_been_patched(mocker):
 
     call_args_list_expected = [
         mocker.call(instance, TestClass.method_with_depends_attr_0),
-        mocker.call(instance, instance.dependency),  # recursive call from TestClass.method_with_depends_attr_0
         mocker.call(instance, TestClass.method_with_depends_attr_1),
-        mocker.call(instance, instance.dependency),  # recursive call from TestClass.method_with_depends_attr_1
     ]
 
     assert spy_bind.call_args_list == call_args_list_expected
@@ -107,9 +106,7 @@ def test_init__static_methods_with_depends_attr__all_have_been_patched(mocker):
 
     call_args_list_expected = [
         mocker.call(instance, TestClass.method_with_depends_attr_0),
-        mocker.call(instance, instance.dependency),  # recursive call from TestClass.method_with_depends_attr_0
         mocker.call(instance, TestClass.method_with_depends_attr_1),
-        mocker.call(instance, instance.dependency),  # recursive call from TestClass.method_with_depends_attr_1
     ]
 
     assert spy_bind.call_args_list == call_args_list_expected
@@ -139,3 +136,52 @@ def test_init__call_depends_attr__error():
     message = f"`TestClass.__call__` can't have `DependsAttr` as default value for arguments"
     with pytest.raises(AttributeError, match=re.escape(message)):
         TestClass()
+
+
+def test_init__second_instance__no_introspection(mocker):
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method_1(self, arg: int = DependsAttr("dependency")):
+            pass
+
+        def method_2(self, arg: int = DependsAttr("method_1")):
+            pass
+
+    TestClass()
+
+    spy_signature = mocker.spy(utils_module, "get_typed_signature")
+    spy_getmembers = mocker.spy(inspect, "getmembers")
+    instance = TestClass()
+
+    assert not spy_signature.called
+    assert not spy_getmembers.called
+    assert instance.method_2.__defaults__[0].dependency.__func__.__code__ is TestClass.method_1.__code__
+    assert instance.method_1.__defaults__[0].dependency.__self__ is instance
+
+
+def test_init__properties__not_evaluated():
+    getter = unittest.mock.MagicMock(return_value=function_dependency)
+
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        property_not_used = property(getter)
+
+        def method(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    TestClass()
+
+    assert not getter.called
+
+
+def test_init__property_in_depends_attr__evaluated_once():
+    getter = unittest.mock.MagicMock(return_value=function_dependency)
+
+    class TestClass(DependsAttrBinder):
+        dependency = property(getter)
+
+        def method(self, arg: int = DependsAttr("dependency")):
+            pass
+
+    instance = TestClass()
+
+    getter.assert_called_once_with(instance)
+    assert instance.method.__defaults__[0].dependency is function_dependency
@@ -0,0 +1,147 @@
+from typing import Any
+
+from fastapi_depends_ext.depends import BindDescriptor
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.utils import get_base_class
+from tests.utils_for_tests import SimpleDependency
+
+
+def test_init_subclass__not_lazy__methods_not_wrapped():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+    assert not TestClass.__depends_lazy__
+    assert not isinstance(TestClass.__dict__["method"], BindDescriptor)
+
+
+def test_init_subclass__lazy__methods_with_depends_attr_wrapped():
+    class TestClass(SimpleDependency, DependsAttrBinder, lazy=True):
+        def method(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+        @classmethod
+        def class_method(cls, arg: Any = DependsAttr("dependency")):
+            pass
+
+        @staticmethod
+        def static_method(arg: Any = DependsAttr("dependency")):
+            pass
+
+        def method_no_depends(self, arg: Any = None):
+            pass
+
+    class TestSubClass(TestClass):
+        def method_sub(self, arg: Any = DependsAttr("method")):
+            pass
+
+    assert TestClass.__depends_lazy__
+    assert TestSubClass.__depends_lazy__
+    assert isinstance(TestClass.__dict__["method"], BindDescriptor)
+    assert isinstance(TestClass.__dict__["class_method"], BindDescriptor)
+    assert isinstance(TestClass.__dict__["static_method"], BindDescriptor)
+    assert isinstance(TestSubClass.__dict__["method_sub"], BindDescriptor)
+    assert not isinstance(TestClass.__dict__["method_no_depends"], BindDescriptor)
+
+
+def test_init_subclass__lazy__class_access_returns_original():
+    def method(self, arg: Any = DependsAttr("dependency")):
+        pass
+
+    class TestClass(SimpleDependency, DependsAttrBinder, lazy=True):
+        pass
+
+    TestClass.method = method
+
+    TestSubClass = type("TestSubClass", (SimpleDependency, DependsAttrBinder), {"method": method}, lazy=True)
+
+    assert TestClass.method is method
+    assert TestSubClass.method is method
+    assert TestSubClass.__dict__["method"].attr is method
+
+
+def test_init_subclass__lazy__nothing_bound_on_init(mocker):
+    class TestClass(SimpleDependency, DependsAttrBinder, lazy=True):
+        def method(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+    spy_bind = mocker.spy(TestClass, "bind")
+    instance = TestClass()
+
+    assert not spy_bind.called
+    assert "method" not in instance.__dict__
+
+
+def test_init_subclass__lazy__bound_on_first_access_once(mocker):
+    class TestClass(SimpleDependency, DependsAttrBinder, lazy=True):
+        def method_0(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+        def method_1(self, arg: Any = DependsAttr("method_0")):
+            pass
+
+        @classmethod
+        def class_method(cls, arg: Any = DependsAttr("method_0")):
+            pass
+
+    instance = TestClass()
+    spy_bind = mocker.spy(TestClass, "bind")
+
+    method_1 = instance.method_1
+
+    assert spy_bind.call_count == 1  # its dependency method_0 is bound by the same call
+    assert "method_0" in instance.__dict__
+    assert instance.method_1 is method_1
+    assert instance.method_0 is method_1.__defaults__[0].dependency
+    assert instance.class_method.__func__.__defaults__[0].dependency is instance.method_0
+    assert instance.method_0.__defaults__[0].dependency.__func__ is SimpleDependency.dependency
+    assert spy_bind.call_count == 2
+
+
+def test_init_subclass__lazy__super_method_bound():
+    class BaseClass(SimpleDependency, DependsAttrBinder, lazy=True):
+        def dependency(self, arg: Any = DependsAttr("dependency", from_super=True)):
+            return arg
+
+    class TestClass(BaseClass):
+        def dependency(self, arg: Any = DependsAttr("dependency", from_super=True)):
+            return arg
+
+    instance = TestClass()
+    method = instance.dependency
+    method_super = method.__defaults__[0].dependency
+
+    assert method_super.__func__.__code__ is BaseClass.dependency.__code__
+    assert method_super.__defaults__[0].dependency.__func__ is SimpleDependency.dependency
+    assert super(TestClass, instance).dependency is method_super
+    assert get_base_class(instance, "dependency", method_super) is BaseClass
+
+
+def test_init_subclass__lazy__inherited_method_bound_on_access():
+    class TestClass(SimpleDependency, DependsAttrBinder):
+        def method(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+    class TestSubClass(TestClass, lazy=True):
+        pass
+
+    instance = TestSubClass()
+
+    assert "method" not in instance.__dict__
+    assert TestSubClass.__dict__["method"].__owner__ is TestClass
+    assert "method" in TestClass().__dict__
+    assert instance.method is instance.__dict__["method"]
+    assert get_base_class(instance, "method", instance.method) is TestClass
+
+
+def test_init_subclass__not_lazy__inherited_lazy_method_bound_on_init():
+    class TestClass(SimpleDependency, DependsAttrBinder, lazy=True):
+        def method(self, arg: Any = DependsAttr("dependency")):
+            pass
+
+    class TestSubClass(TestClass, lazy=False):
+        pass
+
+    assert "method" in TestSubClass().__dict__
+    assert "method" not in TestClass().__dict__
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+from fastapi import Depends
+
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.depends import DependsExt
+from fastapi_depends_ext.inline import cheap
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import solve
+
+
+class Items(DependsAttrBinder):
+    @cheap
+    def cheap_page(self) -> threading.Thread:
+        return threading.current_thread()
+
+    def page(self) -> threading.Thread:
+        return threading.current_thread()
+
+    async def auto(self, cheap_page=DependsAttr("cheap_page"), page=DependsAttr("page")):
+        return cheap_page, page
+
+    async def forced(self, page=DependsAttr("page", inline=True), cheap_page=DependsAttr("cheap_page", inline=False)):
+        return page, cheap_page
+
+
+def test_inline__auto__cheap_run_on_event_loop():
+    instance = Items()
+    values = solve(instance.auto)
+
+    assert values["cheap_page"] is threading.current_thread()
+    assert values["page"] is not threading.current_thread()
+
+
+def test_inline__forced():
+    instance = Items()
+    values = solve(instance.forced)
+    parameters = get_signature(instance.forced).parameters
+
+    assert values["page"] is threading.current_thread()
+    assert values["cheap_page"] is not threading.current_thread()
+    assert asyncio.iscoroutinefunction(parameters["page"].default.dependency)
+    assert parameters["cheap_page"].default.dependency == instance.cheap_page
+
+
+def test_inline__depends_ext():
+    def dependency():
+        return threading.current_thread()
+
+    async def endpoint(value=DependsExt(dependency, inline=True), other=DependsExt(dependency).bind()):
+        pass
+
+    values = solve(endpoint)
+
+    assert values["value"] is threading.current_thread()
+    assert values["other"] is not threading.current_thread()
+
+
+def test_inline__depends_ext_cheap__auto():
+    @cheap
+    def dependency():
+        return threading.current_thread()
+
+    async def endpoint(value=Depends(DependsExt(dependency).bind().dependency)):
+        pass
+
+    assert solve(endpoint)["value"] is threading.current_thread()
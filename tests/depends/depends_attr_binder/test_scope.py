@@ -0,0 +1,124 @@
+import gc
+import weakref
+
+import pytest
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.depends import DependsExt
+from fastapi_depends_ext.scope import app_scope
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import run
+from tests.utils_for_tests import solve
+
+
+class Client(DependsAttrBinder):
+    def __init__(self):
+        self.calls = 0
+        super(Client, self).__init__()
+
+    def config(self) -> str:
+        return "config"
+
+    async def client(self, config: str = DependsAttr("config")) -> dict:
+        self.calls += 1
+        return {"config": config}
+
+    async def items(self, client: dict = DependsAttr("client", scope="app")):
+        return client
+
+
+def test_scope__app__resolved_once():
+    instance = Client()
+
+    async def endpoint(items=Depends(instance.items)):
+        pass
+
+    first = solve(endpoint)["items"]
+    second = solve(endpoint)["items"]
+
+    assert first == {"config": "config"}
+    assert first is second
+    assert instance.calls == 1
+
+
+def test_scope__app__dependency_without_parameters():
+    instance = Client()
+    depends = get_signature(instance.items).parameters["client"].default
+
+    assert depends.scope == "app"
+    assert not get_signature(depends.dependency).parameters
+
+
+def test_scope__unknown__error():
+    with pytest.raises(ValueError, match="Unknown scope `session`"):
+        DependsAttr("client", scope="session")
+
+
+def test_scope__depends_ext__app():
+    calls = []
+
+    def dependency():
+        calls.append(1)
+        return 1
+
+    depends = DependsExt(dependency, scope="app")
+
+    async def endpoint(value: int = depends, other: int = depends.bind()):
+        pass
+
+    assert solve(endpoint) == {"value": 1, "other": 1}
+    assert solve(endpoint) == {"value": 1, "other": 1}
+    assert len(calls) == 2
+
+
+def test_scope__depends_ext_bind__superseded_not_resolved_on_startup():
+    calls = []
+
+    def client(name: str = Query()):
+        calls.append(name)
+        return name
+
+    DependsExt(client, scope="app").bind(name="configured").bind(name="reconfigured")
+    run(app_scope.startup())
+
+    assert calls == ["reconfigured"]
+
+
+def test_scope__app__many_instances__registry_bounded():
+    class Config(DependsAttrBinder):
+        def config(self) -> str:
+            return "config"
+
+        def items(self, config: str = DependsAttr("config", scope="app")):
+            return config
+
+    instances = [Config() for _ in range(100)]
+    registered = [key for key in app_scope._bound.keys() if key[0] is Config]
+    instance = weakref.ref(instances[-1])
+    del instances
+    gc.collect()
+
+    assert registered == [(Config, "config")]
+    assert instance() is None
+    assert not [key for key in app_scope._bound.keys() if key[0] is Config]
+
+
+def test_scope__app__resolved_once_for_all_instances():
+    class Config(DependsAttrBinder):
+        calls = 0
+
+        def config(self) -> int:
+            Config.calls += 1
+            return Config.calls
+
+        def items(self, config: int = DependsAttr("config", scope="app")):
+            return config
+
+    async def endpoint(first=Depends(Config().items), second=Depends(Config().items)):
+        pass
+
+    assert solve(endpoint) == {"first": 1, "second": 1}
+    assert Config.calls == 1
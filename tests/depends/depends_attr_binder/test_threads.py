@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from fastapi_depends_ext.depends import get_bind_plan
+from fastapi_depends_ext.utils import get_signature
+
+THREADS = 8
+
+
+def _run_concurrently(func, count: int = THREADS) -> list:
+    barrier = threading.Barrier(count)
+
+    def run(_):
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(count) as executor:
+        return list(executor.map(run, range(count)))
+
+
+def _make_class(**kwargs) -> type:
+    class TestClass(DependsAttrBinder, **kwargs):
+        def dependency(self) -> int:
+            return 1
+
+        def method_1(self, depends_method: Any = DependsAttr("dependency")):
+            pass
+
+        def method_2(self, depends_method: Any = DependsAttr("method_1")):
+            pass
+
+    return TestClass
+
+
+def test_threads__instances_created_concurrently__bound_to_own_instance():
+    TestClass = _make_class()
+
+    instances = _run_concurrently(TestClass)
+
+    for instance in instances:
+        depends_2 = get_signature(instance.method_2).parameters["depends_method"].default
+        depends_1 = get_signature(instance.method_1).parameters["depends_method"].default
+        assert depends_2.dependency == instance.method_1
+        assert depends_1.dependency.__self__ is instance
+    assert not TestClass.method_1.__defaults__[0].is_bound
+    assert not TestClass.method_2.__defaults__[0].is_bound
+
+
+def test_threads__classes_used_concurrently__one_plan_per_class():
+    TestClass = _make_class()
+
+    plans = _run_concurrently(lambda: get_bind_plan(TestClass))
+
+    assert all(plan is plans[0] for plan in plans)
+
+
+def test_threads__lazy_method_accessed_concurrently__same_object():
+    instance = _make_class(lazy=True)()
+
+    methods = _run_concurrently(lambda: instance.method_2)
+
+    assert all(method is methods[0] for method in methods)
+    assert instance.method_2 is methods[0]
@@ -0,0 +1,142 @@
+import gc
+import weakref
+from types import MethodType
+from typing import List
+
+import pytest
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.batch import batched
+from fastapi_depends_ext.depends import BindDescriptor
+from fastapi_depends_ext.depends import DependsAttr
+from fastapi_depends_ext.depends import DependsAttrBinder
+from tests.utils_for_tests import solve
+
+
+class Items(DependsAttrBinder, weak=True):
+    def page(self, page: int = Query(1)) -> int:
+        return page
+
+    async def items(self, page: int = DependsAttr("page")) -> List[int]:
+        return [page] * 2
+
+    async def count(self, items: List[int] = DependsAttr("items")) -> int:
+        return len(items)
+
+
+class ItemsBatched(Items):
+    @batched(DependsAttr("page"))
+    async def square(self, pages: List[int]) -> List[int]:
+        return [page**2 for page in pages]
+
+
+def _resolve(dependency, query_string: bytes = b""):
+    async def endpoint(value=Depends(dependency)):
+        pass
+
+    return solve(endpoint, query_string)["value"]
+
+
+def _is_freed_without_gc(cls: type) -> bool:
+    gc.disable()
+    try:
+        instance = cls()
+        _resolve(instance.count)
+        ref = weakref.ref(instance)
+        del instance
+        return ref() is None
+    finally:
+        gc.enable()
+
+
+def test_weak__instance_freed_without_gc():
+    assert _is_freed_without_gc(Items)
+
+
+def test_weak__batch_loader__instance_freed_without_gc():
+    class Square(ItemsBatched):
+        async def count(self, square: int = DependsAttr("square")) -> int:
+            return square
+
+    assert _is_freed_without_gc(Square)
+
+
+def test_weak__not_weak__reference_cycle():
+    class NotWeak(Items, weak=False):
+        async def count(self, items: List[int] = DependsAttr("items")) -> int:
+            return len(items)
+
+    assert not _is_freed_without_gc(NotWeak)
+
+
+def test_weak__methods_are_class_attributes():
+    instance = Items()
+
+    assert isinstance(Items.__dict__["items"], BindDescriptor)
+    assert "items" not in instance.__dict__
+    assert type(instance.items) is MethodType
+    assert instance.items.__self__ is instance
+    assert instance.items == instance.items
+
+
+def test_weak__resolve():
+    assert solve(Items().count, query_string=b"page=3") == {"items": [3, 3]}
+    assert solve(ItemsBatched().square, query_string=b"page=3") == {"key": 3}
+    assert _resolve(ItemsBatched().square, query_string=b"page=3") == 9
+
+
+def test_weak__instance_referenced_by_method():
+    dependency = Items().count
+
+    assert _resolve(dependency, query_string=b"page=2") == 2
+
+
+def test_weak__garbage_collected_instance__error():
+    instance = Items()
+    dependency = instance.bind(instance.items)
+    del instance
+
+    with pytest.raises(ReferenceError, match="is already garbage collected"):
+        _resolve(dependency)
+
+
+class ItemsStrong(DependsAttrBinder):
+    def page(self, page: int = Query(1)) -> int:
+        return page
+
+    async def items(self, page: int = DependsAttr("page")) -> List[int]:
+        return [page] * 2
+
+    async def count(self, items: List[int] = DependsAttr("items")) -> int:
+        return len(items)
+
+
+def test_weak__inherited_from_not_weak__instance_freed_without_gc():
+    class Weak(ItemsStrong, weak=True):
+        pass
+
+    assert not _is_freed_without_gc(ItemsStrong)
+    assert _is_freed_without_gc(Weak)
+    assert _resolve(Weak().count, query_string=b"page=3") == 2
+    assert Weak.__dict__["items"].__owner__ is ItemsStrong
+    assert not isinstance(ItemsStrong.__dict__["items"], BindDescriptor)
+
+
+def test_weak__inherited_depends_from_super__resolved():
+    class Base(DependsAttrBinder):
+        def page(self, page: int = Query(1)) -> int:
+            return page
+
+    class Middle(Base):
+        def page(self, page: int = DependsAttr("page", from_super=True)) -> int:
+            return page * 10
+
+        async def items(self, page: int = DependsAttr("page")) -> List[int]:
+            return [page]
+
+    class Weak(Middle, weak=True):
+        pass
+
+    assert _resolve(Weak().items, query_string=b"page=3") == [30]
+    assert _resolve(Weak().page, query_string=b"page=2") == 20
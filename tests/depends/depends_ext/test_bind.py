@@ -6,6 +6,7 @@ from fastapi import params
 from fastapi.dependencies.utils import get_typed_signature
 
 from fastapi_depends_ext.depends import DependsExt
+from fastapi_depends_ext.utils import get_base_class
 
 
 def test_bind__no_args__error():
@@ -119,3 +120,36 @@ def test_bind__depends_kwonly_arg__arg_have_new_default():
     assert signature.parameters["arg"].default is dependency
     assert depends.dependency.__origin__ is endpoint
     assert depends.dependency() is dependency
+
+
+def test_bind__rebind__patched_from_origin_with_all_overrides():
+    def endpoint(arg_0: int = None, arg_1: int = None):
+        return arg_0, arg_1
+
+    dependencies = (Depends(), Depends(), Depends())
+    depends = DependsExt(endpoint).bind(arg_0=dependencies[0]).bind(arg_1=dependencies[1])
+    depends = depends.bind(arg_0=dependencies[2])
+    signature = get_typed_signature(depends.dependency)
+
+    assert signature.parameters["arg_0"].default is dependencies[2]
+    assert signature.parameters["arg_1"].default is dependencies[1]
+    assert depends.__origin__ is endpoint
+    assert depends.dependency.__origin__ is endpoint
+    assert depends.overrides == {"arg_0": dependencies[2], "arg_1": dependencies[1]}
+    assert depends.dependency() == (dependencies[2], dependencies[1])
+
+
+def test_bind__rebind_many_times__origin_depth_constant():
+    class TestClass:
+        def endpoint(self, arg: int = None):
+            return arg
+
+    instance = TestClass()
+    depends = DependsExt(instance.endpoint)
+    for value in range(100):
+        depends = depends.bind(arg=Depends(lambda: value))
+
+    assert depends.dependency.__self__ is instance
+    assert depends.dependency.__func__.__origin__ is TestClass.endpoint
+    assert not hasattr(TestClass.endpoint, "__origin__")
+    assert get_base_class(instance, "endpoint", depends.dependency) is TestClass
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import Query
+
+from fastapi_depends_ext.executors import DependencyExecutor
+from fastapi_depends_ext.utils import get_signature
+from fastapi_depends_ext.utils import patch_defaults
+from tests.utils_for_tests import run
+
+
+def square(value: int) -> int:
+    return value**2
+
+
+@pytest.fixture
+def thread_pool():
+    executor = DependencyExecutor("test", 2, lambda workers: ThreadPoolExecutor(workers, thread_name_prefix="test"))
+    yield executor
+    executor.shutdown()
+
+
+def test_wrap__run_in_executor(thread_pool):
+    def dependency(page: int = Query(1)):
+        return page, threading.current_thread().name
+
+    dispatched = thread_pool.wrap(dependency)
+    page, thread = run(dispatched(page=2))
+
+    assert get_signature(dispatched) == get_signature(dependency)
+    assert page == 2
+    assert thread.startswith("test")
+
+
+def test_wrap__async__error(thread_pool):
+    async def dependency():
+        pass
+
+    with pytest.raises(TypeError, match="Only sync dependency"):
+        thread_pool.wrap(dependency)
+
+
+def test_wrap__process_pool():
+    executor = DependencyExecutor("cpu", 1, ProcessPoolExecutor)
+    try:
+        assert run(executor.wrap(square)(value=3)) == 9
+    finally:
+        executor.shutdown()
+
+
+def test_info__metrics(thread_pool):
+    event = threading.Event()
+
+    def blocked():
+        event.wait(1)
+
+    def failed():
+        raise ValueError
+
+    async def main():
+        calls = [asyncio.ensure_future(thread_pool.run(blocked)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        info = thread_pool.info()
+        event.set()
+        await asyncio.gather(*calls)
+        return info
+
+    info = run(main())
+    assert (info.in_flight, info.queued, info.calls) == (3, 1, 0)
+
+    with pytest.raises(ValueError):
+        run(thread_pool.run(failed))
+
+    info = thread_pool.info()
+    assert (info.in_flight, info.queued, info.calls, info.errors) == (0, 0, 4, 1)
+    assert info.latency_max > 0
+    assert info.latency_total >= info.latency_max
+
+
+def test_wrap__process_pool__patched_function():
+    executor = DependencyExecutor("cpu", 1, ProcessPoolExecutor, processes=True)
+    patched = patch_defaults(square, value=Query(2))
+    try:
+        assert run(executor.wrap(patched)(value=4)) == 16
+    finally:
+        executor.shutdown()
+
+
+def test_wrap__process_pool__not_picklable__error():
+    executor = DependencyExecutor("cpu", 1, ProcessPoolExecutor, processes=True)
+
+    def dependency():
+        pass
+
+    with pytest.raises(TypeError, match="must be picklable module level function"):
+        executor.wrap(dependency)
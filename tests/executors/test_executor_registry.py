@@ -0,0 +1,25 @@
+import pytest
+
+from fastapi_depends_ext.executors import ExecutorRegistry
+
+
+def test_get__by_name():
+    registry = ExecutorRegistry()
+    executor = registry.thread_pool("io", 4)
+
+    assert registry.get("io") is executor
+    assert registry.get(executor) is executor
+    assert registry.info()["io"].max_workers == 4
+
+
+def test_get__not_registered__error():
+    with pytest.raises(KeyError, match="Executor `io` is not registered"):
+        ExecutorRegistry().get("io")
+
+
+def test_thread_pool__already_registered__error():
+    registry = ExecutorRegistry()
+    registry.thread_pool("io", 4)
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.process_pool("io", 4)
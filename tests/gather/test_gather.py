@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.gather import defer
+from fastapi_depends_ext.gather import gather
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import run
+from tests.utils_for_tests import solve
+
+
+def test_defer__signature_of_dependency():
+    async def dependency(page: int = Query(1)) -> int:
+        return page
+
+    deferred = defer(dependency)
+
+    assert get_signature(deferred) == get_signature(dependency)
+    assert deferred.__name__ == dependency.__name__
+
+
+def test_defer__resolved_to_started_task():
+    async def dependency(page: int = Query(1)) -> int:
+        return page
+
+    async def endpoint(task: asyncio.Future = Depends(defer(dependency))):
+        pass
+
+    task = solve(endpoint, b"page=3")["task"]
+
+    assert isinstance(task, asyncio.Future)
+    assert run(task) == 3
+
+
+def test_gather__siblings_run_concurrently():
+    events = []
+
+    def make_dependency(name: str):
+        async def dependency():
+            events.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} end")
+            return name
+
+        return dependency
+
+    picks = gather({name: Depends(defer(make_dependency(name))) for name in ("a", "b")})
+
+    async def endpoint(a: str = Depends(picks["a"]), b: str = Depends(picks["b"])):
+        pass
+
+    assert solve(endpoint) == {"a": "a", "b": "b"}
+    assert events[:2] == ["a start", "b start"]
+
+
+def test_gather__gathered_awaited_once():
+    calls = []
+
+    async def dependency():
+        calls.append(1)
+        return 1
+
+    picks = gather({"a": Depends(defer(dependency)), "b": Depends(defer(dependency))})
+
+    async def endpoint(a: int = Depends(picks["a"]), b: int = Depends(picks["b"])):
+        pass
+
+    assert solve(endpoint) == {"a": 1, "b": 1}
+    assert len(calls) == 2
+
+
+def test_gather__failed__siblings_cancelled():
+    events = []
+
+    async def failed():
+        raise ValueError
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    picks = gather({"failed": Depends(defer(failed)), "slow": Depends(defer(slow))})
+
+    async def endpoint(failed=Depends(picks["failed"]), slow=Depends(picks["slow"])):
+        pass
+
+    with pytest.raises(ValueError):
+        solve(endpoint)
+
+    run(asyncio.sleep(0))
+    assert events == ["cancelled"]
+
+
+def test_defer__task_not_awaited__exception_retrieved():
+    async def failed():
+        raise ValueError
+
+    async def endpoint(task: asyncio.Future = Depends(defer(failed))):
+        pass
+
+    task = solve(endpoint)["task"]
+    run(asyncio.sleep(0))
+
+    assert task.done()
+    assert task._log_traceback is False
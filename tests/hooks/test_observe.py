@@ -0,0 +1,41 @@
+import pytest
+from fastapi import Query
+
+from fastapi_depends_ext import DependsAttr
+from fastapi_depends_ext import DependsAttrBinder
+from fastapi_depends_ext.hooks import CallInfo
+from fastapi_depends_ext.hooks import add_call_hook
+from fastapi_depends_ext.hooks import observe
+from fastapi_depends_ext.hooks import remove_call_hook
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import solve
+
+
+@pytest.fixture()
+def calls():
+    _calls = list()
+
+    def hook(dependency, info: CallInfo):
+        return observe(dependency, info, lambda: None, lambda state, error, cache_hit: _calls.append(info.method))
+
+    add_call_hook(hook)
+    yield _calls
+    remove_call_hook(hook)
+
+
+@pytest.mark.parametrize("weak", [False, True])
+def test_observe__visible_method__method_of_instance(calls, weak):
+    class Items(DependsAttrBinder, weak=weak):
+        def page(self, page: int = Query(1)) -> int:
+            return page
+
+        def items(self, page: int = DependsAttr("page")) -> list:
+            return [page]
+
+    instance = Items()
+
+    assert instance.items.__self__ is instance
+    assert instance.items(3) == [3]
+    assert list(get_signature(instance.items).parameters) == ["page"]
+    assert solve(instance.items, query_string=b"page=2") == {"page": 2}
+    assert calls == ["items", "page"]
@@ -0,0 +1,44 @@
+import asyncio
+import threading
+
+from fastapi import Query
+
+from fastapi_depends_ext.inline import cheap
+from fastapi_depends_ext.inline import inline
+from fastapi_depends_ext.inline import is_cheap
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import run
+
+
+def test_cheap__marked():
+    @cheap
+    def dependency():
+        pass
+
+    def other():
+        pass
+
+    assert is_cheap(dependency)
+    assert not is_cheap(other)
+
+
+def test_inline__sync__run_on_event_loop():
+    def dependency(page: int = Query(1)):
+        return page, threading.current_thread()
+
+    inlined = inline(dependency)
+
+    assert asyncio.iscoroutinefunction(inlined)
+    assert get_signature(inlined) == get_signature(dependency)
+    assert run(inlined(page=2)) == (2, threading.current_thread())
+
+
+def test_inline__async_or_generator__not_changed():
+    async def coroutine():
+        pass
+
+    def generator():
+        yield
+
+    assert inline(coroutine) is coroutine
+    assert inline(generator) is generator
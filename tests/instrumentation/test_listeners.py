@@ -0,0 +1,91 @@
+from typing import Any
+
+import pytest
+
+from fastapi_depends_ext import DependsAttr
+from fastapi_depends_ext import DependsAttrBinder
+from fastapi_depends_ext import instrumentation
+from fastapi_depends_ext.instrumentation import BindCounters
+from fastapi_depends_ext.instrumentation import add_listener
+from fastapi_depends_ext.instrumentation import remove_listener
+from fastapi_depends_ext.utils import patch_defaults
+from tests.utils_for_tests import SimpleDependency
+
+
+class Binder(SimpleDependency, DependsAttrBinder):
+    def method_0(self, arg: Any = DependsAttr("method_1")):
+        pass
+
+    def method_1(self, arg: Any = DependsAttr("dependency")):
+        pass
+
+
+@pytest.fixture()
+def events():
+    _events = list()
+    listener = add_listener(_events.append)
+    yield _events
+    remove_listener(listener)
+
+
+def test_listeners__no_listeners__measure_not_created(mocker):
+    spy = mocker.spy(instrumentation.Measure, "__init__")
+
+    Binder()
+
+    assert not instrumentation.listeners
+    assert not spy.called
+
+
+def test_listeners__binder_init__events_with_depth(events):
+    Binder()
+
+    binder_events = [(event.method, event.depth, event.cache_hit) for event in events if event.kind == "binder.bind"]
+    assert binder_events == [
+        ("method_1", 2, False),
+        ("method_0", 1, False),
+        ("method_1", 1, True),
+    ]
+    assert all(event.cls is Binder for event in events if event.kind == "binder.bind")
+    assert all(event.duration >= 0 for event in events)
+
+
+def test_listeners__patch_defaults__events(events):
+    def function(a: int = 1):
+        pass
+
+    patch_defaults(function, a=2)
+    patch_defaults(function, a=3)
+
+    assert [(event.kind, event.cls, event.method, event.cache_hit) for event in events] == [
+        ("patch_defaults", None, "function", False),
+        ("patch_defaults", None, "function", True),
+    ]
+
+
+def test_listeners__depends_attr_bind__event(events):
+    depends = DependsAttr("dependency")
+    instance = SimpleDependency()
+
+    depends.bind(instance).bind(instance)
+
+    assert [(event.kind, event.cls, event.method, event.cache_hit) for event in events] == [
+        ("depends_attr.bind", SimpleDependency, "dependency", False),
+        ("depends_attr.bind", SimpleDependency, "dependency", True),
+    ]
+
+
+def test_bind_counters__events__aggregated():
+    counters = add_listener(BindCounters())
+    try:
+        Binder()
+        Binder()
+    finally:
+        remove_listener(counters)
+
+    stats = counters.get("binder.bind", Binder, "method_1")
+    assert (stats.calls, stats.hits, stats.misses) == (4, 2, 2)
+    assert stats.duration > 0
+
+    counters.reset()
+    assert counters.snapshot() == {}
@@ -0,0 +1,95 @@
+import pytest
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_depends_ext import ResultCache
+from fastapi_depends_ext.metrics import DependencyMetrics
+from tests.utils_for_tests import make_items
+from tests.utils_for_tests import observing
+from tests.utils_for_tests import solve
+
+
+@pytest.fixture()
+def metrics():
+    yield from observing(DependencyMetrics(buckets=(0.5, 0.1)))
+
+
+def test_metrics__counters(metrics):
+    instance = make_items(ResultCache())()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+    solve(endpoint)
+    with pytest.raises(ValueError):
+        solve(endpoint, query_string=b"page=-1")
+
+    info = metrics.info()
+    page = info[("make_items.<locals>.Items", "page")]
+    items = info[("make_items.<locals>.Items", "items")]
+
+    assert (page.calls, page.errors, page.cache_hits, page.cache_misses, page.in_flight) == (3, 0, 1, 2, 0)
+    assert (items.calls, items.errors, items.cache_hits, items.cache_misses, items.in_flight) == (3, 1, 0, 0, 0)
+    assert metrics.buckets == (0.1, 0.5)
+    assert page.buckets[-1] == 3
+    assert page.buckets[0] <= page.buckets[1] <= page.buckets[2]
+
+
+def test_metrics__render(metrics):
+    instance = make_items(ResultCache())()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+    lines = metrics.render().splitlines()
+    labels = 'class="make_items.<locals>.Items",method="page"'
+
+    assert "# TYPE fastapi_depends_calls_total counter" in lines
+    assert "# TYPE fastapi_depends_in_flight gauge" in lines
+    assert "# TYPE fastapi_depends_duration_seconds histogram" in lines
+    assert f"fastapi_depends_calls_total{{{labels}}} 1" in lines
+    assert f"fastapi_depends_cache_misses_total{{{labels}}} 1" in lines
+    assert f"fastapi_depends_in_flight{{{labels}}} 0" in lines
+    assert f'fastapi_depends_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f'fastapi_depends_duration_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f"fastapi_depends_duration_seconds_count{{{labels}}} 1" in lines
+
+
+def test_metrics__render__labels_escaped():
+    metrics = DependencyMetrics()
+    metrics._get_series(('a"b', "c\\d\n"))
+
+    assert 'fastapi_depends_calls_total{class="a\\"b",method="c\\\\d\\n"} 0' in metrics.render().splitlines()
+
+
+def test_metrics__asgi_app(metrics):
+    instance = make_items(ResultCache())()
+    app = FastAPI()
+    app.mount("/metrics", metrics)
+
+    @app.get("/")
+    def endpoint(values: list = Depends(instance.items)):
+        return values
+
+    client = TestClient(app)
+    client.get("/")
+    response = client.get("/metrics/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'fastapi_depends_calls_total{class="make_items.<locals>.Items",method="items"} 1' in response.text
+
+
+def test_metrics__reset(metrics):
+    instance = make_items(ResultCache())()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+    metrics.reset()
+
+    assert metrics.info() == {}
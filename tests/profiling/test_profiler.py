@@ -0,0 +1,120 @@
+import json
+import time
+
+import pytest
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_depends_ext import DependsExt
+from fastapi_depends_ext.hooks import call_hooks
+from fastapi_depends_ext.profiling import Profiler
+from fastapi_depends_ext.profiling import ProfilerMiddleware
+from tests.utils_for_tests import make_items
+from tests.utils_for_tests import observing
+from tests.utils_for_tests import solve
+
+
+@pytest.fixture()
+def profiler():
+    yield from observing(Profiler())
+
+
+def test_profiler__enable_disable():
+    profiler = Profiler()
+    profiler.enable()
+    profiler.enable()
+
+    assert call_hooks.count(profiler.wrap) == 1
+
+    profiler.disable()
+    assert profiler.wrap not in call_hooks
+
+
+def test_profiler__middleware__wall_and_self_time(profiler):
+    items = make_items(delay=0.01)()
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, profiler=profiler)
+
+    @app.get("/")
+    def endpoint(values: list = Depends(items.items)):
+        return values
+
+    client = TestClient(app)
+    for _ in range(3):
+        assert client.get("/").json() == [1]
+
+    stats = profiler.stats()
+    page = stats[("make_items.<locals>.Items", "page")]
+    items_stats = stats[("make_items.<locals>.Items", "items")]
+
+    assert (page.calls, page.samples) == (3, 3)
+    assert (items_stats.calls, items_stats.samples) == (3, 3)
+    assert 0.01 <= page.self_p50 <= page.wall_p50
+    assert 0.02 <= items_stats.self_p50
+    assert items_stats.wall_p50 >= items_stats.self_p50 + page.self_p50
+    assert items_stats.wall_p50 <= items_stats.wall_p90 <= items_stats.wall_p99 <= items_stats.wall_max
+
+
+def test_profiler__without_middleware__sample_per_call(profiler):
+    instance = make_items()()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+    stats = profiler.stats()
+
+    assert stats[("make_items.<locals>.Items", "items")].samples == 1
+    assert stats[("make_items.<locals>.Items", "page")].samples == 1
+
+
+def test_profiler__nested_call__excluded_from_self_time(profiler):
+    def inner():
+        time.sleep(0.02)
+
+    inner_depends = DependsExt(inner)
+
+    def outer():
+        inner_depends.dependency()
+
+    outer_depends = DependsExt(outer)
+
+    async def endpoint(value=outer_depends):
+        pass
+
+    solve(endpoint)
+    stats = profiler.stats()
+
+    outer, inner = stats[("", "outer")], stats[("", "inner")]
+    assert 0.02 <= inner.self_p50 <= outer.wall_p50
+    assert outer.self_p50 <= outer.wall_p50 - inner.self_p50
+
+
+def test_profiler__dump(profiler):
+    instance = make_items(delay=0.001)()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+
+    data = json.loads(profiler.dump_json())
+    text = profiler.dump_text()
+
+    assert {(item["class"], item["method"]) for item in data} == {
+        ("make_items.<locals>.Items", "page"),
+        ("make_items.<locals>.Items", "items"),
+    }
+    assert text.splitlines()[0].split()[:3] == ["dependency", "calls", "samples"]
+    assert text.splitlines()[1].startswith("make_items.<locals>.Items.items")
+
+    profiler.reset()
+    assert profiler.stats() == {}
+
+
+def test_profiler__not_enabled__dependencies_not_wrapped():
+    instance = make_items()()
+
+    assert instance.items.__func__.__name__ == "items"
+    assert not hasattr(instance.items, "__call_info__")
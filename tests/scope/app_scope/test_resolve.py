@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from fastapi import Depends
+from fastapi import Query
+
+from fastapi_depends_ext.scope import AppScope
+from fastapi_depends_ext.utils import get_signature
+from tests.utils_for_tests import run
+from tests.utils_for_tests import solve
+
+
+def test_wrap__without_parameters():
+    def dependency(value: int = 1) -> int:
+        return value
+
+    assert not get_signature(AppScope().wrap(dependency)).parameters
+
+
+def test_resolve__resolved_once():
+    calls = []
+
+    async def dependency():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    scope = AppScope()
+    singleton = scope.wrap(dependency)
+
+    async def endpoint(value=Depends(singleton)):
+        pass
+
+    results = run(asyncio.gather(scope.resolve(dependency), scope.resolve(dependency)))
+
+    assert results[0] is results[1]
+    assert solve(endpoint)["value"] is results[0]
+    assert calls == [1]
+
+
+def test_resolve__sub_dependencies_resolved():
+    def config() -> str:
+        return "config"
+
+    def dependency(config: str = Depends(config)) -> str:
+        return f"client {config}"
+
+    assert run(AppScope().resolve(dependency)) == "client config"
+
+
+def test_resolve__request_parameter__error():
+    def dependency(page: int = Query()):
+        pass
+
+    with pytest.raises(RuntimeError, match="can't depend on request"):
+        run(AppScope().resolve(dependency))
+
+
+def test_resolve__exception__resolved_again():
+    calls = []
+
+    def dependency():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ValueError
+        return 1
+
+    scope = AppScope()
+    with pytest.raises(ValueError):
+        run(scope.resolve(dependency))
+
+    assert run(scope.resolve(dependency)) == 1
@@ -0,0 +1,57 @@
+from fastapi import FastAPI
+
+from fastapi_depends_ext.scope import AppScope
+from tests.utils_for_tests import run
+
+
+def test_startup__registered_dependencies_resolved():
+    calls = []
+
+    def dependency():
+        calls.append(1)
+
+    scope = AppScope()
+    scope.wrap(dependency)
+    run(scope.startup())
+    run(scope.resolve(dependency))
+
+    assert calls == [1]
+
+
+def test_shutdown__teardown_and_reset():
+    events = []
+
+    async def dependency():
+        events.append("setup")
+        yield len(events)
+        events.append("teardown")
+
+    scope = AppScope()
+    assert run(scope.resolve(dependency)) == 1
+
+    run(scope.shutdown())
+    assert events == ["setup", "teardown"]
+
+    assert run(scope.resolve(dependency)) == 3
+
+
+def test_setup__event_handlers_added():
+    scope = AppScope()
+    app = FastAPI()
+    scope.setup(app)
+
+    assert scope.startup in app.router.on_startup
+    assert scope.shutdown in app.router.on_shutdown
+
+
+def test_discard__not_resolved_on_startup():
+    calls = []
+
+    def dependency():
+        calls.append(1)
+
+    scope = AppScope()
+    scope.discard(scope.wrap(dependency))
+    run(scope.startup())
+
+    assert calls == []
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_depends_ext import DependsAttr
+from fastapi_depends_ext import DependsAttrBinder
+from fastapi_depends_ext import ResultCache
+from fastapi_depends_ext.tracing import InMemoryExporter
+from fastapi_depends_ext.tracing import JsonLinesExporter
+from fastapi_depends_ext.tracing import SpanExporter
+from fastapi_depends_ext.tracing import Tracer
+from fastapi_depends_ext.tracing import TracingMiddleware
+from tests.utils_for_tests import make_items
+from tests.utils_for_tests import observing
+from tests.utils_for_tests import solve
+
+
+@pytest.fixture()
+def tracer():
+    yield from observing(Tracer(InMemoryExporter()))
+
+
+def make_square_items() -> type:
+    class SquareItems(make_items(ResultCache())):
+        async def items(self, items: list = DependsAttr("items", from_super=True)) -> list:
+            return [item**2 for item in items]
+
+    return SquareItems
+
+
+def test_tracer__middleware__spans_nested_by_graph(tracer):
+    instance = make_square_items()()
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
+    @app.get("/items")
+    def endpoint(values: list = Depends(instance.items)):
+        return values
+
+    assert TestClient(app).get("/items").json() == [1]
+
+    spans = {span.name: span for span in tracer.exporter.spans}
+    root = spans["GET /items"]
+    square_items = spans["make_square_items.<locals>.SquareItems.items"]
+    items = spans["make_items.<locals>.Items.items"]
+    page = spans["make_items.<locals>.Items.page"]
+
+    assert len(spans) == 4
+    assert {span.trace_id for span in spans.values()} == {root.trace_id}
+    assert root.parent_id is None
+    assert square_items.parent_id == root.span_id
+    assert items.parent_id == square_items.span_id
+    assert page.parent_id == items.span_id
+    assert root.start <= square_items.start <= items.start <= page.start
+    assert page.end <= items.end <= square_items.end <= root.end
+
+
+def test_tracer__attributes(tracer):
+    instance = make_square_items()()
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
+    @app.get("/")
+    def endpoint(values: list = Depends(instance.items)):
+        return values
+
+    client = TestClient(app)
+    client.get("/")
+    client.get("/")
+
+    spans = [span for span in tracer.exporter.spans if span.attributes.get("method") == "page"]
+    items = next(span for span in tracer.exporter.spans if span.name.endswith("Items.items"))
+
+    assert [span.attributes["cache"] for span in spans] == ["miss", "hit"]
+    assert spans[0].attributes["class"] == "make_items.<locals>.Items"
+    assert spans[0].attributes["from_super"] is False
+    assert items.attributes["from_super"] is True
+    assert items.attributes["cache"] == "none"
+
+
+def test_tracer__error(tracer):
+    class Failing(DependsAttrBinder):
+        def fail(self):
+            raise ValueError()
+
+        def method(self, value=DependsAttr("fail")):
+            pass
+
+    instance = Failing()
+
+    async def endpoint(value=Depends(instance.method)):
+        pass
+
+    with pytest.raises(ValueError):
+        solve(endpoint)
+
+    assert [(span.attributes["method"], span.error) for span in tracer.exporter.spans] == [("fail", "ValueError")]
+
+
+def test_tracer__without_middleware__exported_on_end(tracer):
+    instance = make_square_items()()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+
+    assert [span.attributes["method"] for span in tracer.exporter.spans] == ["page", "items", "items"]
+    assert all(span.parent_id is None for span in tracer.exporter.spans)
+
+
+def test_json_lines_exporter(tmp_path, tracer):
+    path = tmp_path / "spans.jsonl"
+    tracer.exporter = JsonLinesExporter(str(path))
+    instance = make_square_items()()
+
+    async def endpoint(values: list = Depends(instance.items)):
+        pass
+
+    solve(endpoint)
+    solve(endpoint)
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert len(spans) == 6
+    assert spans[0]["name"] == "make_items.<locals>.Items.page"
+    assert set(spans[0]) == {"trace_id", "span_id", "parent_id", "name", "attributes", "start", "end", "error"}
+
+
+def test_span_exporter__export_not_implemented__error():
+    class Exporter(SpanExporter):
+        pass
+
+    with pytest.raises(TypeError, match="abstract method"):
+        Exporter()
@@ -0,0 +1,114 @@
+import gc
+
+import pytest
+from fastapi import Depends
+from fastapi.dependencies.utils import get_typed_signature
+
+from fastapi_depends_ext import utils
+from fastapi_depends_ext.utils import SignatureCache
+from fastapi_depends_ext.utils import get_signature
+from fastapi_depends_ext.utils import patch_defaults
+from fastapi_depends_ext.utils import signature_cache_clear
+from fastapi_depends_ext.utils import signature_cache_info
+from tests.utils_for_tests import SimpleDependency
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    signature_cache_clear()
+    yield
+    signature_cache_clear()
+
+
+def test_get_signature__function__same_as_fastapi():
+    def function(a: int, b: "int" = 1, *, c=Depends()):
+        pass
+
+    assert get_signature(function) == get_typed_signature(function)
+
+
+def test_get_signature__called_twice__resolved_once(mocker):
+    def function(a: int):
+        pass
+
+    spy = mocker.spy(utils, "get_typed_signature")
+
+    assert get_signature(function) is get_signature(function)
+    assert spy.call_count == 1
+    assert signature_cache_info()[:2] == (1, 1)
+
+
+def test_get_signature__bound_methods__shared_by_instances(mocker):
+    spy = mocker.spy(utils, "get_typed_signature")
+
+    signature = get_signature(SimpleDependency().dependency)
+
+    assert list(signature.parameters) == []
+    assert get_signature(SimpleDependency().dependency) is signature
+    assert list(get_signature(SimpleDependency.dependency).parameters) == ["self"]
+    assert spy.call_count == 2
+
+
+def test_get_signature__defaults_changed__resolved_again():
+    def function(a: int = 1):
+        pass
+
+    assert get_signature(function).parameters["a"].default == 1
+
+    function.__defaults__ = (2,)
+
+    assert get_signature(function).parameters["a"].default == 2
+
+
+def test_get_signature__patched_function__own_entry():
+    def function(a: int = 1):
+        pass
+
+    patched = patch_defaults(function, a=2)
+
+    assert get_signature(function).parameters["a"].default == 1
+    assert get_signature(patched).parameters["a"].default == 2
+
+
+def test_get_signature__function_deleted__entry_removed():
+    def function(a: int):
+        pass
+
+    get_signature(function)
+    assert signature_cache_info().currsize == 1
+
+    del function
+    gc.collect()
+    get_signature(SimpleDependency.dependency)
+
+    assert signature_cache_info().currsize == 1
+
+
+def test_get_signature__not_weakrefable__not_cached():
+    class Dependency:
+        __slots__ = ()
+
+        def __call__(self, a: int):
+            pass
+
+    signature = get_signature(Dependency())
+
+    assert list(signature.parameters) == ["a"]
+    assert signature_cache_info() == (0, 1, utils.signature_cache.maxsize, 0)
+
+
+def test_signature_cache__maxsize__least_recently_used_evicted():
+    cache = SignatureCache(maxsize=2)
+    functions = [lambda: 1, lambda: 2, lambda: 3]
+
+    cache.get(functions[0])
+    cache.get(functions[1])
+    cache.get(functions[0])
+    cache.get(functions[2])
+    cache.get(functions[0])
+
+    assert cache.info() == (2, 3, 2, 2)
+
+    cache.get(functions[1])
+
+    assert cache.info() == (2, 4, 2, 2)
@@ -0,0 +1,115 @@
+from fastapi_depends_ext import utils
+from fastapi_depends_ext.utils import MroIndex
+from tests.utils_for_tests import SimpleDependency
+
+
+class BaseClass(SimpleDependency):
+    def method(self):
+        pass
+
+
+class MixinClass(BaseClass):
+    def method(self):
+        pass
+
+
+class TestClass(MixinClass, BaseClass):
+    def method(self):
+        pass
+
+
+def test_get_base_class__second_call__no_mro_scan(mocker):
+    index = MroIndex()
+    instance = TestClass()
+    spy = mocker.spy(utils, "_find_base_class")
+
+    assert index.get_base_class(instance, "method", super(TestClass, instance).method) is MixinClass
+    assert index.get_base_class(instance, "method", super(TestClass, instance).method) is MixinClass
+    assert index.get_base_class(TestClass(), "method", super(TestClass, instance).method) is MixinClass
+    assert spy.call_count == 1
+
+
+def test_get_base_class__class_modified__resolved_again():
+    class Modified(SimpleDependency):
+        def dependency(self):
+            pass
+
+    index = MroIndex()
+    instance = Modified()
+    dependency = instance.dependency
+
+    assert index.get_base_class(instance, "dependency", dependency) is Modified
+
+    del Modified.dependency
+
+    assert index.get_base_class(instance, "dependency", dependency) is None
+
+
+def test_get_base_class__property__not_indexed(mocker):
+    class WithProperty:
+        @property
+        def method(self):
+            return SimpleDependency.dependency
+
+    index = MroIndex()
+    instance = WithProperty()
+    spy = mocker.spy(utils, "_find_base_class")
+
+    assert index.get_base_class(instance, "method", instance.method) is WithProperty
+    assert index.get_base_class(instance, "method", instance.method) is WithProperty
+    assert spy.call_count == 2
+
+
+def test_get_super_for_method__second_call__no_mro_scan(mocker):
+    index = MroIndex()
+    spy = mocker.spy(utils, "_find_super_for_method")
+
+    assert index.get_super_for_method(TestClass, "method") is MixinClass
+    assert index.get_super_for_method(TestClass, "method") is MixinClass
+    assert index.get_super_for_method(TestClass, "method", super_from=MixinClass) is BaseClass
+    assert index.get_super_for_method(TestClass, "method", super_from=MixinClass) is BaseClass
+    assert spy.call_count == 2
+
+
+def test_get_super_for_method__class_modified__resolved_again():
+    class Base:
+        def method(self):
+            pass
+
+    class Mixin(Base):
+        def method(self):
+            pass
+
+    class Child(Mixin, Base):
+        def method(self):
+            pass
+
+    index = MroIndex()
+
+    assert index.get_super_for_method(Child, "method") is Mixin
+
+    del Mixin.method
+
+    assert index.get_super_for_method(Child, "method") is Base
+
+
+def test_get_super_for_method__method_added_between__resolved_again():
+    class A:
+        def method(self):
+            pass
+
+    class B(A):
+        pass
+
+    class C(B):
+        def method(self):
+            pass
+
+    index = MroIndex()
+
+    assert index.get_super_for_method(C, "method") is A
+
+    B.method = lambda self: None
+
+    assert index.get_super_for_method(C, "method") is B
+    assert index.get_super_for_method(C, "method") is utils._find_super_for_method(C, "method", C)
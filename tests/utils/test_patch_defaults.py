@@ -1,9 +1,11 @@
+import functools
 import inspect
 import re
 
 import pytest
 from fastapi.dependencies.utils import get_typed_signature
 
+from fastapi_depends_ext import utils
 from fastapi_depends_ext.utils import patch_defaults
 
 
@@ -318,3 +320,80 @@ def test_patch_defaults__change_kwonly_after_args__patched():
 
     signature = get_typed_signature(func)
     assert signature.parameters["kwonly"].default is expected_value
+
+
+def test_patch_defaults__change_kwonly_function_has_locals__patched():
+    def test_function(a: int, *, kwonly: int, **kwargs):
+        local_0 = local_1 = kwonly
+        return local_0, local_1
+
+    expected_value = object()
+    func = patch_defaults(test_function, kwonly=expected_value)
+
+    assert func.__kwdefaults__ == {"kwonly": expected_value}
+    assert func(1) == (expected_value, expected_value)
+
+
+def test_patch_defaults__change_to_falsy_value__patched():
+    def test_function(a: int = 1, b: int = 1):
+        pass
+
+    func = patch_defaults(test_function, a=0, b=None)
+
+    assert func.__defaults__ == (0, None)
+
+
+def test_patch_defaults__wrapped_function__wrapped_not_copied():
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(a: int = 1):
+            return func(a)
+
+        return wrapper
+
+    @decorator
+    def func(a: int = 1):
+        pass
+
+    patched = patch_defaults(func, a=2)
+
+    assert not hasattr(patched, "__wrapped__")
+    assert get_typed_signature(patched).parameters["a"].default == 2
+
+
+def test_patch_defaults__bound_method_self__error():
+    class TestClass:
+        def test_function(self, a: int = 1):
+            pass
+
+    message = "Trying to provide for method `test_function` not existing keyword argument `self`"
+    with pytest.raises(KeyError, match=re.escape(message)):
+        patch_defaults(TestClass().test_function, self=1)
+
+
+def test_patch_defaults__patched_repeatedly__layout_computed_once(mocker):
+    def test_function(a: int, b: int = 1, *args, c: int = 2, **kwargs):
+        pass
+
+    spy_layout = mocker.spy(utils.FunctionLayout, "__init__")
+    spy_signature = mocker.spy(utils, "get_typed_signature")
+
+    func = patch_defaults(test_function, a=1)
+    func = patch_defaults(func, b=2)
+    func = patch_defaults(func, c=3)
+    patch_defaults(test_function, c=4)
+
+    assert spy_layout.call_count == 1
+    assert not spy_signature.called
+    assert func.__defaults__ == (1, 2)
+    assert func.__kwdefaults__ == {"c": 3}
+
+
+def test_patch_defaults__patch_patched__origin_is_original_function():
+    def test_function(a: int = 1, b: int = 1):
+        pass
+
+    func = patch_defaults(patch_defaults(test_function, a=2), b=3)
+
+    assert func.__origin__ is test_function
+    assert func.__defaults__ == (2, 3)
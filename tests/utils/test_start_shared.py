@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from fastapi_depends_ext.utils import await_shared
+from fastapi_depends_ext.utils import start_shared
+from tests.utils_for_tests import run
+
+
+async def value(result):
+    await asyncio.sleep(0.01)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def test_start_shared__started_once_while_running():
+    futures = {}
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return value(1)
+
+    async def main():
+        return await asyncio.gather(*(await_shared(start_shared(futures, "key", factory)) for _ in range(3)))
+
+    assert run(main()) == [1, 1, 1]
+    assert calls == [1]
+    assert futures == {}
+
+
+def test_start_shared__keep_result__kept():
+    futures = {}
+    future = start_shared(futures, "key", lambda: value(1), keep_result=True)
+    run(await_shared(future))
+
+    assert futures == {"key": future}
+    assert start_shared(futures, "key", lambda: value(2), keep_result=True) is future
+
+
+def test_start_shared__keep_result_failed__forgotten():
+    futures = {}
+
+    with pytest.raises(ValueError):
+        run(await_shared(start_shared(futures, "key", lambda: value(ValueError()), keep_result=True)))
+
+    assert futures == {}
+
+
+def test_await_shared__cancelled__shared_future_not_cancelled():
+    futures = {}
+
+    async def main():
+        first = asyncio.ensure_future(await_shared(start_shared(futures, "key", lambda: value(1))))
+        second = asyncio.ensure_future(await_shared(start_shared(futures, "key", lambda: value(1))))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert run(main()) == 1
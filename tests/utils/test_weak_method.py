@@ -0,0 +1,112 @@
+import asyncio
+import gc
+import weakref
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+
+import pytest
+
+from fastapi_depends_ext.utils import get_signature
+from fastapi_depends_ext.utils import weak_method
+from tests.utils_for_tests import run
+
+
+class Resource:
+    def __init__(self):
+        self.events = []
+
+    def method(self, value: int = 1) -> int:
+        return value
+
+    async def coroutine(self, value: int = 1) -> int:
+        return value
+
+    def generator(self, value: int = 1):
+        try:
+            yield value
+        except ValueError:
+            self.events.append("error")
+            raise
+        finally:
+            self.events.append("closed")
+
+    async def async_generator(self, value: int = 1):
+        try:
+            yield value
+        except ValueError:
+            self.events.append("error")
+            raise
+        finally:
+            self.events.append("closed")
+
+
+def test_weak_method__instance_not_referenced():
+    gc.disable()
+    try:
+        instance = Resource()
+        weak = weak_method(instance.method)
+        ref = weakref.ref(instance)
+        del instance
+        assert ref() is None
+    finally:
+        gc.enable()
+
+    with pytest.raises(ReferenceError, match="Resource.method"):
+        weak()
+
+
+def test_weak_method__signature():
+    instance = Resource()
+    weak = weak_method(instance.method)
+
+    assert get_signature(weak) == get_signature(instance.method)
+    assert weak.__name__ == "method"
+    assert weak.__func__ is Resource.method
+    assert weak(value=2) == 2
+
+
+def test_weak_method__coroutine():
+    instance = Resource()
+    weak = weak_method(instance.coroutine)
+
+    assert asyncio.iscoroutinefunction(weak)
+    assert run(weak(value=3)) == 3
+
+
+def test_weak_method__generator__exception_thrown_into_method():
+    instance = Resource()
+    weak = contextmanager(weak_method(instance.generator))
+
+    with pytest.raises(ValueError):
+        with weak(value=4) as value:
+            assert value == 4
+            raise ValueError()
+
+    assert instance.events == ["error", "closed"]
+
+
+def test_weak_method__async_generator__exception_thrown_into_method():
+    instance = Resource()
+    weak = asynccontextmanager(weak_method(instance.async_generator))
+
+    async def use():
+        async with weak(value=5) as value:
+            assert value == 5
+            raise ValueError()
+
+    with pytest.raises(ValueError):
+        run(use())
+
+    assert instance.events == ["error", "closed"]
+
+
+def test_weak_method__async_generator__closed():
+    instance = Resource()
+    weak = asynccontextmanager(weak_method(instance.async_generator))
+
+    async def use():
+        async with weak() as value:
+            return value
+
+    assert run(use()) == 1
+    assert instance.events == ["closed"]
@@ -1,3 +1,68 @@
+import asyncio
+import time
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+
+from fastapi import FastAPI
+from fastapi.dependencies.utils import get_dependant
+from starlette.requests import Request
+
+from fastapi_depends_ext import DependsAttr
+from fastapi_depends_ext import DependsAttrBinder
+from fastapi_depends_ext import ResultCache
+from fastapi_depends_ext.hooks import CallObserver
+from fastapi_depends_ext.utils import solve_request
+
+
 class SimpleDependency:
     def dependency(self) -> int:
         return 2
+
+
+def make_items(cache: ResultCache = None, delay: float = 0.0) -> type:
+    # new class for every test, so observed calls of different tests are not mixed
+    class Items(DependsAttrBinder):
+        async def page(self, page: int = 1) -> int:
+            time.sleep(delay)
+            return page
+
+        async def items(self, page: int = DependsAttr("page", cache=cache)) -> list:
+            time.sleep(delay * 2)
+            if page < 0:
+                raise ValueError()
+            return [page]
+
+    return Items
+
+
+def observing(observer: CallObserver) -> Iterator[CallObserver]:
+    # body of fixture enabling observer while test is run
+    observer.enable()
+    try:
+        yield observer
+    finally:
+        observer.disable()
+
+
+async def resolve(call: Callable, query_string: bytes = b"", app: FastAPI = None) -> Dict[str, Any]:
+    # resolve arguments of `call` like fastapi does it for request without running application
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": query_string, "app": app}
+    dependant = get_dependant(path="/", call=call)
+    values, errors = await solve_request(Request(scope), dependant, dependency_overrides_provider=app)
+    assert not errors, errors
+    return values
+
+
+def run(coroutine: Awaitable) -> Any:
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def solve(call: Callable, query_string: bytes = b"", app: FastAPI = None) -> Dict[str, Any]:
+    try:
+        return run(resolve(call, query_string, app))
+    finally:
+        # let anyio stop worker threads of threadpool, otherwise interpreter waits for them on exit
+        run(asyncio.sleep(0))